@@ -8,12 +8,31 @@ by revealing hidden network connections that traditional methods miss.
 
 import streamlit as st
 from streamlit_agraph import agraph, Node, Edge, Config
-from neo4j import GraphDatabase
+from neo4j import GraphDatabase, Query, RoutingControl
+from neo4j.exceptions import ServiceUnavailable
+from neo4j.graph import Node as Neo4jNode, Relationship as Neo4jRelationship
+import networkx as nx
+import pandas as pd
+import base64
+import functools
+import math
+import os
+import pickle
+import queue
+import sys
+import textwrap
 import time
+from array import array
+from collections import Counter, defaultdict
 from datetime import datetime
+from threading import Event, Thread
 
-# Import data generator
-from scenario_data_generator import ScenarioDataGenerator
+# The data generator itself is imported on first use (see start_generation)
+from graph_schema import (
+    CLEAR_DATABASE_STATEMENT, CLEAR_DATABASE_TIMEOUT, INDEX_STATEMENTS, migrate_legacy_indexes
+)
+from scenarios import SCENARIOS, hop_at, is_bounded
+from webgl_graph import WEBGL_NODE_THRESHOLD, render_webgl_graph
 
 # =============================================================================
 # PAGE CONFIGURATION
@@ -26,22 +45,16 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for professional styling
-st.markdown("""
-<style>
-    /* Improve metric cards */
-    [data-testid="stMetricValue"] {
-        font-size: 1.8rem;
-        font-weight: 600;
-    }
-    
-    /* Better expander styling */
-    .streamlit-expanderHeader {
-        font-size: 1rem;
-        font-weight: 600;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS for professional styling, kept in static/app.css and injected
+# inline: Streamlit's older static file server sends .css as text/plain with
+# nosniff, which browsers refuse as a stylesheet
+@st.cache_resource
+def get_stylesheet():
+    """Read the stylesheet once per process and wrap it in a style tag."""
+    with open(os.path.join(os.path.dirname(__file__), "static", "app.css"), encoding="utf-8") as f:
+        return f"<style>{f.read()}</style>"
+
+st.html(get_stylesheet())
 
 # =============================================================================
 # PERFORMANCE TIMER
@@ -58,11 +71,11 @@ class PerformanceTimer:
         self.exposure = 0.0
     
     def start(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
     
     def stop(self):
-        if self.start_time:
-            self.duration_ms = round((time.time() - self.start_time) * 1000, 2)
+        if self.start_time is not None:
+            self.duration_ms = (time.perf_counter_ns() - self.start_time) / 1_000_000
         return self.duration_ms
     
     def set_counts(self, entities, relationships, exposure=0.0):
@@ -74,6 +87,27 @@ class PerformanceTimer:
 # NEO4J CONNECTION
 # =============================================================================
 
+@st.cache_resource
+def ensure_indexes(_driver):
+    """
+    Create the lookup indexes scenario queries anchor on, if missing.
+    
+    Runs once per process (from the cached driver factory) so anchors resolve
+    by index seek even when the data was loaded by something other than the
+    generator. Only creates what is missing, never drops. Returns
+    (statement, error) pairs for the statements that failed (e.g. a read-only
+    user, or a legacy index still in place); the Admin page shows them.
+    """
+    database = st.secrets["neo4j"].get("database", "neo4j")
+    failures = []
+    for statement in INDEX_STATEMENTS:
+        try:
+            _driver.execute_query(statement, routing_=RoutingControl.WRITE, database_=database)
+        except Exception as e:
+            failures.append((statement, e))
+    return failures
+
+
 @st.cache_resource
 def get_neo4j_driver():
     """Establish cached connection to Neo4j database."""
@@ -82,8 +116,20 @@ def get_neo4j_driver():
         user = st.secrets["neo4j"]["user"]
         password = st.secrets["neo4j"]["password"]
         
-        driver = GraphDatabase.driver(uri, auth=(user, password))
+        # One driver serves every Streamlit session; size the pool for
+        # concurrent viewers rather than the driver's single-client defaults
+        driver = GraphDatabase.driver(
+            uri,
+            auth=(user, password),
+            max_connection_pool_size=int(os.environ.get("NEO4J_MAX_CONNECTION_POOL_SIZE", 100)),
+            connection_acquisition_timeout=30,
+            max_connection_lifetime=3600,
+            # Records are pulled in batches of this size as a result is
+            # consumed, so streamed results never sit fully in the buffer
+            fetch_size=1000
+        )
         driver.verify_connectivity()
+        ensure_indexes(driver)
         return driver
     
     except KeyError:
@@ -101,9 +147,31 @@ password = "your-password"
         st.caption(f"Error details: {e}")
         return None
 
+# Offline snapshot of the walkthrough graphs, saved from the Admin panel
+SNAPSHOT_PATH = os.path.join(os.path.dirname(__file__), "scenario_snapshot.pkl")
+
+
+@st.cache_resource
+def load_snapshot():
+    """Load the offline scenario snapshot, or an empty dict if none was saved."""
+    try:
+        with open(SNAPSHOT_PATH, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError):
+        return {}
+
+
 driver = get_neo4j_driver()
-if driver is None:
-    st.stop()
+
+# Without a database the walkthrough can still run from the offline snapshot
+OFFLINE = driver is None
+if OFFLINE:
+    if not load_snapshot():
+        st.stop()
+    st.warning("**Offline mode**: Neo4j is unreachable, showing the saved scenario snapshot.")
+
+# Explicit database name avoids a home-database lookup on every query
+NEO4J_DATABASE = st.secrets.get("neo4j", {}).get("database", "neo4j")
 
 # =============================================================================
 # VISUAL DESIGN SYSTEM
@@ -154,484 +222,48 @@ RELATIONSHIP_LABELS = {
     "FORMER_EMPLOYEE_OF": "formerly at",
 }
 
-# =============================================================================
-# SCENARIO DEFINITIONS
-# =============================================================================
+# Target spacing between neighbouring nodes in server-side layouts
+LAYOUT_SPACING = 60
 
-SCENARIOS = {
-    1: {
-        "title": "Captive Medical Mill",
-        "subtitle": "Uncovering a Captive Medical Mill Operation",
-        "icon": "⚖️",
-        "starting_entity": ("Attorney", "ATT_S1_WEBB", "J. Marcus Webb"),
-        "trigger": """
-**Initial Flag:**
-
-An adjuster notes an unusual detail: *"Claimant secured legal representation within 2 hours of the reported accident."*
-
-While not unprecedented, this rapid attorney engagement warrants a closer look at the broader pattern.
-
-**Investigation Question:** Is this attorney operating a solicitation network, or simply employing aggressive marketing?
-        """,
-        "hops": [
-            {
-                "depth": 0,
-                "title": "Starting Point: Attorney Profile",
-                "narrative": "Beginning investigation with **Attorney J. Marcus Webb**, flagged for unusually rapid client acquisition patterns.",
-                "traditional": "Requesting attorney claim history from IT systems typically requires 2-3 business days.",
-                "discovery": None,
-                "query": """
-                    MATCH (a:Attorney {id: 'ATT_S1_WEBB'})
-                    RETURN a
-                """
-            },
-            {
-                "depth": 1,
-                "title": "Client Portfolio Analysis",
-                "narrative": "Expanding to examine all claimants represented by this attorney...",
-                "traditional": "Manual file review: approximately 2-3 hours per claimant. For a large portfolio, this represents **140+ hours of investigation time**.",
-                "discovery": "**47 claimants retained within 6 months** — representing 8x the typical attorney volume in this market.",
-                "query": """
-                    MATCH (a:Attorney {id: 'ATT_S1_WEBB'})
-                    OPTIONAL MATCH (a)<-[:REPRESENTED_BY]-(c:Claim)-[:FILED_BY]->(p:Person)
-                    RETURN a, c, p
-                """
-            },
-            {
-                "depth": 2,
-                "title": "Medical Provider Concentration",
-                "narrative": "Analyzing treatment facility distribution across the client base...",
-                "traditional": "Cross-referencing treatment records across 47 separate claim files would require an additional **20+ hours** of manual work.",
-                "discovery": "**41 of 47 claimants (87%)** received treatment at only **two facilities**: Wellness Partners Medical and Peak Recovery Clinic.",
-                "query": """
-                    MATCH (a:Attorney {id: 'ATT_S1_WEBB'})
-                    OPTIONAL MATCH (a)<-[:REPRESENTED_BY]-(c:Claim)
-                    OPTIONAL MATCH (c)-[:FILED_BY]->(claimant:Person)
-                    OPTIONAL MATCH (c)-[:TREATED_AT]->(prov:Provider)
-                    RETURN a, c, claimant, prov
-                """
-            },
-            {
-                "depth": 3,
-                "title": "Business Location Analysis",
-                "narrative": "Examining the physical business addresses of these concentrated providers...",
-                "traditional": "Secretary of State corporate lookups for each facility — and would an investigator even think to check this?",
-                "discovery": "**Both clinics operate from the same address**: 1847 Commerce Boulevard, Suite 200.",
-                "query": """
-                    MATCH (a:Attorney {id: 'ATT_S1_WEBB'})
-                    OPTIONAL MATCH (a)<-[:REPRESENTED_BY]-(c:Claim)
-                    OPTIONAL MATCH (c)-[:TREATED_AT]->(prov:Provider)
-                    OPTIONAL MATCH (prov)-[:LOCATED_AT]->(addr:Address)
-                    RETURN a, c, prov, addr
-                """
-            },
-            {
-                "depth": 4,
-                "title": "Employee Network Mapping",
-                "narrative": "Cross-referencing personnel records from **state licensing databases** and **corporate filings** with residential address data...",
-                "traditional": "Employee data exists in external public records (licensing boards, corporate filings). Cross-referencing these with residential addresses requires accessing **multiple disconnected systems** — a step rarely taken without prior suspicion.",
-                "discovery": "The billing manager at Wellness Partners **shares a residential address** with the patient coordinator at Peak Recovery — indicating a personal relationship between key staff at both clinics.",
-                "query": """
-                    MATCH (prov:Provider)-[:LOCATED_AT]->(bizAddr:Address {id: 'ADDR_S1_BIZ'})
-                    OPTIONAL MATCH (prov)-[:EMPLOYS]->(emp:Person)
-                    OPTIONAL MATCH (emp)-[:LIVES_AT]->(homeAddr:Address)
-                    RETURN prov, bizAddr, emp, homeAddr
-                """
-            },
-            {
-                "depth": 5,
-                "title": "Cross-Role Identity Detection",
-                "narrative": "Checking whether any employees appear in other capacities within these claims...",
-                "traditional": "Systematically checking if clinic staff appear as witnesses? **Virtually impossible without graph technology.**",
-                "discovery": "**Maria Santos** (Peak Recovery employee) is listed as **witness on 8 claims** treated at Wellness Partners — a clear cross-role fraud indicator.",
-                "query": """
-                    MATCH (maria:Person {id: 'P_S1_MARIA'})
-                    OPTIONAL MATCH (maria)<-[:WITNESSED_BY]-(c:Claim)
-                    OPTIONAL MATCH (prov:Provider)-[:EMPLOYS]->(maria)
-                    OPTIONAL MATCH (c)-[:TREATED_AT]->(treatProv:Provider)
-                    RETURN maria, c, prov, treatProv
-                """
-            },
-            {
-                "depth": 6,
-                "title": "Ownership Structure Revealed",
-                "narrative": "Cross-referencing **Secretary of State corporate filings** (registered agent records) with **public marriage records** and attorney bar registration...",
-                "traditional": "Corporate registry data is public but rarely cross-referenced with claims. Connecting a provider's registered agent to an attorney's spouse requires querying **three separate public record systems** — a path no investigator would pursue without graph-enabled discovery.",
-                "discovery": "**Linda Webb** (the attorney's spouse per marriage records) serves as **registered agent for both clinics** per corporate filings. This confirms a fully captive medical mill operation with hidden family ownership.",
-                "query": """
-                    MATCH (a:Attorney {id: 'ATT_S1_WEBB'})
-                    OPTIONAL MATCH (a)-[:MARRIED_TO]->(spouse:Person)
-                    OPTIONAL MATCH (prov:Provider)-[:REGISTERED_AGENT]->(spouse)
-                    OPTIONAL MATCH (prov)-[:LOCATED_AT]->(addr:Address)
-                    RETURN a, spouse, prov, addr
-                """
-            }
-        ],
-        "conclusion": {
-            "exposure": "$1.2M across 47 claims",
-            "traditional_time": "2-3 weeks minimum",
-            "graph_time": "Under 5 minutes",
-            "key_finding": "Hidden spousal ownership of medical providers — a connection that exists entirely outside claims data systems.",
-            "action_items": [
-                "Refer complete network to NICB for criminal investigation",
-                "Place administrative hold on all 47 pending claims", 
-                "Issue subpoenas for clinic ownership and financial records",
-                "Expand search for similar patterns among associated attorneys"
-            ]
-        }
-    },
-    
-    2: {
-        "title": "Identity Web",
-        "subtitle": "Detecting an Identity Network Through Shared Contact Information",
-        "icon": "📱",
-        "starting_entity": ("Phone", "PH_S2_MAIN", "555-847-2931"),
-        "trigger": """
-**Initial Flag:**
-
-ISO database returns a match: a phone number on a recent claim appears on an unrelated claim from 4 months prior. Different claimant names.
-
-The adjuster's initial assessment: *"Likely a data entry error or shared family contact."*
-
-**Investigation Question:** Is this a clerical anomaly, or evidence of something more significant?
-        """,
-        "hops": [
-            {
-                "depth": 0,
-                "title": "Starting Point: Phone Number Alert",
-                "narrative": "ISO system flagged phone number **555-847-2931** appearing on claims with different claimant names.",
-                "traditional": "ISO provides a match on 2 claims. Investigation typically ends here unless obvious fraud indicators are present.",
-                "discovery": None,
-                "query": """
-                    MATCH (ph:Phone {number: '555-847-2931'})
-                    RETURN ph
-                """
-            },
-            {
-                "depth": 1,
-                "title": "Phone Number Usage Analysis",
-                "narrative": "Examining all individuals associated with this phone number across our data...",
-                "traditional": "Finding additional phone matches would require separate database queries with no guarantee of name consistency.",
-                "discovery": "**5 distinct individuals** have used this phone number — ISO only surfaced 2 of them.",
-                "query": """
-                    MATCH (ph:Phone {number: '555-847-2931'})
-                    OPTIONAL MATCH (ph)<-[:HAS_PHONE]-(p:Person)
-                    RETURN ph, p
-                """
-            },
-            {
-                "depth": 2,
-                "title": "Residential Address Mapping",
-                "narrative": "Analyzing residential addresses for all five individuals connected to this phone...",
-                "traditional": "Running separate address queries for each person across different systems. Each query represents a different access request.",
-                "discovery": "**3 of 5 individuals** share the same residential address: 847 Oak Street, Apartment 4B. The remaining 2 (Marcus and Tanya Williams) live at separate addresses.",
-                "query": """
-                    MATCH (ph:Phone {number: '555-847-2931'})<-[:HAS_PHONE]-(p:Person)
-                    OPTIONAL MATCH (p)-[:LIVES_AT]->(addr:Address)
-                    RETURN ph, p, addr
-                """
-            },
-            {
-                "depth": 3,
-                "title": "Address-Based Network Expansion",
-                "narrative": "Expanding the search to identify **all individuals** at the shared address, including those using different contact information...",
-                "traditional": "Cross-referencing address databases with claimant records across multiple systems would require **hours of manual work** and would miss connections through alternate phone numbers.",
-                "discovery": "**2 additional individuals** (Lisa and Tyrell Morgan) reside at 847 Oak Street using a **different phone number** (555-847-2932). **Total network: 7 people across 2 phone numbers.**",
-                "query": """
-                    MATCH (ph1:Phone {number: '555-847-2931'})<-[:HAS_PHONE]-(p1:Person)
-                    OPTIONAL MATCH (p1)-[:LIVES_AT]->(addr1:Address)
-                    WITH collect(DISTINCT p1) as phone1_people, collect(DISTINCT addr1) as addrs
-                    MATCH (addr:Address {id: 'ADDR_S2_OAK'})<-[:LIVES_AT]-(p2:Person)
-                    OPTIONAL MATCH (p2)-[:HAS_PHONE]->(ph2:Phone)
-                    WITH phone1_people, p2, ph2, addr
-                    UNWIND phone1_people as p1
-                    OPTIONAL MATCH (p1)-[:LIVES_AT]->(addr1:Address)
-                    OPTIONAL MATCH (p1)-[:HAS_PHONE]->(ph1:Phone)
-                    RETURN p1, addr1, ph1, p2, ph2, addr
-                """
-            },
-            {
-                "depth": 4,
-                "title": "Complete Claims Analysis",
-                "narrative": "Mapping all claims filed by individuals in this identity network...",
-                "traditional": "Manually cross-referencing 7 individuals across all claims databases. **This level of comprehensive investigation would never occur** based on a single ISO phone match.",
-                "discovery": "**7 claims totaling $215,000** — all filed within a **45-day window**. Every individual in the network has filed a claim. This is coordinated fraud activity.",
-                "query": """
-                    MATCH (ph:Phone)<-[:HAS_PHONE]-(p:Person)-[:LIVES_AT]->(addr:Address)
-                    WHERE ph.number IN ['555-847-2931', '555-847-2932']
-                    OPTIONAL MATCH (c:Claim)-[:FILED_BY]->(p)
-                    RETURN ph, p, addr, c
-                    UNION
-                    MATCH (ph:Phone {number: '555-847-2931'})<-[:HAS_PHONE]-(p:Person)
-                    WHERE NOT (p)-[:LIVES_AT]->(:Address {id: 'ADDR_S2_OAK'})
-                    OPTIONAL MATCH (p)-[:LIVES_AT]->(addr:Address)
-                    OPTIONAL MATCH (c:Claim)-[:FILED_BY]->(p)
-                    RETURN ph, p, addr, c
-                """
-            }
-        ],
-        "conclusion": {
-            "exposure": "$215,000 across 7 claims",
-            "traditional_time": "ISO shows 2 claims; remaining 5 would be missed entirely",
-            "graph_time": "90 seconds to full network mapping",
-            "key_finding": "Network expansion from 2 ISO hits to 7 connected individuals filing 7 claims. Graph reveals connections through **both shared phones and shared addresses** — patterns impossible to discover through linear queries.",
-            "action_items": [
-                "Deny all 7 claims pending fraud investigation",
-                "Refer to NICB for identity fraud prosecution",
-                "Flag both phone numbers (555-847-2931, 555-847-2932) for future claim monitoring",
-                "Investigate property records for 847 Oak Street, Apt 4B"
-            ]
-        }
-    },
-    
-    3: {
-        "title": "Provider Distinction",
-        "subtitle": "Distinguishing Fraud Networks from High-Volume Legitimate Providers",
-        "icon": "📊",
-        "starting_entity": ("Provider", "PROV_S3_SUNRISE", "Sunrise Wellness Clinic"),
-        "trigger": """
-**Initial Flag:**
-
-Quarterly provider audit identifies two facilities with elevated billing patterns:
-
-| Provider | Claims | Billing vs. Peer Average |
-|----------|--------|--------------------------|
-| Sunrise Wellness Clinic | 28 | +38% |
-| City General ER | 32 | +42% |
-
-Both flagged. Limited SIU resources available for investigation.
-
-**Investigation Question:** Which provider warrants full investigation, and which may be a false positive?
-        """,
-        "hops": [
-            {
-                "depth": 0,
-                "title": "Starting Point: Provider Audit Flag",
-                "narrative": "Beginning with **Sunrise Wellness Clinic**, flagged for billing 38% above peer average.",
-                "traditional": "Billing analysis provides a single metric without network context. Prioritization is often arbitrary.",
-                "discovery": None,
-                "query": """
-                    MATCH (p:Provider {id: 'PROV_S3_SUNRISE'})
-                    RETURN p
-                """
-            },
-            {
-                "depth": 1,
-                "title": "Patient Network Analysis",
-                "narrative": "Examining the patient population treated at Sunrise Wellness...",
-                "traditional": "Pulling 28 individual claim files for manual review: approximately **14 hours** of investigation time.",
-                "discovery": "28 claimants treated at this facility over a 6-month period.",
-                "query": """
-                    MATCH (prov:Provider {id: 'PROV_S3_SUNRISE'})
-                    OPTIONAL MATCH (c:Claim)-[:TREATED_AT]->(prov)
-                    OPTIONAL MATCH (c)-[:FILED_BY]->(p:Person)
-                    RETURN prov, c, p
-                """
-            },
-            {
-                "depth": 2,
-                "title": "Legal Representation Analysis",
-                "narrative": "Analyzing attorney distribution across Sunrise patients...",
-                "traditional": "Manually tallying attorney representation from individual claim files.",
-                "discovery": "**23 of 28 patients (82%)** are represented by a single attorney: Roberto Vega. This concentration is highly anomalous.",
-                "query": """
-                    MATCH (prov:Provider {id: 'PROV_S3_SUNRISE'})<-[:TREATED_AT]-(c:Claim)
-                    OPTIONAL MATCH (c)-[:REPRESENTED_BY]->(a:Attorney)
-                    OPTIONAL MATCH (c)-[:FILED_BY]->(p:Person)
-                    RETURN prov, c, a, p
-                """
-            },
-            {
-                "depth": 3,
-                "title": "Attorney Referral Pattern",
-                "narrative": "Examining where Attorney Vega refers his other clients for treatment...",
-                "traditional": "Querying all of Vega's cases and cross-referencing provider selections would require **another full day** of work.",
-                "discovery": "Vega refers clients to **only 2 providers**: Sunrise Wellness and Peak Recovery Center. This is an **exclusive referral pipeline**.",
-                "query": """
-                    MATCH (a:Attorney {id: 'ATT_S3_VEGA'})<-[:REPRESENTED_BY]-(c:Claim)
-                    OPTIONAL MATCH (c)-[:TREATED_AT]->(prov:Provider)
-                    OPTIONAL MATCH (c)-[:FILED_BY]->(p:Person)
-                    RETURN a, c, prov, p
-                """
-            },
-            {
-                "depth": 4,
-                "title": "Cross-Provider Connection Detection",
-                "narrative": "Searching for **shared identifiers** and **common participants** between patients at both clinics...",
-                "traditional": "Comparing patient contact information and witness lists between providers? **No investigator would systematically perform this cross-provider analysis.**",
-                "discovery": "**7 claimants share a phone number** (555-991-8847) across both clinics. Additionally, **Carmen Reyes** appears as witness on claims at **both facilities** — a strong indicator of a professional witness.",
-                "query": """
-                    MATCH (ph:Phone {id: 'PH_S3_SHARED'})<-[:HAS_PHONE]-(p:Person)
-                    OPTIONAL MATCH (c:Claim)-[:FILED_BY]->(p)
-                    OPTIONAL MATCH (c)-[:TREATED_AT]->(prov:Provider)
-                    WITH ph, p, c, prov
-                    OPTIONAL MATCH (c)-[:WITNESSED_BY]->(w:Person)
-                    RETURN ph, p, c, prov, w
-                    UNION
-                    MATCH (carmen:Person {id: 'P_S3_CARMEN'})<-[:WITNESSED_BY]-(c:Claim)
-                    OPTIONAL MATCH (c)-[:TREATED_AT]->(prov:Provider)
-                    OPTIONAL MATCH (c)-[:FILED_BY]->(claimant:Person)
-                    RETURN carmen as w, claimant as p, c, prov, null as ph
-                """
-            },
-            {
-                "depth": 5,
-                "title": "Comparison: City General ER",
-                "narrative": "Now analyzing the second flagged provider to determine if it warrants investigation or represents a **false positive**...",
-                "traditional": "Same manual review process repeated for the second provider. Most audits would stop after investigating the first facility due to resource constraints.",
-                "discovery": "City General ER: **32 claims, 12 different attorneys, zero shared phones or addresses**. The facility's location at the **I-85/Highway 20 junction** (a major accident corridor) explains the elevated volume. **This is a legitimate high-volume provider — no investigation warranted.**",
-                "query": """
-                    MATCH (prov:Provider {id: 'PROV_S3_CITYGEN'})<-[:TREATED_AT]-(c:Claim)
-                    OPTIONAL MATCH (c)-[:REPRESENTED_BY]->(a:Attorney)
-                    OPTIONAL MATCH (c)-[:FILED_BY]->(p:Person)
-                    OPTIONAL MATCH (p)-[:HAS_PHONE]->(ph:Phone)
-                    OPTIONAL MATCH (c)-[:OCCURRED_AT]->(loc:Location)
-                    RETURN prov, c, a, p, ph, loc
-                """
-            }
-        ],
-        "conclusion": {
-            "exposure": "$400K+ exposure at Sunrise; City General cleared",
-            "traditional_time": "Both providers flagged with no clear prioritization criteria",
-            "graph_time": "Sunrise confirmed: 2 minutes. City General cleared: 30 seconds.",
-            "key_finding": "Graph analysis not only identifies fraud networks — it **rapidly clears legitimate entities**, preventing wasted investigation resources.",
-            "action_items": [
-                "Initiate full investigation of Sunrise Wellness and Peak Recovery",
-                "Close audit flag on City General ER — no further action required",
-                "Investigate Attorney Roberto Vega's complete client portfolio",
-                "Monitor flagged phone number for future claim activity"
-            ]
-        }
-    },
-    
-    4: {
-        "title": "Network Migration",
-        "subtitle": "Detecting Network Migration After Successful Prosecution",
-        "icon": "🔄",
-        "starting_entity": ("Provider", "PROV_S4_BERNARD", "Dr. Bernard's Auto Injury Center"),
-        "trigger": """
-**Background:**
-
-Six months ago, SIU successfully prosecuted a staged accident ring involving **Dr. Bernard's Auto Injury Center**:
-
-| Outcome | Result |
-|---------|--------|
-| Claims Denied | $62,000 |
-| Provider Status | License Revoked |
-| Case Status | **Closed** ✓ |
-
-**Investigation Question:** Did we dismantle the entire operation, or merely one component?
-        """,
-        "hops": [
-            {
-                "depth": 0,
-                "title": "Starting Point: Confirmed Fraud Case",
-                "narrative": "Reviewing **Dr. Bernard's Auto Injury Center** — confirmed fraud, license revoked, case closed.",
-                "traditional": "Case closed. File archived. Investigation resources redirected to new matters.",
-                "discovery": None,
-                "query": """
-                    MATCH (p:Provider {id: 'PROV_S4_BERNARD'})
-                    RETURN p
-                """
-            },
-            {
-                "depth": 1,
-                "title": "Original Case Review",
-                "narrative": "The 15 claims from the prosecuted case...",
-                "traditional": "These claims are documented in the closed case file. Known fraudulent activity.",
-                "discovery": "15 confirmed fraudulent claims. All denied. Case successfully prosecuted. ✓",
-                "query": """
-                    MATCH (prov:Provider {id: 'PROV_S4_BERNARD'})
-                    OPTIONAL MATCH (c:Claim)-[:TREATED_AT]->(prov)
-                    OPTIONAL MATCH (c)-[:FILED_BY]->(p:Person)
-                    RETURN prov, c, p
-                """
-            },
-            {
-                "depth": 2,
-                "title": "Legal Representation Analysis",
-                "narrative": "Examining the complete legal representation picture for all claimants in the Bernard's case...",
-                "traditional": "Case file notation: 'Multiple claimants used same attorney.' No systematic analysis of attorney distribution or follow-up investigation conducted.",
-                "discovery": "**12 of 15 claimants (80%)** were represented by **Attorney Michael Chen**. The remaining 3 used different attorneys. Chen was **never sanctioned** despite his clients' confirmed fraud and **remains actively practicing**.",
-                "query": """
-                    MATCH (prov:Provider {id: 'PROV_S4_BERNARD'})<-[:TREATED_AT]-(c:Claim)
-                    OPTIONAL MATCH (c)-[:REPRESENTED_BY]->(a:Attorney)
-                    OPTIONAL MATCH (c)-[:FILED_BY]->(p:Person)
-                    RETURN prov, c, a, p
-                """
-            },
-            {
-                "depth": 3,
-                "title": "Attorney's Current Activity",
-                "narrative": "Investigating Attorney Chen's activities since the case closure...",
-                "traditional": "Checking whether the attorney faced sanctions. He did not. **Case remains closed.**",
-                "discovery": "Chen has acquired **34 new clients** since Dr. Bernard's was shut down. His practice continues unimpeded.",
-                "query": """
-                    MATCH (a:Attorney {id: 'ATT_S4_CHEN'})<-[:REPRESENTED_BY]-(c:Claim)
-                    WHERE c.is_fraud = false
-                    OPTIONAL MATCH (c)-[:FILED_BY]->(p:Person)
-                    RETURN a, c, p
-                """
-            },
-            {
-                "depth": 4,
-                "title": "New Treatment Facility Pattern",
-                "narrative": "Analyzing where Chen's new clients are receiving treatment...",
-                "traditional": "Pulling 34 individual claim files to check treatment providers. **Resource-prohibitive for a 'closed' case.**",
-                "discovery": "**28 of 34 clients (82%)** are treated at **Rapid Recovery Med** — a facility that opened 2 months after Dr. Bernard's license was revoked.",
-                "query": """
-                    MATCH (a:Attorney {id: 'ATT_S4_CHEN'})<-[:REPRESENTED_BY]-(c:Claim)
-                    WHERE c.is_fraud = false
-                    OPTIONAL MATCH (c)-[:TREATED_AT]->(prov:Provider)
-                    OPTIONAL MATCH (c)-[:FILED_BY]->(p:Person)
-                    RETURN a, c, prov, p
-                """
-            },
-            {
-                "depth": 5,
-                "title": "Ownership Investigation",
-                "narrative": "Examining corporate records for Rapid Recovery Med...",
-                "traditional": "Corporate registry research on a new provider connected to a closed case? **This investigation would never be initiated.**",
-                "discovery": "Rapid Recovery is owned by **Dr. Patricia Simmons** — a **former employee of Dr. Bernard's**. The fraud network migrated, not ended.",
-                "query": """
-                    MATCH (rapid:Provider {id: 'PROV_S4_RAPID'})
-                    OPTIONAL MATCH (rapid)-[:OWNED_BY]->(owner:Person)
-                    OPTIONAL MATCH (owner)-[:FORMER_EMPLOYEE_OF]->(bernard:Provider)
-                    OPTIONAL MATCH (rapid)-[:EMPLOYS]->(emp:Person)
-                    RETURN rapid, owner, bernard, emp
-                """
-            }
-        ],
-        "conclusion": {
-            "exposure": "Original case: $62K saved. Active network exposure: $280K+",
-            "traditional_time": "Case closed. Network continues operations undetected.",
-            "graph_time": "Network migration detected in under 2 minutes",
-            "key_finding": "Fraud networks adapt and migrate. Graph technology reveals **persistent connection points** (Chen) that link old and new operations.",
-            "action_items": [
-                "Open immediate investigation on Rapid Recovery Med",
-                "Issue subpoenas for Attorney Michael Chen's complete case files",
-                "Flag all 34 active claimants for expedited review",
-                "Conduct background investigation on Dr. Patricia Simmons",
-                "Update case status to 'Network Active — Ongoing Investigation'"
-            ]
-        }
-    }
-}
+# Spring layout passes for graphs drawn by WebGL; a coarser layout keeps
+# the server-side cost of multi-thousand-node graphs to a few seconds
+LARGE_LAYOUT_ITERATIONS = 15
+
+# Graphs larger than this fold single-connection leaves into group nodes
+LOD_NODE_THRESHOLD = 500
+
+# Integer lookups built once at load. Nodes and edges carry small indices;
+# the palette and label tables ship once per graph payload.
+PALETTE = list(COLOR_MAP.values())
+COLOR_INDEX = {entity_type: i for i, entity_type in enumerate(COLOR_MAP)}
+REL_LABELS = list(RELATIONSHIP_LABELS.values())
+REL_INDEX = {rel_type: i for i, rel_type in enumerate(RELATIONSHIP_LABELS)}
+
+# vis.js styling shared by every node/edge; one object each, never mutated
+NODE_FONT = {"size": 12, "color": "#FFFFFF", "strokeWidth": 2, "strokeColor": "#000000"}
+EDGE_SMOOTH = {"type": "continuous"}
+EDGE_ARROWS = {"to": {"enabled": True, "scaleFactor": 0.5}}
 
 # =============================================================================
 # GRAPH VISUALIZATION
 # =============================================================================
 
+# Most specific first; a node displays as the first of these it carries
+LABEL_PRIORITY = ["Claimant", "Witness", "Adjuster", "Employee", "Provider",
+                  "Attorney", "BodyShop", "Address", "Phone", "Location", "Claim", "Person"]
+
+
+LABEL_RANK = {label: rank for rank, label in enumerate(LABEL_PRIORITY)}
+
+
 def get_node_label(labels):
     """Determine most specific label for display."""
-    priority = ["Claimant", "Witness", "Adjuster", "Employee", "Provider", 
-                "Attorney", "BodyShop", "Address", "Phone", "Location", "Claim", "Person"]
-    for p in priority:
-        if p in labels:
-            return p
-    return labels[0] if labels else "Unknown"
+    # A node has one to three labels, so scan those rather than the priority list
+    unranked = len(LABEL_PRIORITY)
+    return min(labels, key=lambda label: LABEL_RANK.get(label, unranked), default="Unknown")
 
 
+@functools.lru_cache(maxsize=2048)
 def format_currency(amount):
     """Format number as currency."""
     if amount:
@@ -639,114 +271,147 @@ def format_currency(amount):
     return "N/A"
 
 
-def create_graph_visualization(records, root_id=None, entity_filters=None):
+# Per-label tooltip lines: (property, line prefix, formatter), shown when set
+_PERSON_TOOLTIP = (
+    ("role", "👤 Role: ", str),
+    ("job_title", "💼 Title: ", str),
+)
+TOOLTIP_FIELDS = {
+    "Claim": (
+        ("claim_amount", "💰 Amount: ", format_currency),
+        ("claim_date", "📅 Date: ", str),
+        ("status", "📋 Status: ", str),
+        ("incident_type", "🚗 Type: ", str),
+    ),
+    "Provider": (
+        ("license", "🏥 License: ", str),
+        ("status", "📋 Status: ", str),
+        ("opened_date", "📅 Opened: ", str),
+    ),
+    "Attorney": (
+        ("bar_number", "⚖️ Bar: ", str),
+    ),
+    "Address": (
+        ("type", "📍 Type: ", str),
+    ),
+    "Claimant": _PERSON_TOOLTIP,
+    "Witness": _PERSON_TOOLTIP,
+    "Employee": _PERSON_TOOLTIP,
+    "Person": _PERSON_TOOLTIP,
+}
+
+# Tooltip title line for every label get_node_label can return
+TOOLTIP_HEADERS = {label: f"━━━ {label.upper()} ━━━" for label in LABEL_PRIORITY + ["Unknown"]}
+
+# (size, border width) keyed by (is_fraud, is_root); the root wins over fraud
+NODE_STYLES = {
+    (False, False): (28, 2),
+    (True, False): (42, 4),
+    (False, True): (48, 4),
+    (True, True): (48, 4),
+}
+
+
+def create_graph_visualization(records, root_id=None):
     """
     Create rich graph visualization with enhanced tooltips and edge styling.
     
     Args:
-        records: Neo4j query results
+        records: Neo4j query results (any iterable; consumed once)
         root_id: ID of the starting/root entity
-        entity_filters: Set of entity types to include (None = all)
     """
     nodes = {}
     edges = []
-    node_id_map = {}  # Map element_id to our custom id
+    edge_set = set()
+    pending_edges = []
+    
+    def add_edge(source_eid, target_eid, rel):
+        # Undirected dedupe on a canonical (low, high) pair
+        key = (source_eid, target_eid) if source_eid < target_eid else (target_eid, source_eid)
+        if key in edge_set:
+            return
+        
+        edge_set.add(key)
+        source = str(source_eid)
+        target = str(target_eid)
+        rel_type = rel.type if isinstance(rel, Neo4jRelationship) else "CONNECTED"
+        rel_idx = REL_INDEX.get(rel_type)
+        if rel_idx is not None:
+            rel_label = REL_LABELS[rel_idx]
+        else:
+            rel_label = rel_type.replace("_", " ").title()
+        
+        edges.append(Edge(
+            source=source,
+            target=target,
+            title=f"🔗 {rel_label}",
+            rel_type=rel_type,
+            color="#B0B0B0",
+            width=2,
+            smooth=EDGE_SMOOTH,
+            arrows=EDGE_ARROWS,
+            hoverWidth=3,
+            selectionWidth=3
+        ))
     
+    # Hoisted out of the per-node loop
+    color_index_get = COLOR_INDEX.get
+    default_color_idx = COLOR_INDEX["Person"]
+    fraud_color_idx = COLOR_INDEX['confirmed_fraud']
+    
+    # Single pass: nodes first within each record so both endpoints of its
+    # relationship (if any) are registered before the edge is considered
     for record in records:
-        for key, value in record.items():
-            if value is None:
-                continue
-            
+        for value in record.values():
             # Handle nodes
-            if hasattr(value, 'labels'):
+            if isinstance(value, Neo4jNode):
                 element_id = value.element_id
                 if element_id in nodes:
                     continue
                 
-                labels = list(value.labels)
-                props = dict(value)
-                
-                label = get_node_label(labels)
-                
-                # Apply entity filter if specified
-                if entity_filters and label not in entity_filters:
-                    continue
+                # Read properties straight off the driver's Node (a mapping)
+                # rather than copying them into a fresh dict per node
+                props = value
+                pget = props.get
+                label = get_node_label(value.labels)
                 
-                node_id = props.get('id', str(element_id))
-                node_id_map[element_id] = node_id
+                node_id = pget('id', str(element_id))
                 
-                name = props.get('name', props.get('number', props.get('street', node_id)))
+                name = pget('name', pget('number', pget('street', node_id)))
                 
                 # Determine visual properties
-                color = COLOR_MAP.get(label, "#AAB7B8")
-                size = 28
-                border_width = 2
-                
-                # Fraud highlighting
-                if props.get('is_fraud'):
-                    color = COLOR_MAP['confirmed_fraud']
-                    size = 42
-                    border_width = 4
-                
-                # Root node highlighting
-                is_root = (root_id and node_id == root_id)
-                if is_root:
-                    size = 48
-                    border_width = 4
+                is_fraud = bool(pget('is_fraud'))
+                is_root = bool(root_id and node_id == root_id)
+                size, border_width = NODE_STYLES[is_fraud, is_root]
+                color_idx = fraud_color_idx if is_fraud else color_index_get(label, default_color_idx)
                 
                 # Build rich tooltip
                 tooltip_lines = [
-                    f"━━━ {label.upper()} ━━━",
+                    TOOLTIP_HEADERS[label],
                     f"📌 {name}"
                 ]
                 
-                if label == "Claim":
-                    if props.get('claim_amount'):
-                        tooltip_lines.append(f"💰 Amount: {format_currency(props['claim_amount'])}")
-                    if props.get('claim_date'):
-                        tooltip_lines.append(f"📅 Date: {props['claim_date']}")
-                    if props.get('status'):
-                        tooltip_lines.append(f"📋 Status: {props['status']}")
-                    if props.get('incident_type'):
-                        tooltip_lines.append(f"🚗 Type: {props['incident_type']}")
-                
-                elif label == "Provider":
-                    if props.get('license'):
-                        tooltip_lines.append(f"🏥 License: {props['license']}")
-                    if props.get('status'):
-                        tooltip_lines.append(f"📋 Status: {props['status']}")
-                    if props.get('opened_date'):
-                        tooltip_lines.append(f"📅 Opened: {props['opened_date']}")
-                
-                elif label == "Attorney":
-                    if props.get('bar_number'):
-                        tooltip_lines.append(f"⚖️ Bar: {props['bar_number']}")
-                
-                elif label == "Phone":
-                    tooltip_lines.append(f"📱 {props.get('number', 'N/A')}")
-                
+                if label == "Phone":
+                    tooltip_lines.append("📱 " + str(pget('number', 'N/A')))
                 elif label == "Address":
-                    addr_parts = [props.get('street', '')]
-                    if props.get('unit'):
+                    addr_parts = [pget('street', '')]
+                    if pget('unit'):
                         addr_parts.append(props['unit'])
-                    if props.get('city'):
-                        addr_parts.append(f"{props['city']}, {props.get('state', '')}")
-                    tooltip_lines.append(f"🏠 {', '.join(filter(None, addr_parts))}")
-                    if props.get('type'):
-                        tooltip_lines.append(f"📍 Type: {props['type']}")
+                    if pget('city'):
+                        addr_parts.append(f"{props['city']}, {pget('state', '')}")
+                    tooltip_lines.append("🏠 " + ", ".join(filter(None, addr_parts)))
                 
-                elif label in ["Claimant", "Witness", "Employee", "Person"]:
-                    if props.get('role'):
-                        tooltip_lines.append(f"👤 Role: {props['role']}")
-                    if props.get('job_title'):
-                        tooltip_lines.append(f"💼 Title: {props['job_title']}")
+                for key, prefix, fmt in TOOLTIP_FIELDS.get(label, ()):
+                    prop = pget(key)
+                    if prop:
+                        tooltip_lines.append(prefix + fmt(prop))
                 
                 # Fraud indicator
-                if props.get('is_fraud'):
+                if is_fraud:
                     tooltip_lines.extend([
                         "",
                         "🚨 CONFIRMED FRAUD",
-                        f"Type: {props.get('fraud_type', 'Unknown')}"
+                        f"Type: {pget('fraud_type', 'Unknown')}"
                     ])
                 
                 # ID reference
@@ -756,66 +421,94 @@ def create_graph_visualization(records, root_id=None, entity_filters=None):
                     id=str(element_id),
                     label=name[:25] + "..." if len(str(name)) > 25 else str(name),
                     size=size,
-                    color=color,
+                    color=PALETTE[color_idx],
+                    color_idx=color_idx,
                     title="\n".join(tooltip_lines),
                     shape="star" if is_root else "dot",
                     borderWidth=border_width,
                     borderWidthSelected=border_width + 2,
-                    font={"size": 12, "color": "#FFFFFF", "strokeWidth": 2, "strokeColor": "#000000"}
+                    font=NODE_FONT
                 )
+        
+        # Relationship records carry (source, r, target); an edge whose
+        # endpoints haven't been seen yet waits until every record is in
+        rel = record.get('r')
+        if rel is not None:
+            source_node = record.get('source')
+            target_node = record.get('target')
+            if source_node and target_node:
+                if source_node.element_id in nodes and target_node.element_id in nodes:
+                    add_edge(source_node.element_id, target_node.element_id, rel)
+                else:
+                    pending_edges.append((source_node.element_id, target_node.element_id, rel))
     
-    # Second pass for relationships (from records with source, r, target structure)
-    edge_set = set()
-    for record in records:
-        record_dict = dict(record)
-        if 'r' in record_dict and record_dict['r'] is not None:
-            rel = record_dict['r']
-            source_node = record_dict.get('source')
-            target_node = record_dict.get('target')
-            if source_node and target_node and source_node.element_id in nodes and target_node.element_id in nodes:
-                source = str(source_node.element_id)
-                target = str(target_node.element_id)
-                edge_key = f"{source}-{target}"
-                reverse_key = f"{target}-{source}"
-                
-                if edge_key not in edge_set and reverse_key not in edge_set:
-                    edge_set.add(edge_key)
-                    rel_type = rel.type if hasattr(rel, 'type') else "CONNECTED"
-                    rel_label = RELATIONSHIP_LABELS.get(rel_type, rel_type.replace("_", " ").title())
-                    
-                    edges.append(Edge(
-                        source=source,
-                        target=target,
-                        title=f"🔗 {rel_label}",
-                        color="#B0B0B0",
-                        width=2,
-                        smooth={"type": "continuous"},
-                        arrows={"to": {"enabled": True, "scaleFactor": 0.5}},
-                        hoverWidth=3,
-                        selectionWidth=3
-                    ))
+    for source_eid, target_eid, rel in pending_edges:
+        if source_eid in nodes and target_eid in nodes:
+            add_edge(source_eid, target_eid, rel)
     
     return list(nodes.values()), edges
 
 
-def get_graph_config(width=1000, height=500, physics_enabled=True):
-    """Configure graph visualization settings."""
-    return Config(
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def spring_positions(node_ids, edge_pairs, iterations):
+    """
+    Seeded spring layout of a graph given as id and (source, target) tuples.
+    
+    Cached, so an explorer graph that is drawn again (or the same
+    neighbourhood explored twice) does not pay for its layout twice.
+    """
+    graph = nx.Graph()
+    graph.add_nodes_from(node_ids)
+    graph.add_edges_from(edge_pairs)
+    
+    positions = nx.spring_layout(
+        graph, seed=42, iterations=iterations, scale=LAYOUT_SPACING * math.sqrt(len(node_ids))
+    )
+    return {node_id: (float(x), float(y)) for node_id, (x, y) in positions.items()}
+
+
+def compute_layout(nodes, edges):
+    """
+    Compute node positions server-side with a seeded spring layout.
+    
+    Returns a dict of node id -> (x, y) in canvas units, spread in
+    proportion to graph size so node spacing stays roughly constant.
+    Graphs past WEBGL_NODE_THRESHOLD get fewer spring iterations.
+    """
+    iterations = 50 if len(nodes) <= WEBGL_NODE_THRESHOLD else LARGE_LAYOUT_ITERATIONS
+    return spring_positions(
+        tuple(node.id for node in nodes),
+        tuple((edge.source, edge.to) for edge in edges),
+        iterations
+    )
+
+
+def apply_layout(nodes, edges):
+    """
+    Pin every node at its precomputed position.
+    
+    Applies to both renderers: vis.js gets fixed x/y with physics off, and
+    the WebGL page draws the shipped xs/ys instead of running its own
+    browser-side layout.
+    """
+    if not nodes:
+        return
+    positions = compute_layout(nodes, edges)
+    for node in nodes:
+        node.x, node.y = positions[node.id]
+
+
+def get_graph_config(width=1000, height=500, physics_enabled=False):
+    """
+    Configure graph visualization settings.
+    
+    Nodes arrive with server-computed positions, so the browser-side physics
+    simulation is off by default.
+    """
+    config = Config(
         width=width,
         height=height,
         directed=True,
-        physics={
-            "enabled": physics_enabled,
-            "stabilization": {"enabled": True, "iterations": 150, "fit": True},
-            "solver": "forceAtlas2Based",
-            "forceAtlas2Based": {
-                "gravitationalConstant": -60,
-                "centralGravity": 0.015,
-                "springLength": 120,
-                "springConstant": 0.08,
-                "avoidOverlap": 0.5
-            }
-        },
         interaction={
             "hover": True,
             "tooltipDelay": 50,
@@ -838,181 +531,709 @@ def get_graph_config(width=1000, height=500, physics_enabled=True):
             "font": {"size": 12, "color": "#FFFFFF"}
         }
     )
+    # Config wraps its physics argument as the "enabled" flag, so the full
+    # options dict has to be assigned after construction
+    config.physics = {
+        "enabled": physics_enabled,
+        "stabilization": {"enabled": True, "iterations": 150, "fit": True},
+        "solver": "forceAtlas2Based",
+        "forceAtlas2Based": {
+            "gravitationalConstant": -60,
+            "centralGravity": 0.015,
+            "springLength": 120,
+            "springConstant": 0.08,
+            "avoidOverlap": 0.5
+        }
+    }
+    return config
+
+
+def collapse_leaves(nodes, edges, threshold=LOD_NODE_THRESHOLD, expanded=()):
+    """
+    Level-of-detail pass: fold degree-1 leaves into one group node per parent.
+    
+    Only applies above `threshold` nodes. Parents listed in `expanded` keep
+    their leaves. Returns (nodes, edges, groups) where groups maps each
+    collapsed parent id to its display name and leaf count.
+    """
+    if len(nodes) <= threshold:
+        return nodes, edges, {}
+    
+    degree = Counter()
+    neighbor = {}
+    for edge in edges:
+        degree[edge.source] += 1
+        degree[edge.to] += 1
+        neighbor[edge.source] = edge.to
+        neighbor[edge.to] = edge.source
+    
+    leaves_by_parent = defaultdict(list)
+    for node in nodes:
+        if degree[node.id] == 1:
+            parent = neighbor[node.id]
+            if degree[parent] > 1 and parent not in expanded:
+                leaves_by_parent[parent].append(node)
+    
+    # A single leaf gains nothing from being replaced by a group node
+    leaves_by_parent = {p: leaves for p, leaves in leaves_by_parent.items() if len(leaves) > 1}
+    if not leaves_by_parent:
+        return nodes, edges, {}
+    
+    hidden = {leaf.id for leaves in leaves_by_parent.values() for leaf in leaves}
+    by_id = {node.id: node for node in nodes}
+    
+    kept_nodes = [node for node in nodes if node.id not in hidden]
+    kept_edges = [edge for edge in edges if edge.source not in hidden and edge.to not in hidden]
+    groups = {}
+    
+    for parent_id, leaves in leaves_by_parent.items():
+        parent = by_id[parent_id]
+        groups[parent_id] = (parent.label, len(leaves))
+        
+        tooltip_lines = [f"━━━ {len(leaves)} COLLAPSED ━━━"]
+        tooltip_lines.extend(f"• {leaf.label}" for leaf in leaves[:10])
+        if len(leaves) > 10:
+            tooltip_lines.append(f"… and {len(leaves) - 10} more")
+        
+        group = Node(
+            id=f"group:{parent_id}",
+            label=f"+{len(leaves)}",
+            size=20 + min(len(leaves), 30),
+            color=leaves[0].color,
+            color_idx=leaves[0].color_idx,
+            title="\n".join(tooltip_lines),
+            shape="dot",
+            borderWidth=2,
+            font=NODE_FONT
+        )
+        if hasattr(parent, 'x'):
+            group.x, group.y = parent.x + LAYOUT_SPACING, parent.y + LAYOUT_SPACING
+        kept_nodes.append(group)
+        kept_edges.append(Edge(
+            source=parent_id,
+            target=group.id,
+            title=f"🔗 {len(leaves)} connections",
+            rel_type="COLLAPSED",
+            color="#B0B0B0",
+            width=2,
+            dashes=True
+        ))
+    
+    return kept_nodes, kept_edges, groups
+
+
+def pack_graph(nodes, edges):
+    """
+    Pack Node/Edge objects into parallel arrays (structure of arrays).
+    
+    Colors and relationship types become small indices into tables shipped
+    once, and edges become index pairs into the node arrays, so the payload
+    carries no per-object keys and the browser can copy each list straight
+    into a typed vertex buffer.
+    """
+    index = {}
+    ids, labels, titles, color_idx, sizes, xs, ys = [], [], [], [], [], [], []
+    
+    for i, node in enumerate(nodes):
+        index[node.id] = i
+        ids.append(node.id)
+        labels.append(node.label)
+        titles.append(node.title)
+        color_idx.append(node.color_idx)
+        sizes.append(node.size)
+        xs.append(getattr(node, 'x', None))
+        ys.append(getattr(node, 'y', None))
+    
+    # Coordinates are only shipped when every node has been positioned
+    if None in xs:
+        xs, ys = [], []
+    
+    # Relationship types outside RELATIONSHIP_LABELS are appended per payload
+    rel_index = dict(REL_INDEX)
+    rel_labels = list(REL_LABELS)
+    edge_src, edge_dst, edge_rel = [], [], []
+    for edge in edges:
+        src = index.get(edge.source)
+        dst = index.get(edge.to)
+        if src is not None and dst is not None:
+            rel_idx = rel_index.get(edge.rel_type)
+            if rel_idx is None:
+                rel_idx = rel_index[edge.rel_type] = len(rel_labels)
+                rel_labels.append(edge.rel_type.replace("_", " ").title())
+            edge_src.append(src)
+            edge_dst.append(dst)
+            edge_rel.append(rel_idx)
+    
+    # One byte per edge (two if a payload ever exceeds 256 relationship
+    # types), base64-encoded; the browser decodes it into a typed array
+    rel_bytes = array('B' if len(rel_labels) <= 256 else 'H', edge_rel)
+    if sys.byteorder == 'big':
+        rel_bytes.byteswap()
+    
+    return {
+        "palette": PALETTE,
+        "ids": ids,
+        "labels": labels,
+        "titles": titles,
+        "color_idx": color_idx,
+        "sizes": sizes,
+        "xs": xs,
+        "ys": ys,
+        "rel_labels": rel_labels,
+        "edge_src": edge_src,
+        "edge_dst": edge_dst,
+        "edge_rel": base64.b64encode(rel_bytes.tobytes()).decode("ascii"),
+        "edge_rel_width": rel_bytes.itemsize,
+    }
+
+
+class GraphTable:
+    """
+    Compact column store for a graph kept across reruns.
+    
+    Each Node/Edge carries a per-object __dict__; the explorer graph lives
+    in session state for the whole session, so it is held here as parallel
+    typed arrays instead and only turned back into Node/Edge objects when
+    it is rendered.
+    """
+    __slots__ = (
+        "ids", "labels", "titles", "color_idx", "sizes", "border_widths",
+        "root", "xs", "ys", "rel_types", "edge_src", "edge_dst", "edge_rel",
+    )
+    
+    def __init__(self, nodes, edges):
+        index = {}
+        self.ids, self.labels, self.titles = [], [], []
+        self.color_idx = array('B')
+        self.sizes = array('B')
+        self.border_widths = array('B')
+        self.xs = array('d')
+        self.ys = array('d')
+        self.root = -1
+        
+        for i, node in enumerate(nodes):
+            index[node.id] = i
+            self.ids.append(node.id)
+            self.labels.append(node.label)
+            self.titles.append(node.title)
+            self.color_idx.append(node.color_idx)
+            self.sizes.append(node.size)
+            self.border_widths.append(node.borderWidth)
+            self.xs.append(getattr(node, 'x', math.nan))
+            self.ys.append(getattr(node, 'y', math.nan))
+            if node.shape == "star":
+                self.root = i
+        
+        rel_index = dict(REL_INDEX)
+        self.rel_types = list(RELATIONSHIP_LABELS)
+        self.edge_src = array('I')
+        self.edge_dst = array('I')
+        self.edge_rel = array('H')
+        for edge in edges:
+            rel_idx = rel_index.get(edge.rel_type)
+            if rel_idx is None:
+                rel_idx = rel_index[edge.rel_type] = len(self.rel_types)
+                self.rel_types.append(edge.rel_type)
+            self.edge_src.append(index[edge.source])
+            self.edge_dst.append(index[edge.to])
+            self.edge_rel.append(rel_idx)
+    
+    def __len__(self):
+        return len(self.ids)
+    
+    @property
+    def edge_count(self):
+        return len(self.edge_src)
+    
+    @property
+    def fraud_count(self):
+        return self.color_idx.count(COLOR_INDEX['confirmed_fraud'])
+    
+    def to_graph(self):
+        """Rebuild the Node and Edge lists for rendering."""
+        nodes = []
+        for i, node_id in enumerate(self.ids):
+            border_width = self.border_widths[i]
+            node = Node(
+                id=node_id,
+                label=self.labels[i],
+                size=self.sizes[i],
+                color=PALETTE[self.color_idx[i]],
+                color_idx=self.color_idx[i],
+                title=self.titles[i],
+                shape="star" if i == self.root else "dot",
+                borderWidth=border_width,
+                borderWidthSelected=border_width + 2,
+                font=NODE_FONT
+            )
+            if not math.isnan(self.xs[i]):
+                node.x, node.y = self.xs[i], self.ys[i]
+            nodes.append(node)
+        
+        edges = []
+        for src, dst, rel_idx in zip(self.edge_src, self.edge_dst, self.edge_rel):
+            rel_type = self.rel_types[rel_idx]
+            rel_label = REL_LABELS[rel_idx] if rel_idx < len(REL_LABELS) else rel_type.replace("_", " ").title()
+            edges.append(Edge(
+                source=self.ids[src],
+                target=self.ids[dst],
+                title=f"🔗 {rel_label}",
+                rel_type=rel_type,
+                color="#B0B0B0",
+                width=2,
+                smooth=EDGE_SMOOTH,
+                arrows=EDGE_ARROWS,
+                hoverWidth=3,
+                selectionWidth=3
+            ))
+        
+        return nodes, edges
+
+
+def render_graph(nodes, edges, width=1000, height=500):
+    """
+    Render a graph panel, switching to WebGL for large networks.
+    
+    vis.js keeps rich per-node styling and dragging for small graphs; past
+    WEBGL_NODE_THRESHOLD entities its canvas renderer can no longer keep up.
+    """
+    if len(nodes) > WEBGL_NODE_THRESHOLD:
+        render_webgl_graph(pack_graph(nodes, edges), height=height)
+    else:
+        agraph(nodes, edges, get_graph_config(width=width, height=height))
 
 # =============================================================================
 # DATA QUERIES
 # =============================================================================
 
-def run_scenario_query(query):
-    """Execute scenario-specific Cypher query."""
-    with driver.session() as session:
-        result = session.run(query)
-        return list(result)
+# Canonical query text. Values are always passed as $parameters so each query
+# is planned once and then served from Neo4j's plan cache. Labels and
+# variable-length bounds cannot be parameters; they are formatted in from the
+# small fixed set offered by the UI, so the number of distinct plans stays bounded.
+CYPHER_RELATIONSHIPS_BETWEEN = """
+    UNWIND $ids AS eid
+    MATCH (a) WHERE elementId(a) = eid
+    MATCH (a)-[r]->(b)
+    WHERE elementId(b) IN $ids
+    RETURN a as source, r, b as target
+"""
+
+# All dashboard counts in one round trip (always exactly one row)
+CYPHER_DATABASE_STATS = """
+    CALL { MATCH (n) RETURN count(n) AS total_nodes }
+    CALL { MATCH ()-[r]->() RETURN count(r) AS total_relationships }
+    CALL { MATCH (c:Claim) RETURN count(c) AS claims }
+    CALL { MATCH (c:Claim {is_fraud: true}) RETURN count(c) AS fraud_claims }
+    RETURN total_nodes, total_relationships, claims, fraud_claims
+"""
+
+# Sorted on the original keys, so the same 500 entities are offered as
+# before the display fallback moved into Cypher
+CYPHER_ENTITIES_BY_TYPE = """
+    MATCH (n:`{label}`)
+    RETURN n.id AS id, coalesce(n.name, n.number, n.street, n.id) AS display
+    ORDER BY n.name, n.number
+    LIMIT $limit
+"""
+
+# Deepest neighborhood the explorer will expand
+MAX_EXPLORE_HOPS = 5
+
+# Nodes and the relationships among them in one round trip: every node comes
+# back as `source` at least once, with a null `r` if it has no edge in the set.
+# Every node on a path of length <= hops is itself within hops of the root,
+# so collecting distinct endpoints gives the same set as unwinding nodes(path)
+# while letting the planner prune the expansion instead of enumerating paths.
+# The type filter matches get_node_label: a node's display type is the first
+# of $label_priority it carries. Traversal still passes filtered-out nodes.
+CYPHER_NEIGHBORHOOD = """
+    MATCH (root:`{label}` {{id: $entity_id}})-[*1..{hops}]-(connected)
+    WITH root, collect(DISTINCT connected) as reached
+    UNWIND [root] + reached as n
+    WITH DISTINCT n
+    WHERE $filters IS NULL
+       OR head([l IN $label_priority WHERE l IN labels(n)] + labels(n)) IN $filters
+    WITH collect(n) as ns
+    UNWIND ns as source
+    OPTIONAL MATCH (source)-[r]->(target)
+    WHERE target IN ns
+    RETURN source, r, target
+"""
+
+
+def run_cypher(query, routing=RoutingControl.READ, **params):
+    """
+    Execute a Cypher query through the driver's managed session pool.
+    
+    Reuses pooled connections instead of opening a dedicated session per
+    call, and returns the fully fetched list of records.
+    """
+    records, _, _ = driver.execute_query(
+        query,
+        params,
+        routing_=routing,
+        database_=NEO4J_DATABASE
+    )
+    return records
+
+
+def write_cypher(query, **params):
+    """
+    Execute a write query and return its summary counters.
+    
+    The counters report what changed (nodes_deleted, relationships_created,
+    ...) so callers never re-count the database to describe a write.
+    """
+    _, summary, _ = driver.execute_query(
+        query,
+        params,
+        routing_=RoutingControl.WRITE,
+        database_=NEO4J_DATABASE
+    )
+    return summary.counters
+
+
+def clear_database():
+    """
+    Delete every node and relationship and return the summary counters.
+    
+    The batched delete commits its own inner transactions, so it runs as an
+    auto-commit query on a session rather than through execute_query.
+    """
+    with driver.session(database=NEO4J_DATABASE) as session:
+        query = Query(CLEAR_DATABASE_STATEMENT, timeout=CLEAR_DATABASE_TIMEOUT)
+        return session.run(query).consume().counters
+
+
+def consume_cypher(query, consume, routing=RoutingControl.READ, **params):
+    """
+    Execute a Cypher query and hand the live result to `consume`.
+    
+    `consume` iterates records as the driver fetches them, inside the
+    transaction, and its return value is returned. It may be re-run if the
+    transaction is retried, so it should build its output from scratch.
+    """
+    return driver.execute_query(
+        query,
+        params,
+        routing_=routing,
+        database_=NEO4J_DATABASE,
+        result_transformer_=consume
+    )
+
+
+def stream_cypher(query, row_fn, routing=RoutingControl.READ, **params):
+    """
+    Execute a Cypher query, converting each row as it streams in.
+    
+    `row_fn` receives every record positionally inside the transaction, so
+    callers get their final rows in one pass without an intermediate list
+    of records.
+    """
+    return consume_cypher(query, lambda result: [row_fn(record) for record in result], routing, **params)
+
+
+def run_scenario_query(query, consume, **params):
+    """Execute scenario-specific Cypher query, streaming it into `consume`."""
+    return consume_cypher(query, consume, **params)
+
 
+def partition_rows(result):
+    """Group tagged (part, row) records by part as they stream in."""
+    parts = defaultdict(list)
+    for part, row in result:
+        parts[part].append(row)
+    return parts
 
-def get_relationships_between_nodes(node_ids):
-    """Fetch all relationships between a set of nodes."""
-    if not node_ids:
+
+def get_relationships_between_nodes(element_ids):
+    """
+    Fetch all relationships between a set of nodes in a single round trip.
+    
+    Each node is located by element id seek (UNWIND) rather than scanning
+    every node for a matching `id` property.
+    """
+    if not element_ids:
         return []
-    with driver.session() as session:
-        result = session.run("""
-            MATCH (a)-[r]->(b)
-            WHERE a.id IN $ids AND b.id IN $ids
-            RETURN a as source, r, b as target
-        """, ids=list(node_ids))
-        return list(result)
+    return run_cypher(CYPHER_RELATIONSHIPS_BETWEEN, ids=list(element_ids))
+
+
+def record_element_ids(records):
+    """Collect the element ids of every node in a list of records."""
+    node_ids = set()
+    for record in records:
+        for value in record.values():
+            if isinstance(value, Neo4jNode):
+                node_ids.add(value.element_id)
+    return node_ids
+
+
+@st.cache_resource(ttl=3600, max_entries=16, show_spinner=False)
+def run_scenario_batch(scenario_id):
+    """
+    Run every step of a scenario in at most three round trips, memoized.
+    
+    All step queries and the anchor prefixes they share are combined at
+    build time into one UNION ALL query whose rows are tagged with the part
+    they belong to. Steps that extend an anchor follow in a second batch
+    once the anchor's element ids are known, and relationships among all
+    returned nodes come back in a third. Returns per-step record tuples plus
+    the shared relationship records. Cleared by invalidate_graph_caches()
+    after every write to the graph.
+    """
+    scenario = SCENARIOS[scenario_id]
+    # Checked per query rather than on the batch, where one limited branch
+    # would hide an unlimited one
+    for query in (*scenario['hop_queries'], *scenario['anchors'].values()):
+        if not is_bounded(query):
+            raise ValueError(f"Unbounded scenario query (scenario {scenario_id}): {query.splitlines()[0]}")
+    
+    parts = run_scenario_query(scenario['batch_query'], partition_rows)
+    
+    if scenario['delta_batch_query'] is not None:
+        anchor_ids = {
+            f"{name}_ids": list(record_element_ids(parts[name]))
+            for name in scenario['anchors']
+        }
+        parts.update(run_scenario_query(scenario['delta_batch_query'], partition_rows, **anchor_ids))
+    
+    hops = []
+    for depth, anchor in enumerate(scenario['hop_anchors']):
+        records = parts[str(depth)]
+        if anchor is not None:
+            records = parts[anchor] + records
+        hops.append(tuple(records))
+    
+    all_ids = record_element_ids(record for records in hops for record in records)
+    return tuple(hops), tuple(get_relationships_between_nodes(all_ids))
+
+
+def run_hop(scenario_id, depth):
+    """
+    Get one scenario step's subgraph as (source, r, target) records.
+    
+    Sliced out of the scenario-wide batch, so stepping through a scenario
+    never goes back to the database. Relationships among the step's nodes
+    come first; nodes with no relationship in the step follow as records
+    with a null `r`, so each node reaches create_graph_visualization once
+    instead of once per query row it appeared in.
+    """
+    hops, rel_records = run_scenario_batch(scenario_id)
+    
+    step_nodes = {}
+    for record in hops[depth]:
+        for value in record.values():
+            if isinstance(value, Neo4jNode):
+                step_nodes.setdefault(value.element_id, value)
+    if not step_nodes:
+        return ()
+    
+    linked = set()
+    step_records = []
+    for rel in rel_records:
+        source_id, target_id = rel['source'].element_id, rel['target'].element_id
+        if source_id in step_nodes and target_id in step_nodes:
+            step_records.append(rel)
+            linked.add(source_id)
+            linked.add(target_id)
+    
+    step_records.extend(
+        {'source': node, 'r': None, 'target': None}
+        for element_id, node in step_nodes.items()
+        if element_id not in linked
+    )
+    return tuple(step_records)
+
+
+def build_hop_graph(scenario_id, depth):
+    """Build the Node/Edge lists for one scenario step."""
+    records = run_hop(scenario_id, depth)
+    if not records:
+        return [], []
+    
+    root_id = SCENARIOS[scenario_id]['starting_entity'][1]
+    nodes, edges = create_graph_visualization(records, root_id)
+    apply_layout(nodes, edges)
+    return nodes, edges
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_scenario_graphs(scenario_id, query_hashes):
+    """
+    Fetch and build the graphs for every step of a scenario.
+    
+    Every step's query goes to the database in one batch (see
+    run_scenario_batch), so the first load costs a few round trips rather
+    than several per step. Cached in memory for an hour, so changes made to
+    the database outside the app are picked up; the query digests are part
+    of the key, so editing a scenario invalidates its entry. Cleared by the
+    admin Refresh button and whenever the data is regenerated or wiped.
+    """
+    return [build_hop_graph(scenario_id, depth) for depth in range(len(query_hashes))]
+
+
+def invalidate_graph_caches():
+    """Drop every cached query result and built graph after a write to the graph."""
+    run_scenario_batch.clear()
+    fetch_scenario_graphs.clear()
+    get_database_stats.clear()
+    get_entity_types.clear()
+    get_entities_by_type.clear()
+    get_neighborhood.clear()
 
 
+def load_scenario_graphs(scenario_id):
+    """
+    Get the cached per-step graphs for a scenario.
+    
+    Falls back to the offline snapshot when Neo4j is unavailable.
+    """
+    if OFFLINE:
+        return load_snapshot()[scenario_id]
+    
+    query_hashes = tuple(SCENARIOS[scenario_id]['hop_query_hashes'])
+    try:
+        return fetch_scenario_graphs(scenario_id, query_hashes)
+    except ServiceUnavailable:
+        snapshot = load_snapshot()
+        if scenario_id in snapshot:
+            return snapshot[scenario_id]
+        raise
+
+
+def save_snapshot():
+    """Write every scenario's live graphs to the offline snapshot file."""
+    snapshot = {scenario_id: load_scenario_graphs(scenario_id) for scenario_id in SCENARIOS}
+    tmp_path = SNAPSHOT_PATH + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, SNAPSHOT_PATH)
+    load_snapshot.clear()
+
+
+# Read-only lookups below change only when the admin regenerates or clears
+# the data (which invalidates them); the TTL covers edits made outside the app
+@st.cache_data(ttl=300, show_spinner=False)
 def get_database_stats():
     """Retrieve database statistics for admin dashboard."""
-    with driver.session() as session:
-        stats = {}
-        
-        result = session.run("MATCH (n) RETURN count(n) as count").single()
-        stats['total_nodes'] = result['count'] if result else 0
-        
-        result = session.run("MATCH ()-[r]->() RETURN count(r) as count").single()
-        stats['total_relationships'] = result['count'] if result else 0
-        
-        result = session.run("MATCH (c:Claim) RETURN count(c) as count").single()
-        stats['claims'] = result['count'] if result else 0
-        
-        result = session.run("MATCH (c:Claim {is_fraud: true}) RETURN count(c) as count").single()
-        stats['fraud_claims'] = result['count'] if result else 0
-        
-        return stats
+    return dict(run_cypher(CYPHER_DATABASE_STATS)[0])
 
 
+@st.cache_data(ttl=300, show_spinner=False)
 def get_entity_types():
     """Get all entity types present in database."""
-    with driver.session() as session:
-        result = session.run("CALL db.labels()")
-        return sorted([r[0] for r in result])
+    return sorted(stream_cypher("CALL db.labels()", lambda r: r[0]))
+
 
+def label_query(template, label, **fields):
+    """
+    Format a per-label query template for a label present in the database.
+    
+    A label passed as a parameter can't use the label's indexes, so labels
+    are interpolated instead. Accepting only known labels (and depths up to
+    MAX_EXPLORE_HOPS) keeps the number of distinct query strings, and so
+    Neo4j's plan cache entries, bounded to one per label and depth.
+    """
+    if label not in get_entity_types():
+        raise ValueError(f"Unknown entity type: {label!r}")
+    return template.format(label=label, **fields)
 
+
+@st.cache_data(ttl=300, show_spinner=False)
 def get_entities_by_type(entity_type):
     """Get all entities of a specific type."""
-    with driver.session() as session:
-        result = session.run(f"""
-            MATCH (n:{entity_type})
-            RETURN n.id AS id, n.name AS name, n.number as number, n.street as street
-            ORDER BY n.name, n.number
-            LIMIT 500
-        """)
-        entities = []
-        for r in result:
-            display = r['name'] or r['number'] or r['street'] or r['id']
-            entities.append((r['id'], display))
-        return entities
+    # Rows are (id, display name); the display fallback happens in Cypher
+    return stream_cypher(label_query(CYPHER_ENTITIES_BY_TYPE, entity_type), tuple, limit=500)
 
 
+@st.cache_resource(ttl=300, max_entries=64, show_spinner=False)
 def get_neighborhood(entity_type, entity_id, hops, entity_filters=None):
     """
     Get neighborhood of an entity with optional type filtering.
     
-    Returns both nodes and relationship information.
+    Returns both nodes and relationship information from a single query.
+    The driver records are shared read-only across sessions rather than
+    pickled, so this uses the resource cache.
+    """
+    hops = int(hops)
+    if not 1 <= hops <= MAX_EXPLORE_HOPS:
+        raise ValueError(f"Depth must be between 1 and {MAX_EXPLORE_HOPS}, got {hops}")
+    query = label_query(CYPHER_NEIGHBORHOOD, entity_type, hops=hops)
+    filters = sorted(entity_filters) if entity_filters else None
+    return run_cypher(query, entity_id=entity_id, filters=filters, label_priority=LABEL_PRIORITY)
+
+
+# Scenario integrity checks: (scenario, check, expected, query returning `value`)
+VERIFICATION_CHECKS = [
+    ("1: Captive Medical Mill", "Webb client count", 47, """
+        MATCH (a:Attorney {name: 'J. Marcus Webb'})<-[:REPRESENTED_BY]-(c:Claim)
+        RETURN count(c) as value
+    """),
+    ("2: Identity Web", "Shared phone users", 5, """
+        MATCH (ph:Phone {number: '555-847-2931'})<-[:HAS_PHONE]-(p:Person)
+        RETURN count(p) as value
+    """),
+    ("3: The Audit (Fraud)", "Sunrise claim count", 28, """
+        MATCH (p:Provider {name: 'Sunrise Wellness Clinic'})<-[:TREATED_AT]-(c:Claim)
+        RETURN count(c) as value
+    """),
+    ("3: The Audit (Legitimate)", "City General claim count", 32, """
+        MATCH (p:Provider {name: 'City General Emergency Room'})<-[:TREATED_AT]-(c:Claim)
+        RETURN count(c) as value
+    """),
+    ("4: The Closed Case", "Bernard's fraud flag", True, """
+        MATCH (p:Provider {name: "Dr. Bernard's Auto Injury Center"})
+        RETURN coalesce(p.is_fraud, false) as value
+    """),
+    ("4: The Closed Case", "Chen active clients", 34, """
+        MATCH (a:Attorney {name: 'Michael Chen'})<-[:REPRESENTED_BY]-(c:Claim)
+        WHERE c.is_fraud = false
+        RETURN count(c) as value
+    """),
+]
+
+
+def verification_query(checks):
+    """
+    Combine the integrity checks into one statement returning one record.
+    
+    Each check becomes a column `check_<i>`. The inner collect() keeps a
+    check that matches nothing (e.g. a missing provider) from dropping the
+    whole row; its column is simply null.
     """
-    with driver.session() as session:
-        query = f"""
-            MATCH path = (root:{entity_type} {{id: $entity_id}})-[*1..{hops}]-(connected)
-            UNWIND nodes(path) as n
-            RETURN DISTINCT n
-        """
-        result = session.run(query, entity_id=entity_id)
-        return list(result)
+    parts = []
+    for i, (_, _, _, query) in enumerate(checks):
+        body = textwrap.indent(textwrap.dedent(query).strip(), "        ")
+        parts.append(f"CALL {{\n    CALL {{\n{body}\n    }}\n    RETURN collect(value)[0] AS check_{i}\n}}")
+    columns = ", ".join(f"check_{i}" for i in range(len(checks)))
+    return "\n".join(parts) + f"\nRETURN {columns}"
+
+
+VERIFICATION_QUERY = verification_query(VERIFICATION_CHECKS)
 
 
 def verify_scenarios():
-    """Verify scenario data integrity and return results."""
-    results = []
+    """
+    Verify scenario data integrity and return results as a DataFrame.
     
-    with driver.session() as session:
-        # Scenario 1: Webb
-        result = session.run("""
-            MATCH (a:Attorney {name: 'J. Marcus Webb'})<-[:REPRESENTED_BY]-(c:Claim)
-            RETURN count(c) as count
-        """).single()
-        count = result['count'] if result else 0
-        results.append({
-            "scenario": "1: Captive Medical Mill",
-            "check": "Webb client count",
-            "expected": 47,
-            "actual": count,
-            "status": "✅" if count == 47 else "❌"
-        })
-        
-        # Scenario 2: Phone
-        result = session.run("""
-            MATCH (ph:Phone {number: '555-847-2931'})<-[:HAS_PHONE]-(p:Person)
-            RETURN count(p) as count
-        """).single()
-        count = result['count'] if result else 0
-        results.append({
-            "scenario": "2: Identity Web",
-            "check": "Shared phone users",
-            "expected": 5,
-            "actual": count,
-            "status": "✅" if count == 5 else "❌"
-        })
-        
-        # Scenario 3a: Sunrise
-        result = session.run("""
-            MATCH (p:Provider {name: 'Sunrise Wellness Clinic'})<-[:TREATED_AT]-(c:Claim)
-            RETURN count(c) as count
-        """).single()
-        count = result['count'] if result else 0
-        results.append({
-            "scenario": "3: The Audit (Fraud)",
-            "check": "Sunrise claim count",
-            "expected": 28,
-            "actual": count,
-            "status": "✅" if count == 28 else "❌"
-        })
-        
-        # Scenario 3b: City General
-        result = session.run("""
-            MATCH (p:Provider {name: 'City General Emergency Room'})<-[:TREATED_AT]-(c:Claim)
-            RETURN count(c) as count
-        """).single()
-        count = result['count'] if result else 0
-        results.append({
-            "scenario": "3: The Audit (Legitimate)",
-            "check": "City General claim count",
-            "expected": 32,
-            "actual": count,
-            "status": "✅" if count == 32 else "❌"
-        })
-        
-        # Scenario 4: Bernard's fraud flag
-        result = session.run("""
-            MATCH (p:Provider {name: "Dr. Bernard's Auto Injury Center"})
-            RETURN p.is_fraud as is_fraud
-        """).single()
-        is_fraud = result['is_fraud'] if result else False
-        results.append({
-            "scenario": "4: The Closed Case",
-            "check": "Bernard's fraud flag",
-            "expected": "True",
-            "actual": str(is_fraud),
-            "status": "✅" if is_fraud else "❌"
-        })
-        
-        # Scenario 4: Chen active clients
-        result = session.run("""
-            MATCH (a:Attorney {name: 'Michael Chen'})<-[:REPRESENTED_BY]-(c:Claim)
-            WHERE c.is_fraud = false
-            RETURN count(c) as count
-        """).single()
-        count = result['count'] if result else 0
+    Every check runs as a subquery of one statement, so the whole
+    verification costs a single round trip and one pulled record.
+    """
+    record = run_cypher(VERIFICATION_QUERY)[0]
+    
+    results = []
+    for i, (scenario, check, expected, _) in enumerate(VERIFICATION_CHECKS):
+        actual = record[f"check_{i}"]
+        if actual is None:
+            actual = False if isinstance(expected, bool) else 0
         results.append({
-            "scenario": "4: The Closed Case",
-            "check": "Chen active clients",
-            "expected": 34,
-            "actual": count,
-            "status": "✅" if count == 34 else "❌"
+            "scenario": scenario,
+            "check": check,
+            "result": f"{actual}/{expected}",
+            "status": "✅" if actual == expected else "❌"
         })
     
-    return results
+    return pd.DataFrame(results)
 
 # =============================================================================
 # PAGE: SCENARIO WALKTHROUGH
@@ -1060,9 +1281,9 @@ def render_scenario_walkthrough():
         st.rerun()
     
     scenario = SCENARIOS[selected]
-    max_hop = len(scenario['hops']) - 1
+    max_hop = len(scenario['hop_titles']) - 1
     current_hop = st.session_state.current_hop
-    hop = scenario['hops'][current_hop]
+    hop = hop_at(scenario, current_hop)
     
     # Scenario header
     st.markdown(f"### {scenario['icon']} {scenario['title']}")
@@ -1079,7 +1300,7 @@ def render_scenario_walkthrough():
     
     with col_left:
         # Navigation controls
-        st.markdown(f"**Step {current_hop + 1} of {max_hop + 1}:** {hop['title']}")
+        st.markdown(f"**Step {current_hop + 1} of {max_hop + 1}:** {hop.title}")
         
         # Progress bar
         st.progress((current_hop + 1) / (max_hop + 1))
@@ -1102,17 +1323,17 @@ def render_scenario_walkthrough():
         
         # Current step narrative
         st.markdown("**Current Analysis:**")
-        st.info(hop['narrative'])
+        st.info(hop.narrative)
         
         # Discovery highlight
-        if hop['discovery']:
-            st.success(f"**Key Finding:** {hop['discovery']}")
+        if hop.discovery:
+            st.success(f"**Key Finding:** {hop.discovery}")
         
         # Comparison panels
         st.markdown("")
         
         with st.expander("🐌 Traditional Investigation Method", expanded=False):
-            st.markdown(hop['traditional'])
+            st.markdown(hop.traditional)
         
         # Conclusion panel (final step only)
         if current_hop == max_hop:
@@ -1139,41 +1360,31 @@ def render_scenario_walkthrough():
         # Graph visualization
         st.markdown("**Network Visualization**")
         
+        if generation_running():
+            st.info("⏳ Scenario data is being regenerated. The graph loads once generation finishes.")
+            return
+        
         timer = PerformanceTimer()
         timer.start()
         
         try:
-            records = run_scenario_query(hop['query'])
-            
-            # Extract node IDs and fetch relationships
-            node_ids = set()
-            for record in records:
-                for key, value in dict(record).items():
-                    if value and hasattr(value, 'labels'):
-                        props = dict(value)
-                        if props.get('id'):
-                            node_ids.add(props['id'])
-            
-            rel_records = get_relationships_between_nodes(node_ids)
+            nodes, edges = load_scenario_graphs(selected)[current_hop]
             timer.stop()
             
-            if records:
-                # Combine node records with relationship records
-                nodes, edges = create_graph_visualization(rel_records + records, scenario['starting_entity'][1])
+            if nodes:
                 timer.set_counts(len(nodes), len(edges))
                 
                 # Compact metrics row
                 m1, m2, m3 = st.columns(3)
                 with m1:
-                    st.metric("Query", f"{timer.duration_ms}ms")
+                    st.metric("Query", f"{timer.duration_ms:.2f}ms")
                 with m2:
                     st.metric("Entities", len(nodes))
                 with m3:
                     st.metric("Connections", len(edges))
                 
                 # Render graph
-                config = get_graph_config(width=650, height=450)
-                agraph(nodes, edges, config)
+                render_graph(nodes, edges, width=650, height=450)
                 
             else:
                 st.warning("No data available. Please generate demo data in the Admin panel.")
@@ -1191,6 +1402,14 @@ def render_free_exploration():
     st.title("🔍 Network Exploration")
     st.caption("Investigate any entity's connections across the fraud network database")
     
+    if OFFLINE:
+        st.info("Network exploration needs a live Neo4j connection.")
+        return
+    
+    if generation_running():
+        st.info("⏳ Scenario data is being regenerated. Exploration resumes once generation finishes.")
+        return
+    
     # Get available entity types
     entity_types = get_entity_types()
     
@@ -1218,31 +1437,21 @@ def render_free_exploration():
         )
     
     with col3:
-        hops = st.number_input("Depth", 1, 5, 2, key="explore_hops")
+        hops = st.number_input("Depth", 1, MAX_EXPLORE_HOPS, 2, key="explore_hops")
     
-    # Entity type filters
-    st.markdown("**Filter Visible Entity Types:**")
-    
-    filter_cols = st.columns(6)
+    # Entity type filters: one widget, so changing the selection costs one
+    # rerun rather than one per toggled checkbox
     default_filters = {"Claim", "Claimant", "Provider", "Attorney", "Address", "Phone", "Witness", "Employee"}
-    
-    # Initialize filter state
-    if 'entity_filters' not in st.session_state:
-        st.session_state.entity_filters = default_filters.copy()
-    
     available_filters = ["Claim", "Claimant", "Provider", "Attorney", "Address", "Phone", "Witness", "Employee", "Adjuster", "Location"]
     
-    active_filters = set()
-    for i, filter_type in enumerate(available_filters):
-        with filter_cols[i % 6]:
-            if st.checkbox(
-                filter_type, 
-                value=filter_type in st.session_state.entity_filters,
-                key=f"filter_{filter_type}"
-            ):
-                active_filters.add(filter_type)
+    active_filters = st.multiselect(
+        "**Filter Visible Entity Types:**",
+        available_filters,
+        default=[f for f in available_filters if f in default_filters],
+        key="explore_filters"
+    )
     
-    st.session_state.entity_filters = active_filters if active_filters else default_filters
+    st.session_state.entity_filters = set(active_filters) if active_filters else default_filters
     
     # Selected entity display
     st.markdown(f"**Selected:** `{selected_entity[1]}` ({selected_type})")
@@ -1253,29 +1462,30 @@ def render_free_exploration():
         timer.start()
         
         with st.spinner("Mapping network connections..."):
-            records = get_neighborhood(selected_type, selected_entity[0], hops)
+            records = get_neighborhood(
+                selected_type,
+                selected_entity[0],
+                hops,
+                frozenset(st.session_state.entity_filters)
+            )
             timer.stop()
             
             if records:
-                nodes, edges = create_graph_visualization(
-                    records, 
-                    selected_entity[0],
-                    st.session_state.entity_filters
-                )
+                nodes, edges = create_graph_visualization(records, selected_entity[0])
+                apply_layout(nodes, edges)
                 timer.set_counts(len(nodes), len(edges))
                 
-                st.session_state.explore_nodes = nodes
-                st.session_state.explore_edges = edges
+                st.session_state.explore_graph = GraphTable(nodes, edges)
                 st.session_state.explore_timer = timer
                 st.session_state.explore_entity_name = selected_entity[1]
+                st.session_state.pop('explore_expanded', None)
             else:
                 st.warning("No connections found for this entity at the specified depth.")
-                st.session_state.explore_nodes = None
+                st.session_state.explore_graph = None
     
     # Render stored graph
-    if st.session_state.get('explore_nodes'):
-        nodes = st.session_state.explore_nodes
-        edges = st.session_state.explore_edges
+    graph = st.session_state.get('explore_graph')
+    if graph:
         timer = st.session_state.explore_timer
         
         st.divider()
@@ -1284,51 +1494,166 @@ def render_free_exploration():
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Query Time", f"{timer.duration_ms}ms")
+            st.metric("Query Time", f"{timer.duration_ms:.2f}ms")
         with col2:
-            st.metric("Entities", len(nodes))
+            st.metric("Entities", len(graph))
         with col3:
-            st.metric("Connections", len(edges))
+            st.metric("Connections", graph.edge_count)
         with col4:
-            fraud_count = sum(1 for n in nodes if 'CONFIRMED FRAUD' in (n.title or ''))
-            st.metric("Fraud Flags", fraud_count)
+            st.metric("Fraud Flags", graph.fraud_count)
         
-        config = get_graph_config(width=1100, height=550)
-        agraph(nodes, edges, config)
+        nodes, edges = graph.to_graph()
+        
+        # Level of detail: large networks start with leaf groups collapsed
+        expanded = st.session_state.get('explore_expanded', [])
+        view_nodes, view_edges, groups = collapse_leaves(nodes, edges, expanded=expanded)
+        if groups or expanded:
+            names = {node.id: node.label for node in nodes}
+            st.multiselect(
+                "Expand collapsed groups",
+                sorted(set(groups) | set(expanded), key=lambda parent_id: names[parent_id]),
+                format_func=lambda parent_id: (
+                    f"{groups[parent_id][0]} (+{groups[parent_id][1]})"
+                    if parent_id in groups else names[parent_id]
+                ),
+                key="explore_expanded"
+            )
+        
+        render_graph(view_nodes, view_edges, width=1100, height=550)
 
 # =============================================================================
 # PAGE: ADMIN
 # =============================================================================
 
+@st.cache_resource
+def get_generation_flag():
+    """
+    Process-wide event, set while a generation worker is writing.
+    
+    Session state only reaches the session that started the run; pages in
+    every session check this so they never cache a half-written graph.
+    """
+    return Event()
+
+
+def generation_running():
+    """Whether a data generation is writing to the database, from any session."""
+    return get_generation_flag().is_set()
+
+
+def start_generation():
+    """
+    Generate the demo data on a worker thread.
+    
+    The worker never touches Streamlit; it reports progress, the returned
+    stats or the exception through a queue that render_generation_progress
+    drains. The generator is built here because it reads st.secrets, and
+    it borrows the app's pooled driver rather than opening its own. The
+    worker clears the graph caches itself when it ends, so they are dropped
+    even if nobody is left on the Admin page to see it finish.
+    """
+    from scenario_data_generator import ScenarioDataGenerator
+    
+    generator = ScenarioDataGenerator(driver, NEO4J_DATABASE)
+    updates = queue.Queue()
+    flag = get_generation_flag()
+    
+    def work():
+        try:
+            stats = generator.generate_all_demo_data(
+                progress=lambda fraction, step: updates.put(("progress", fraction, step))
+            )
+            updates.put(("done", stats))
+        except Exception as e:
+            updates.put(("error", e))
+        finally:
+            generator.close()
+            # Even a failed run has written (or cleared) data
+            invalidate_graph_caches()
+            flag.clear()
+    
+    flag.set()
+    Thread(target=work, daemon=True).start()
+    st.session_state.generation = {
+        "updates": updates,
+        "fraction": 0.0,
+        "step": "Initializing data generation...",
+        "steps": [],
+        "stats": None,
+        "error": None,
+    }
+
+
+def render_generation_steps(steps):
+    """List finished generation steps as one markdown element."""
+    if steps:
+        st.markdown("\n".join(f"- ✓ {step}" for step in steps))
+
+
+@st.fragment(run_every=0.5)
+def render_generation_progress():
+    """Poll the generation worker, then rerun the whole page once it finishes."""
+    generation = st.session_state.generation
+    updates = generation["updates"]
+    while not updates.empty():
+        kind, *payload = updates.get_nowait()
+        if kind == "progress":
+            generation["fraction"], generation["step"] = payload
+            generation["steps"].append(generation["step"])
+        elif kind == "done":
+            generation["stats"] = payload[0]
+        else:
+            generation["error"] = payload[0]
+    
+    if generation["stats"] is None and generation["error"] is None:
+        with st.status(generation["step"], expanded=True):
+            st.progress(generation["fraction"])
+            render_generation_steps(generation["steps"][:-1])
+        return
+    
+    st.rerun()
+
+
+def render_database_stats(stats):
+    """Render the database status metrics from a get_database_stats() dict."""
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Nodes", f"{stats['total_nodes']:,}")
+    with col2:
+        st.metric("Relationships", f"{stats['total_relationships']:,}")
+    with col3:
+        st.metric("Claims", f"{stats['claims']:,}")
+    with col4:
+        st.metric("Fraud Cases", f"{stats['fraud_claims']:,}")
+    
+    if stats['total_nodes'] == 0:
+        st.info("📭 Database is empty. Generate scenario data below to begin.")
+
+
 def render_admin():
     """Render the administration panel."""
     
     st.title("⚙️ Administration")
     st.caption("Database management and scenario data generation")
     
+    if OFFLINE:
+        st.info("Administration needs a live Neo4j connection.")
+        return
+    
     # Database Statistics
     st.markdown("### 📊 Database Status")
     
     col_header, col_refresh = st.columns([5, 1])
     with col_refresh:
         if st.button("🔄 Refresh", key="refresh_stats"):
+            invalidate_graph_caches()
             st.rerun()
     
+    # A placeholder, so actions further down can redraw the metrics in place
+    stats_panel = st.empty()
     try:
-        stats = get_database_stats()
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Total Nodes", f"{stats['total_nodes']:,}")
-        with col2:
-            st.metric("Relationships", f"{stats['total_relationships']:,}")
-        with col3:
-            st.metric("Claims", f"{stats['claims']:,}")
-        with col4:
-            st.metric("Fraud Cases", f"{stats['fraud_claims']:,}")
-        
-        if stats['total_nodes'] == 0:
-            st.info("📭 Database is empty. Generate scenario data below to begin.")
+        with stats_panel.container():
+            render_database_stats(get_database_stats())
     
     except Exception as e:
         st.error(f"Unable to retrieve database statistics: {e}")
@@ -1339,36 +1664,45 @@ def render_admin():
     st.markdown("### 🚀 Generate Scenario Data")
     st.warning("⚠️ This operation will **clear all existing data** and generate fresh scenario datasets including background data.")
     
-    if st.button("Generate All Scenario Data", type="primary", use_container_width=True):
-        progress_container = st.empty()
-        status_container = st.empty()
-        
-        with st.spinner("Initializing data generation..."):
-            try:
-                generator = ScenarioDataGenerator()
-                gen_stats = generator.generate_all_demo_data()
-                generator.close()
-                
-                status_container.success("✅ Scenario data generated successfully!")
-                st.balloons()
-                
-                # Show generation summary
-                st.markdown("**Generation Summary:**")
-                summary_cols = st.columns(3)
-                
-                items = list(gen_stats.items())
-                for i, (key, value) in enumerate(items):
-                    with summary_cols[i % 3]:
-                        label = key.replace('_', ' ').title()
-                        st.metric(label, f"{value} claims")
-                
-                st.info("👉 Navigate to **Scenario Walkthrough** to begin the demonstration.")
-                
-                time.sleep(1.5)
-                st.rerun()
-                
-            except Exception as e:
-                st.error(f"Data generation failed: {e}")
+    generation = st.session_state.get('generation')
+    running = generation is not None and generation["stats"] is None and generation["error"] is None
+    
+    if st.button(
+        "Generate All Scenario Data", type="primary", use_container_width=True,
+        disabled=running or generation_running()
+    ):
+        try:
+            start_generation()
+            running = True
+        except Exception as e:
+            st.error(f"Data generation failed: {e}")
+    
+    if running:
+        render_generation_progress()
+    elif generation is not None:
+        del st.session_state.generation
+        if generation["error"] is not None:
+            with st.status("Data generation failed", state="error", expanded=True):
+                render_generation_steps(generation["steps"][:-1])
+                st.error(f"{generation['step']}: {generation['error']}")
+        else:
+            with st.status("✅ Scenario data generated successfully!", state="complete"):
+                render_generation_steps(generation["steps"])
+            st.balloons()
+            
+            # Show generation summary
+            st.markdown("**Generation Summary:**")
+            stats = generation["stats"]
+            st.dataframe(
+                pd.DataFrame({
+                    "Dataset": [key.replace('_', ' ').title() for key in stats],
+                    "Claims": list(stats.values()),
+                }),
+                hide_index=True,
+                use_container_width=True
+            )
+            
+            st.info("👉 Navigate to **Scenario Walkthrough** to begin the demonstration.")
     
     st.divider()
     
@@ -1384,18 +1718,9 @@ def render_admin():
                 # Display as table
                 st.markdown("**Verification Results:**")
                 
-                all_passed = all(r['status'] == '✅' for r in results)
+                all_passed = (results['status'] == '✅').all()
                 
-                for r in results:
-                    col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
-                    with col1:
-                        st.text(r['scenario'])
-                    with col2:
-                        st.text(r['check'])
-                    with col3:
-                        st.text(f"{r['actual']}/{r['expected']}")
-                    with col4:
-                        st.text(r['status'])
+                st.dataframe(results, hide_index=True, use_container_width=True)
                 
                 if all_passed:
                     st.success("All verification checks passed.")
@@ -1407,6 +1732,57 @@ def render_admin():
     
     st.divider()
     
+    # Offline snapshot
+    st.markdown("### 💾 Offline Snapshot")
+    st.caption("Save the scenario walkthrough so the demo still runs if Neo4j is unreachable")
+    
+    if st.button("Save Offline Snapshot", use_container_width=True, disabled=generation_running()):
+        with st.spinner("Saving scenario snapshot..."):
+            try:
+                save_snapshot()
+                st.success(f"✅ Snapshot saved to `{os.path.basename(SNAPSHOT_PATH)}`.")
+            except Exception as e:
+                st.error(f"Failed to save snapshot: {e}")
+    
+    st.divider()
+    
+    # Schema
+    st.markdown("### 🧱 Indexes & Constraints")
+    st.caption("Replace plain id indexes from earlier versions with uniqueness constraints")
+    
+    if st.button("Migrate Legacy Indexes", use_container_width=True, disabled=generation_running()):
+        with st.spinner("Migrating indexes..."):
+            try:
+                # Re-checked, as a generation may have started since the page was drawn
+                if generation_running():
+                    raise RuntimeError("a data generation is running; try again once it finishes")
+                failures = migrate_legacy_indexes(driver, NEO4J_DATABASE)
+                # Re-ensure, so the failures shown below reflect the new schema
+                ensure_indexes.clear()
+                if failures:
+                    st.error(
+                        "Some indexes were kept (their constraints could not be created):\n"
+                        + "\n".join(f"- `{index}`: {error}" for index, error in failures)
+                    )
+                else:
+                    st.success("✅ All legacy indexes migrated.")
+            except Exception as e:
+                st.error(f"Index migration failed: {e}")
+    
+    index_failures = ensure_indexes(driver)
+    if index_failures:
+        st.warning(f"{len(index_failures)} schema statement(s) failed:")
+        st.dataframe(
+            pd.DataFrame({
+                "Statement": [statement for statement, _ in index_failures],
+                "Error": [str(error) for _, error in index_failures],
+            }),
+            hide_index=True,
+            use_container_width=True
+        )
+    
+    st.divider()
+    
     # Clear Database
     st.markdown("### 🗑️ Clear Database")
     st.caption("Remove all data from the database")
@@ -1414,16 +1790,26 @@ def render_admin():
     # Use a form to handle the confirmation properly
     with st.form("clear_form"):
         confirm = st.checkbox("I confirm I want to delete ALL data from the database")
-        submitted = st.form_submit_button("Clear All Data", type="secondary")
+        submitted = st.form_submit_button("Clear All Data", type="secondary", disabled=generation_running())
         
         if submitted:
             if confirm:
                 try:
-                    with driver.session() as session:
-                        session.run("MATCH (n) DETACH DELETE n")
-                    st.success("✅ Database cleared successfully.")
-                    time.sleep(1)
-                    st.rerun()
+                    # Re-checked, as a generation may have started since the page was drawn
+                    if generation_running():
+                        raise RuntimeError("a data generation is running; try again once it finishes")
+                    counters = clear_database()
+                    invalidate_graph_caches()
+                    st.success(
+                        f"✅ Database cleared: {counters.nodes_deleted:,} nodes and "
+                        f"{counters.relationships_deleted:,} relationships removed."
+                    )
+                    
+                    # An emptied database needs no stats query to describe it
+                    with stats_panel.container():
+                        render_database_stats(dict.fromkeys(
+                            ("total_nodes", "total_relationships", "claims", "fraud_claims"), 0
+                        ))
                 except Exception as e:
                     st.error(f"Failed to clear database: {e}")
             else:
@@ -1436,17 +1822,24 @@ def render_admin():
 st.sidebar.title("🔍 Fraud Ring Detection")
 st.sidebar.caption("Graph-Powered SIU Investigation Platform")
 
+PAGES = {
+    "🎯 Scenario Walkthrough": render_scenario_walkthrough,
+    "🔍 Network Exploration": render_free_exploration,
+    "⚙️ Administration": render_admin,
+}
+
 page = st.sidebar.radio(
     "Navigation",
-    ["🎯 Scenario Walkthrough", "🔍 Network Exploration", "⚙️ Administration"],
+    list(PAGES),
     label_visibility="collapsed"
 )
 
-st.sidebar.divider()
-
-# Legend
-st.sidebar.markdown("### Visual Legend")
+# Legend and controls, static text sent as a single sidebar element per rerun
 st.sidebar.markdown("""
+---
+
+### Visual Legend
+
 **Entity Types:**
 - 🔵 Claimants & Witnesses
 - 🟢 Adjusters & Employees
@@ -1457,29 +1850,23 @@ st.sidebar.markdown("""
 **Indicators:**
 - 🔴 Confirmed Fraud
 - ⭐ Investigation Starting Point
-""")
 
-st.sidebar.divider()
+---
+
+### Graph Controls
 
-st.sidebar.markdown("### Graph Controls")
-st.sidebar.markdown("""
 - **Scroll** — Zoom in/out
 - **Drag background** — Pan view
 - **Drag node** — Reposition
 - **Hover** — View details
 - **Click** — Select entity
-""")
 
-st.sidebar.divider()
+---
+""")
 st.sidebar.caption("© 2025 SIU Investigation Platform")
 
 # =============================================================================
 # MAIN ROUTING
 # =============================================================================
 
-if page == "🎯 Scenario Walkthrough":
-    render_scenario_walkthrough()
-elif page == "🔍 Network Exploration":
-    render_free_exploration()
-else:
-    render_admin()
\ No newline at end of file
+PAGES[page]()
\ No newline at end of file
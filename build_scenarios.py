@@ -0,0 +1,134 @@
+"""
+Build scenarios.jsonl from the authored scenario definitions.
+
+Markdown fields are dedented and stripped once here rather than by
+Streamlit on every rerun. Hop and anchor queries are dedented and stripped
+too, every UNION branch is capped at HOP_ROW_LIMIT rows, and each hop gets
+a short blake2b digest (`query_hash`) used as a compact key for caching hop
+results, so the app only has to decode and intern them. All of a
+scenario's queries are also combined into tagged UNION ALL batches so the
+app can fetch every step in a couple of round trips.
+
+Usage:
+    python build_scenarios.py
+"""
+
+import hashlib
+import json
+import textwrap
+from pathlib import Path
+
+from scenario_definitions import BUILDERS
+
+DATA_PATH = Path(__file__).with_name("scenarios.jsonl")
+
+# Upper bound on rows per hop query branch, so a hop stays predictable when
+# the demo is pointed at a production-sized graph
+HOP_ROW_LIMIT = 500
+
+
+def bound_query(query):
+    """
+    Append a LIMIT to each UNION branch that does not already have one.
+    
+    Only top-level UNION and LIMIT lines count; those inside a CALL { }
+    subquery (tracked by counting braces per line) belong to the subquery.
+    """
+    lines = []
+    branch_limited = False
+    depth = 0
+    for line in query.splitlines():
+        keyword = line.strip()
+        if depth == 0 and keyword in ("UNION", "UNION ALL"):
+            if not branch_limited:
+                lines.append(f"LIMIT {HOP_ROW_LIMIT}")
+            branch_limited = False
+        elif depth == 0 and keyword.startswith("LIMIT "):
+            branch_limited = True
+        depth += line.count("{") - line.count("}")
+        lines.append(line)
+    if not branch_limited:
+        lines.append(f"LIMIT {HOP_ROW_LIMIT}")
+    return "\n".join(lines)
+
+
+def clean_markdown(text):
+    """Dedent and strip a markdown field the way st.markdown would."""
+    if text is None:
+        return None
+    return textwrap.dedent(text).strip()
+
+
+def return_columns(query):
+    """Output column names of a query's final RETURN clause."""
+    clause = [line.strip() for line in query.splitlines() if line.strip().startswith("RETURN ")][-1]
+    # "carmen as w" -> "w"
+    return [item.split()[-1] for item in clause[len("RETURN "):].split(",")]
+
+
+def tagged_part(tag, query):
+    """Wrap a query so its rows come back as (part, row map) pairs."""
+    body = textwrap.indent(query, "    ")
+    row = ", ".join(f"{column}: {column}" for column in return_columns(query))
+    return f"CALL {{\n{body}\n}}\nRETURN '{tag}' AS part, {{{row}}} AS row"
+
+
+def batch_queries(scenario):
+    """
+    Combine a scenario's queries into at most two UNION ALL batches.
+    
+    The first holds every anchor and every unanchored hop; the second holds
+    the anchored hops, which need the anchors' element ids (passed as
+    `$<anchor>_ids`) and so cannot run until the first batch returns.
+    Rows are tagged with the hop depth or anchor name they belong to.
+    """
+    first = [tagged_part(name, query) for name, query in scenario["anchors"].items()]
+    second = []
+    for hop in scenario["hops"]:
+        if hop["anchor"] is None:
+            first.append(tagged_part(hop["depth"], hop["query"]))
+        else:
+            query = hop["query"].replace("$anchor_ids", f"${hop['anchor']}_ids")
+            second.append(tagged_part(hop["depth"], query))
+    return "\nUNION ALL\n".join(first), "\nUNION ALL\n".join(second) or None
+
+
+def normalize(scenario):
+    """Clean markdown fields, dedent and bound hop queries and attach their digests."""
+    # Hop columns are indexed by depth directly, so depths must be dense 0..N
+    depths = [hop["depth"] for hop in scenario["hops"]]
+    if depths != list(range(len(depths))):
+        raise ValueError(f"Hop depths must run 0..{len(depths) - 1} in order, got {depths}")
+    
+    scenario["trigger"] = clean_markdown(scenario["trigger"])
+    scenario["conclusion"]["key_finding"] = clean_markdown(scenario["conclusion"]["key_finding"])
+    anchors = scenario.setdefault("anchors", {})
+    for name, query in anchors.items():
+        anchors[name] = bound_query(textwrap.dedent(query).strip())
+    
+    for hop in scenario["hops"]:
+        for field in ("narrative", "traditional", "discovery"):
+            hop[field] = clean_markdown(hop[field])
+        hop.setdefault("anchor", None)
+        query = bound_query(textwrap.dedent(hop["query"]).strip())
+        hop["query"] = query
+        # An anchored hop's results depend on its anchor query too
+        key = query if hop["anchor"] is None else anchors[hop["anchor"]] + "\n" + query
+        hop["query_hash"] = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    
+    scenario["batch_query"], scenario["delta_batch_query"] = batch_queries(scenario)
+    return scenario
+
+
+def main():
+    lines = []
+    for scenario_id, build in BUILDERS.items():
+        payload = json.dumps(normalize(build()), ensure_ascii=False, separators=(",", ":"))
+        lines.append(f"{scenario_id}\t{payload}\n")
+    
+    DATA_PATH.write_text("".join(lines), encoding="utf-8")
+    print(f"Wrote {len(lines)} scenarios to {DATA_PATH.name}")
+
+
+if __name__ == "__main__":
+    main()
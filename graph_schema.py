@@ -0,0 +1,108 @@
+"""
+Shared Neo4j schema and maintenance statements.
+
+Kept apart from scenario_data_generator so the app can ensure indexes,
+migrate legacy ones and clear data without importing the generator, which it only loads when data
+generation is requested.
+"""
+
+
+# Ids (and phone numbers) are unique per entity, so they are declared as
+# uniqueness constraints, which are backed by an index of their own and
+# reject a duplicate write. Each entry is (label, property, constraint name,
+# plain index name used by earlier versions).
+UNIQUE_KEYS = [
+    ("Claim", "id", "claim_id_unique", "claim_id"),
+    ("Person", "id", "person_id_unique", "person_id"),
+    ("Provider", "id", "provider_id_unique", "provider_id"),
+    ("Attorney", "id", "attorney_id_unique", "attorney_id"),
+    ("BodyShop", "id", "bodyshop_id_unique", "bodyshop_id"),
+    ("Address", "id", "address_id_unique", "address_id"),
+    ("Phone", "id", "phone_id_unique", "phone_id"),
+    ("Phone", "number", "phone_number_unique", "phone_number"),
+    ("Location", "id", "location_id_unique", "location_id"),
+    ("Vehicle", "id", "vehicle_id_unique", "vehicle_id"),
+]
+
+
+# Lookup indexes for the id/name anchors used by scenario and explorer queries.
+# Person sub-labels still get a plain id index: the explorer anchors on the
+# exact label (e.g. :Claimant), which the :Person constraint's index cannot
+# serve. Every statement is create-if-missing, so running them is safe on any
+# database; app.py ensures them once at startup, the generator on standalone
+# runs. A constraint whose legacy plain index is still present fails here
+# until migrate_legacy_indexes() has been run.
+INDEX_STATEMENTS = [
+    f"CREATE CONSTRAINT {constraint} IF NOT EXISTS FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE"
+    for label, prop, constraint, _ in UNIQUE_KEYS
+] + [
+    "CREATE INDEX claim_is_fraud IF NOT EXISTS FOR (c:Claim) ON (c.is_fraud)",
+    "CREATE INDEX claimant_id IF NOT EXISTS FOR (p:Claimant) ON (p.id)",
+    "CREATE INDEX witness_id IF NOT EXISTS FOR (p:Witness) ON (p.id)",
+    "CREATE INDEX adjuster_id IF NOT EXISTS FOR (p:Adjuster) ON (p.id)",
+    "CREATE INDEX employee_id IF NOT EXISTS FOR (p:Employee) ON (p.id)",
+    "CREATE INDEX provider_name IF NOT EXISTS FOR (p:Provider) ON (p.name)",
+    "CREATE INDEX attorney_name IF NOT EXISTS FOR (a:Attorney) ON (a.name)",
+]
+
+
+def migrate_legacy_indexes(driver, database):
+    """
+    Replace the plain id indexes of earlier versions with their constraints.
+    
+    Neo4j will not create a uniqueness constraint while a plain index covers
+    the same label and property, so each legacy index is dropped and its
+    constraint created in one schema transaction; a failure rolls both back.
+    If the constraint is still missing afterwards (e.g. duplicate ids made
+    it fail), the plain index is recreated so lookups never lose their
+    index. Returns (index name, error) pairs for every index not migrated.
+    """
+    records, _, _ = driver.execute_query(
+        "SHOW INDEXES YIELD name, owningConstraint "
+        "WHERE owningConstraint IS NULL RETURN collect(name) AS names",
+        database_=database
+    )
+    plain_indexes = set(records[0]["names"])
+    
+    failures = []
+    with driver.session(database=database) as session:
+        for label, prop, constraint, index in UNIQUE_KEYS:
+            if index not in plain_indexes:
+                continue
+            
+            error = None
+            try:
+                with session.begin_transaction() as tx:
+                    tx.run(f"DROP INDEX {index}").consume()
+                    tx.run(
+                        f"CREATE CONSTRAINT {constraint} FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE"
+                    ).consume()
+            except Exception as e:
+                error = e
+            
+            created = session.run(
+                "SHOW CONSTRAINTS YIELD name WHERE name = $name RETURN count(*) AS n",
+                name=constraint
+            ).single()["n"]
+            if not created:
+                session.run(
+                    f"CREATE INDEX {index} IF NOT EXISTS FOR (n:{label}) ON (n.{prop})"
+                ).consume()
+                failures.append((index, error or f"constraint {constraint} was not created"))
+    
+    return failures
+
+
+# Deletes everything in batches of committed transactions so clearing a
+# large graph never holds it all in one transaction's memory. CALL ... IN
+# TRANSACTIONS needs an auto-commit transaction (session.run). Used by the
+# generator and by app.py's Clear All Data action.
+CLEAR_DATABASE_STATEMENT = """
+    MATCH (n)
+    CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS
+"""
+
+# Server-side cap (seconds) on a clear, so a stuck delete fails instead of
+# holding the session open indefinitely. Committed batches stay deleted,
+# so clearing again simply carries on.
+CLEAR_DATABASE_TIMEOUT = 120
@@ -16,10 +16,432 @@ Scenarios:
 """
 
 import random
-from datetime import datetime, timedelta
-from neo4j import GraphDatabase
+from datetime import date
+from neo4j import GraphDatabase, Query, READ_ACCESS
 import streamlit as st
 
+from graph_schema import (
+    CLEAR_DATABASE_STATEMENT, CLEAR_DATABASE_TIMEOUT, INDEX_STATEMENTS, migrate_legacy_indexes
+)
+
+
+# Lookup tables for the random field generators
+FIRST_NAMES = (
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+    "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Charles", "Karen", "Christopher", "Nancy", "Daniel", "Lisa",
+    "Matthew", "Betty", "Anthony", "Margaret", "Mark", "Sandra", "Donald", "Ashley",
+    "Steven", "Kimberly", "Paul", "Emily", "Andrew", "Donna", "Joshua", "Michelle",
+    "Kenneth", "Dorothy", "Kevin", "Carol", "Brian", "Amanda", "George", "Melissa",
+    "Edward", "Deborah", "Ronald", "Stephanie", "Timothy", "Rebecca", "Jason", "Sharon"
+)
+LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Wilson", "Anderson", "Thomas",
+    "Taylor", "Moore", "Jackson", "Martin", "Lee", "Thompson", "White", "Harris",
+    "Clark", "Lewis", "Robinson", "Walker", "Young", "Allen", "King", "Wright",
+    "Scott", "Green", "Baker", "Adams", "Nelson", "Hill", "Campbell", "Mitchell",
+    "Roberts", "Carter", "Phillips", "Evans", "Turner", "Torres", "Parker", "Collins"
+)
+STREET_NAMES = (
+    "Main Street", "Oak Avenue", "Maple Drive", "Cedar Lane", "Pine Road",
+    "Elm Street", "Washington Boulevard", "Park Avenue", "Lake Drive", "River Road",
+    "Highland Avenue", "Forest Drive", "Valley Road", "Spring Street", "Church Street",
+    "Mill Road", "School Street", "North Street", "South Avenue", "West Drive"
+)
+CITY_STATES = (
+    ("Atlanta", "GA", "30301"), ("Birmingham", "AL", "35201"),
+    ("Charlotte", "NC", "28201"), ("Nashville", "TN", "37201"),
+    ("Jacksonville", "FL", "32099"), ("Memphis", "TN", "38101"),
+    ("Richmond", "VA", "23218"), ("Columbia", "SC", "29201")
+)
+
+# Unique random phone numbers available to one generator run
+PHONE_POOL_SIZE = 4096
+
+# Fixed numbers the scenarios create. Reserved up front: background phones
+# are drawn before the scenarios run, and a random draw matching one of these
+# would violate the Phone.number constraint and abort that scenario.
+SCENARIO_PHONE_NUMBERS = ("555-847-2931", "555-847-2932", "555-991-8847")
+
+# Default rows per transaction for the background UNWIND writes
+BATCH_SIZE = 500
+
+
+# Creates one background claim network per row. Attorney, body shop and
+# witness are optional per claim: each subquery filters out rows where its
+# id is null, which leaves the outer row untouched. Rows carry an index into
+# $cities rather than their own city/state/zip strings.
+LEGITIMATE_CLAIMS_CYPHER = """
+    UNWIND $rows AS row
+    WITH row, $cities[row.city_idx] AS place
+    
+    // Create claim
+    CREATE (c:Claim {
+        id: row.claim_id,
+        name: row.claim_name,
+        claim_amount: row.amount,
+        claim_date: row.claim_date,
+        claim_type: 'Auto',
+        incident_type: row.incident_type,
+        status: 'Closed',
+        is_fraud: false
+    })
+    
+    // Create claimant
+    CREATE (p:Person:Claimant {
+        id: row.claimant_id,
+        name: row.claimant_name,
+        ssn: row.ssn,
+        role: 'Claimant'
+    })
+    
+    // Create phone
+    CREATE (ph:Phone {
+        id: row.phone_id,
+        number: row.phone_number
+    })
+    
+    // Create address
+    CREATE (addr:Address {
+        id: row.address_id,
+        street: row.street,
+        city: place[0],
+        state: place[1],
+        zip: place[2],
+        type: 'Residential'
+    })
+    
+    // Connect claimant to phone/address
+    CREATE (p)-[:HAS_PHONE]->(ph)
+    CREATE (p)-[:LIVES_AT]->(addr)
+    
+    // Connect claim
+    CREATE (c)-[:FILED_BY]->(p)
+    
+    // Connect to provider, adjuster and location
+    WITH c, row
+    MATCH (prov:Provider {id: row.provider_id})
+    MATCH (adj:Person:Adjuster {id: row.adjuster_id})
+    MATCH (loc:Location {id: row.location_id})
+    CREATE (c)-[:TREATED_AT]->(prov)
+    CREATE (c)-[:HANDLED_BY]->(adj)
+    CREATE (c)-[:OCCURRED_AT]->(loc)
+    
+    // Optional attorney
+    WITH c, row
+    CALL {
+        WITH c, row
+        WITH c, row WHERE row.attorney_id IS NOT NULL
+        MATCH (a:Attorney {id: row.attorney_id})
+        CREATE (c)-[:REPRESENTED_BY]->(a)
+    }
+    
+    // Optional body shop
+    CALL {
+        WITH c, row
+        WITH c, row WHERE row.bodyshop_id IS NOT NULL
+        MATCH (b:BodyShop {id: row.bodyshop_id})
+        CREATE (c)-[:REPAIRED_AT]->(b)
+    }
+    
+    // Optional witness
+    CALL {
+        WITH c, row
+        WITH c, row WHERE row.witness_id IS NOT NULL
+        CREATE (w:Person:Witness {
+            id: row.witness_id,
+            name: row.witness_name,
+            role: 'Witness'
+        })
+        CREATE (c)-[:WITNESSED_BY]->(w)
+    }
+"""
+
+
+# Scenario 1's fixed people, clinics and addresses, created in one statement
+# ahead of the claim loop
+SCENARIO_1_TOPOLOGY_CYPHER = """
+    // Attorney J. Marcus Webb and his wife Linda, registered agent
+    CREATE (webb:Attorney {
+        id: $webb_id,
+        name: 'J. Marcus Webb',
+        bar_number: 'BAR-789456',
+        scenario: 'scenario_1'
+    })
+    CREATE (linda:Person:Employee {
+        id: $linda_id,
+        name: 'Linda Webb',
+        role: 'Registered Agent',
+        job_title: 'Registered Agent',
+        scenario: 'scenario_1'
+    })
+    CREATE (webb)-[:MARRIED_TO]->(linda)
+    
+    // Shared business address
+    CREATE (biz:Address {
+        id: $biz_address_id,
+        street: '1847 Commerce Boulevard',
+        unit: 'Suite 200',
+        city: 'Atlanta',
+        state: 'GA',
+        zip: '30309',
+        type: 'Business',
+        scenario: 'scenario_1'
+    })
+    
+    // Two clinics at that address, Linda registered agent for both
+    CREATE (wellness:Provider {
+        id: $wellness_id,
+        name: 'Wellness Partners Medical',
+        license: 'MED-S1-001',
+        opened_date: '2024-01-15',
+        status: 'Active',
+        scenario: 'scenario_1'
+    })
+    CREATE (peak:Provider {
+        id: $peak_id,
+        name: 'Peak Recovery Clinic',
+        license: 'MED-S1-002',
+        opened_date: '2024-04-01',
+        status: 'Active',
+        scenario: 'scenario_1'
+    })
+    CREATE (wellness)-[:LOCATED_AT]->(biz)
+    CREATE (peak)-[:LOCATED_AT]->(biz)
+    CREATE (wellness)-[:REGISTERED_AGENT]->(linda)
+    CREATE (peak)-[:REGISTERED_AGENT]->(linda)
+    
+    // Employees sharing a home address
+    CREATE (home:Address {
+        id: $home_address_id,
+        street: '445 Maple Street',
+        unit: 'Apt 12',
+        city: 'Atlanta',
+        state: 'GA',
+        zip: '30312',
+        type: 'Residential',
+        scenario: 'scenario_1'
+    })
+    
+    // James Rivera - Billing Manager at Wellness
+    CREATE (james:Person:Employee {
+        id: $james_id,
+        name: 'James Rivera',
+        role: 'Employee',
+        job_title: 'Billing Manager',
+        scenario: 'scenario_1'
+    })
+    CREATE (james)-[:LIVES_AT]->(home)
+    CREATE (wellness)-[:EMPLOYS]->(james)
+    
+    // Maria Santos - Patient Coordinator at Peak + Paralegal at Webb's
+    CREATE (maria:Person:Employee:Witness {
+        id: $maria_id,
+        name: 'Maria Santos',
+        role: 'Employee',
+        job_title: 'Patient Coordinator / Paralegal',
+        scenario: 'scenario_1'
+    })
+    CREATE (maria)-[:LIVES_AT]->(home)
+    CREATE (peak)-[:EMPLOYS]->(maria)
+    CREATE (webb)-[:EMPLOYS]->(maria)
+"""
+
+
+# Creates Webb's 47 claims, one claimant network per row; Maria is linked
+# as witness on the rows flagged maria_witness
+SCENARIO_1_CLAIMS_CYPHER = """
+    // Webb and Maria are looked up once, not per row
+    MATCH (att:Attorney {id: $attorney_id})
+    MATCH (m:Person {id: $maria_id})
+    UNWIND $rows AS row
+    WITH att, m, row, $cities[row.city_idx] AS place
+    
+    // Create claim
+    CREATE (c:Claim {
+        id: row.claim_id,
+        name: 'Auto Claim - Soft Tissue Injury',
+        claim_amount: row.amount,
+        claim_date: row.claim_date,
+        claim_type: 'Auto',
+        incident_type: 'Rear-End Collision',
+        status: 'Open',
+        is_fraud: false,
+        scenario: 'scenario_1'
+    })
+    
+    // Create claimant
+    CREATE (p:Person:Claimant {
+        id: row.claimant_id,
+        name: row.claimant_name,
+        ssn: row.ssn,
+        role: 'Claimant',
+        scenario: 'scenario_1'
+    })
+    
+    // Create phone and address
+    CREATE (ph:Phone {id: row.phone_id, number: row.phone_number})
+    CREATE (addr:Address {
+        id: row.address_id,
+        street: row.street,
+        city: place[0],
+        state: place[1],
+        zip: place[2],
+        type: 'Residential'
+    })
+    
+    CREATE (p)-[:HAS_PHONE]->(ph)
+    CREATE (p)-[:LIVES_AT]->(addr)
+    CREATE (c)-[:FILED_BY]->(p)
+    
+    // Connect to Webb, provider, adjuster and location
+    WITH c, row, att, m
+    MATCH (prov:Provider {id: row.provider_id})
+    MATCH (adj:Person:Adjuster {id: row.adjuster_id})
+    MATCH (loc:Location {id: row.location_id})
+    CREATE (c)-[:REPRESENTED_BY]->(att)
+    CREATE (c)-[:TREATED_AT]->(prov)
+    CREATE (c)-[:HANDLED_BY]->(adj)
+    CREATE (c)-[:OCCURRED_AT]->(loc)
+    
+    // Maria as witness
+    WITH c, row, m
+    CALL {
+        WITH c, row, m
+        WITH c, row, m WHERE row.maria_witness
+        CREATE (c)-[:WITNESSED_BY]->(m)
+    }
+"""
+
+
+# Creates one claim and its claimant per row, for the scenarios whose
+# claimants mix shared and per-claimant identifiers. A row with a
+# phone_number gets a new Phone, otherwise it links to the existing phone_id;
+# likewise a row with a street gets a new Address, otherwise it links to
+# address_id. Attorney and witness are optional and link to existing nodes.
+# is_fraud defaults to false; fraud_type and claimant_is_fraud are only set
+# on confirmed-fraud rows (a null property is simply not stored).
+SCENARIO_CLAIMS_CYPHER = """
+    UNWIND $rows AS row
+    
+    // Create claim and claimant
+    CREATE (c:Claim {
+        id: row.claim_id,
+        name: row.claim_name,
+        claim_amount: row.amount,
+        claim_date: row.claim_date,
+        claim_type: 'Auto',
+        incident_type: row.incident_type,
+        status: row.status,
+        is_fraud: coalesce(row.is_fraud, false),
+        fraud_type: row.fraud_type,
+        scenario: row.scenario
+    })
+    CREATE (p:Person:Claimant {
+        id: row.claimant_id,
+        name: row.claimant_name,
+        ssn: row.ssn,
+        role: 'Claimant',
+        is_fraud: row.claimant_is_fraud,
+        scenario: row.scenario
+    })
+    CREATE (c)-[:FILED_BY]->(p)
+    
+    // New or shared phone
+    WITH c, p, row
+    CALL {
+        WITH p, row
+        WITH p, row WHERE row.phone_number IS NOT NULL
+        CREATE (ph:Phone {id: row.phone_id, number: row.phone_number})
+        CREATE (p)-[:HAS_PHONE]->(ph)
+    }
+    CALL {
+        WITH p, row
+        WITH p, row WHERE row.phone_number IS NULL
+        MATCH (ph:Phone {id: row.phone_id})
+        CREATE (p)-[:HAS_PHONE]->(ph)
+    }
+    
+    // New or shared address
+    CALL {
+        WITH p, row
+        WITH p, row WHERE row.street IS NOT NULL
+        WITH p, row, $cities[row.city_idx] AS place
+        CREATE (addr:Address {
+            id: row.address_id,
+            street: row.street,
+            city: place[0],
+            state: place[1],
+            zip: place[2],
+            type: 'Residential'
+        })
+        CREATE (p)-[:LIVES_AT]->(addr)
+    }
+    CALL {
+        WITH p, row
+        WITH p, row WHERE row.street IS NULL
+        MATCH (addr:Address {id: row.address_id})
+        CREATE (p)-[:LIVES_AT]->(addr)
+    }
+    
+    // Connect to provider, adjuster and location
+    WITH c, row
+    MATCH (prov:Provider {id: row.provider_id})
+    MATCH (adj:Person:Adjuster {id: row.adjuster_id})
+    MATCH (loc:Location {id: row.location_id})
+    CREATE (c)-[:TREATED_AT]->(prov)
+    CREATE (c)-[:HANDLED_BY]->(adj)
+    CREATE (c)-[:OCCURRED_AT]->(loc)
+    
+    // Optional attorney and witness
+    WITH c, row
+    CALL {
+        WITH c, row
+        WITH c, row WHERE row.attorney_id IS NOT NULL
+        MATCH (a:Attorney {id: row.attorney_id})
+        CREATE (c)-[:REPRESENTED_BY]->(a)
+    }
+    CALL {
+        WITH c, row
+        WITH c, row WHERE row.witness_id IS NOT NULL
+        MATCH (w:Person {id: row.witness_id})
+        CREATE (c)-[:WITNESSED_BY]->(w)
+    }
+"""
+
+
+# Every integrity check as one read. Each subquery aggregates, so it
+# returns exactly one row even when its entity is missing.
+INTEGRITY_CHECK_CYPHER = """
+    CALL {
+        MATCH (a:Attorney {name: 'J. Marcus Webb'})<-[:REPRESENTED_BY]-(c:Claim)
+        RETURN count(c) AS webb_count
+    }
+    CALL {
+        MATCH (ph:Phone {number: '555-847-2931'})<-[:HAS_PHONE]-(p:Person)
+        RETURN count(p) AS phone_count
+    }
+    CALL {
+        MATCH (p:Provider {name: 'Sunrise Wellness Clinic'})<-[:TREATED_AT]-(c:Claim)
+        RETURN count(c) AS sunrise_count
+    }
+    CALL {
+        MATCH (p:Provider {name: 'City General Emergency Room'})<-[:TREATED_AT]-(c:Claim)
+        RETURN count(c) AS cg_count
+    }
+    CALL {
+        MATCH (p:Provider {name: "Dr. Bernard's Auto Injury Center"})
+        RETURN coalesce(collect(p.is_fraud)[0], false) AS bernard_is_fraud
+    }
+    CALL {
+        MATCH (a:Attorney {name: 'Michael Chen'})<-[:REPRESENTED_BY]-(c:Claim)
+        WHERE c.is_fraud = false
+        RETURN count(c) AS chen_active
+    }
+    RETURN webb_count, phone_count, sunrise_count, cg_count, bernard_is_fraud, chen_active
+"""
+
 
 class ScenarioDataGenerator:
     """
@@ -31,19 +453,42 @@ class ScenarioDataGenerator:
     - Scenario signals are CLEAR outliers vs background
     """
     
-    def __init__(self):
-        """Initialize generator with Neo4j connection from Streamlit secrets."""
+    def __init__(self, driver=None, database=None, batch_size=BATCH_SIZE):
+        """
+        Initialize generator with a Neo4j connection.
+        
+        Args:
+            driver: Existing driver to reuse (e.g. the app's pooled driver);
+                left open by close(). If omitted, one is created from
+                Streamlit secrets and owned by the generator.
+            database: Database to write to; defaults to the secrets'
+                `database` entry, else "neo4j". Naming it explicitly
+                skips the home-database lookup on every session.
+            batch_size: Most rows written per transaction by the
+                background steps.
+        """
         try:
-            neo4j_uri = st.secrets["neo4j"]["uri"]
-            neo4j_user = st.secrets["neo4j"]["user"]
-            neo4j_password = st.secrets["neo4j"]["password"]
+            neo4j_secrets = st.secrets["neo4j"]
+            self.database = database or neo4j_secrets.get("database", "neo4j")
+            if driver is None:
+                driver = GraphDatabase.driver(
+                    neo4j_secrets["uri"],
+                    auth=(neo4j_secrets["user"], neo4j_secrets["password"])
+                )
+                self._owns_driver = True
+            else:
+                self._owns_driver = False
         except Exception as e:
             raise ConnectionError(f"Failed to load Neo4j secrets: {e}")
 
-        self.driver = GraphDatabase.driver(
-            neo4j_uri,
-            auth=(neo4j_user, neo4j_password)
-        )
+        self.driver = driver
+        self._session = None
+        self.batch_size = batch_size
+        
+        # Fail fast on bad credentials and pay the routing/TLS setup here
+        # rather than on the first write (a borrowed driver is already warm)
+        if self._owns_driver:
+            self.driver.verify_connectivity()
 
         # Global counters for unique IDs
         self.claim_counter = 0
@@ -65,9 +510,16 @@ class ScenarioDataGenerator:
         self.background_bodyshops = []
         
         # Track what's been used (for isolation verification)
-        self.used_phones = set()
+        self.used_phones = set(SCENARIO_PHONE_NUMBERS)
         self.used_addresses = set()
         
+        # Random phone numbers are drawn without replacement, so they never
+        # repeat; used_phones only holds the fixed scenario numbers to avoid
+        self._phone_draws = iter(random.sample(range(900 * 9000), PHONE_POOL_SIZE))
+        
+        # Read the clock once; generated dates are offsets from this day
+        self._today = date.today().toordinal()
+        
         # Generation stats
         self.stats = {
             'background_claims': 0,
@@ -78,9 +530,37 @@ class ScenarioDataGenerator:
             'scenario_4_claims': 0
         }
 
+    def session(self):
+        """
+        The generator's session, opened on first use.
+        
+        Every step runs on this one session, in order, so each sees the
+        previous step's writes (the session chains its bookmarks) without
+        a session being opened per step.
+        """
+        if self._session is None:
+            self._session = self.driver.session(database=self.database)
+        return self._session
+
     def close(self):
-        """Close Neo4j connection."""
-        self.driver.close()
+        """Close the session and Neo4j connection, unless it was borrowed."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self._owns_driver:
+            self.driver.close()
+
+    def write_rows(self, query, rows, **params):
+        """
+        Run an UNWIND $rows write in managed transactions of at most
+        batch_size rows each, so a large step never builds one oversized
+        transaction. Each chunk is retried on transient errors.
+        """
+        for start in range(0, len(rows), self.batch_size):
+            chunk = rows[start:start + self.batch_size]
+            self.session().execute_write(
+                lambda tx, chunk=chunk: tx.run(query, rows=chunk, **params).consume()
+            )
 
     # =========================================================================
     # UTILITY METHODS
@@ -88,67 +568,52 @@ class ScenarioDataGenerator:
     
     def clear_database(self):
         """Clear all existing data."""
-        with self.driver.session() as session:
-            session.run("MATCH (n) DETACH DELETE n")
-            print("✓ Database cleared")
+        self.session().run(Query(CLEAR_DATABASE_STATEMENT, timeout=CLEAR_DATABASE_TIMEOUT)).consume()
+        print("✓ Database cleared")
 
     def create_indexes(self):
-        """Create indexes for better query performance."""
-        with self.driver.session() as session:
-            indexes = [
-                "CREATE INDEX claim_id IF NOT EXISTS FOR (c:Claim) ON (c.id)",
-                "CREATE INDEX person_id IF NOT EXISTS FOR (p:Person) ON (p.id)",
-                "CREATE INDEX provider_id IF NOT EXISTS FOR (p:Provider) ON (p.id)",
-                "CREATE INDEX attorney_id IF NOT EXISTS FOR (a:Attorney) ON (a.id)",
-                "CREATE INDEX bodyshop_id IF NOT EXISTS FOR (b:BodyShop) ON (b.id)",
-                "CREATE INDEX address_id IF NOT EXISTS FOR (a:Address) ON (a.id)",
-                "CREATE INDEX phone_id IF NOT EXISTS FOR (p:Phone) ON (p.id)",
-                "CREATE INDEX phone_number IF NOT EXISTS FOR (p:Phone) ON (p.number)",
-                "CREATE INDEX location_id IF NOT EXISTS FOR (l:Location) ON (l.id)",
-            ]
-            for idx in indexes:
-                try:
-                    session.run(idx)
-                except Exception:
-                    pass
-            print("✓ Indexes created")
+        """
+        Create indexes for better query performance, first migrating any
+        plain id indexes left by earlier versions to their constraints.
+        Failures are printed rather than raised, so generation carries on.
+        """
+        for index, error in migrate_legacy_indexes(self.driver, self.database):
+            print(f"  ⚠ Kept legacy index {index}: {error}")
+        
+        failed = 0
+        for idx in INDEX_STATEMENTS:
+            try:
+                self.driver.execute_query(idx, database_=self.database)
+            except Exception as e:
+                failed += 1
+                print(f"  ⚠ {idx}: {e}")
+        print(f"✓ Indexes created ({failed} failed)" if failed else "✓ Indexes created")
+
+    def reserve_ids(self, prefix, counter, count):
+        """Format the next `count` ids from the named counter and advance it."""
+        start = getattr(self, counter)
+        setattr(self, counter, start + count)
+        return [f"{prefix}{n:05d}" for n in range(start, start + count)]
 
     def generate_name(self):
         """Generate random person name."""
-        first_names = [
-            "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
-            "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
-            "Thomas", "Sarah", "Charles", "Karen", "Christopher", "Nancy", "Daniel", "Lisa",
-            "Matthew", "Betty", "Anthony", "Margaret", "Mark", "Sandra", "Donald", "Ashley",
-            "Steven", "Kimberly", "Paul", "Emily", "Andrew", "Donna", "Joshua", "Michelle",
-            "Kenneth", "Dorothy", "Kevin", "Carol", "Brian", "Amanda", "George", "Melissa",
-            "Edward", "Deborah", "Ronald", "Stephanie", "Timothy", "Rebecca", "Jason", "Sharon"
-        ]
-        last_names = [
-            "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
-            "Rodriguez", "Martinez", "Hernandez", "Lopez", "Wilson", "Anderson", "Thomas",
-            "Taylor", "Moore", "Jackson", "Martin", "Lee", "Thompson", "White", "Harris",
-            "Clark", "Lewis", "Robinson", "Walker", "Young", "Allen", "King", "Wright",
-            "Scott", "Green", "Baker", "Adams", "Nelson", "Hill", "Campbell", "Mitchell",
-            "Roberts", "Carter", "Phillips", "Evans", "Turner", "Torres", "Parker", "Collins"
-        ]
-        return f"{random.choice(first_names)} {random.choice(last_names)}"
+        return f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}"
 
     def generate_date(self, days_ago_start=365, days_ago_end=0):
         """Generate random date within range."""
-        start = datetime.now() - timedelta(days=days_ago_start)
-        end = datetime.now() - timedelta(days=days_ago_end)
-        delta = end - start
-        random_days = random.randint(0, max(1, delta.days))
-        return (start + timedelta(days=random_days)).strftime("%Y-%m-%d")
+        start = self._today - days_ago_start
+        random_days = random.randint(0, max(1, days_ago_start - days_ago_end))
+        return date.fromordinal(start + random_days).isoformat()
 
     def generate_phone(self, prefix="555"):
         """Generate unique phone number."""
-        phone = f"{prefix}-{random.randint(100, 999)}-{random.randint(1000, 9999)}"
-        while phone in self.used_phones:
-            phone = f"{prefix}-{random.randint(100, 999)}-{random.randint(1000, 9999)}"
-        self.used_phones.add(phone)
-        return phone
+        for draw in self._phone_draws:
+            # Exchange 100-999, line 1000-9999
+            exchange, line = divmod(draw, 9000)
+            phone = f"{prefix}-{exchange + 100}-{line + 1000}"
+            if phone not in self.used_phones:
+                return phone
+        raise RuntimeError(f"More than {PHONE_POOL_SIZE} phone numbers requested")
 
     def generate_ssn(self):
         """Generate random SSN."""
@@ -157,23 +622,11 @@ class ScenarioDataGenerator:
     def generate_street_address(self):
         """Generate random street address."""
         numbers = random.randint(100, 9999)
-        streets = [
-            "Main Street", "Oak Avenue", "Maple Drive", "Cedar Lane", "Pine Road",
-            "Elm Street", "Washington Boulevard", "Park Avenue", "Lake Drive", "River Road",
-            "Highland Avenue", "Forest Drive", "Valley Road", "Spring Street", "Church Street",
-            "Mill Road", "School Street", "North Street", "South Avenue", "West Drive"
-        ]
-        return f"{numbers} {random.choice(streets)}"
+        return f"{numbers} {random.choice(STREET_NAMES)}"
 
-    def generate_city_state(self):
-        """Generate random city/state."""
-        locations = [
-            ("Atlanta", "GA", "30301"), ("Birmingham", "AL", "35201"),
-            ("Charlotte", "NC", "28201"), ("Nashville", "TN", "37201"),
-            ("Jacksonville", "FL", "32099"), ("Memphis", "TN", "38101"),
-            ("Richmond", "VA", "23218"), ("Columbia", "SC", "29201")
-        ]
-        return random.choice(locations)
+    def generate_city_index(self):
+        """Pick a random city as an index into CITY_STATES."""
+        return random.randrange(len(CITY_STATES))
 
     # =========================================================================
     # POOL CREATION
@@ -183,23 +636,27 @@ class ScenarioDataGenerator:
         """Create a pool of adjusters to be assigned to claims."""
         print(f"\nCreating pool of {count} adjusters...")
         
-        with self.driver.session() as session:
-            for i in range(count):
-                adjuster_id = f"ADJ_{self.adjuster_counter:05d}"
-                adjuster_name = self.generate_name()
-                employee_id = f"EMP-{random.randint(10000, 99999)}"
-                
-                session.run("""
-                    CREATE (a:Person:Adjuster {
-                        id: $id,
-                        name: $name,
-                        employee_id: $employee_id,
-                        role: 'Adjuster'
-                    })
-                """, id=adjuster_id, name=adjuster_name, employee_id=employee_id)
-                
-                self.adjuster_pool.append(adjuster_id)
-                self.adjuster_counter += 1
+        rows = []
+        for i in range(count):
+            adjuster_id = f"ADJ_{self.adjuster_counter:05d}"
+            rows.append({
+                "id": adjuster_id,
+                "name": self.generate_name(),
+                "employee_id": f"EMP-{random.randint(10000, 99999)}",
+            })
+            
+            self.adjuster_pool.append(adjuster_id)
+            self.adjuster_counter += 1
+        
+        self.write_rows("""
+            UNWIND $rows AS row
+            CREATE (a:Person:Adjuster {
+                id: row.id,
+                name: row.name,
+                employee_id: row.employee_id,
+                role: 'Adjuster'
+            })
+        """, rows)
         
         print(f"✓ Created {count} adjusters")
 
@@ -215,49 +672,51 @@ class ScenarioDataGenerator:
             "Cornerstone Medical", "Gateway Health Services", "Precision Medical Group"
         ]
         
-        with self.driver.session() as session:
-            for i in range(count):
-                provider_id = f"PROV_BG_{self.provider_counter:05d}"
-                name = provider_names[i % len(provider_names)]
-                if i >= len(provider_names):
-                    name = f"{name} {i // len(provider_names) + 1}"
-                
-                # Create provider with address
-                city, state, zip_code = self.generate_city_state()
-                address_id = f"ADDR_{self.address_counter:05d}"
-                self.address_counter += 1
-                
-                session.run("""
-                    CREATE (p:Provider {
-                        id: $provider_id,
-                        name: $name,
-                        license: $license,
-                        opened_date: $opened_date,
-                        status: 'Active'
-                    })
-                    CREATE (a:Address {
-                        id: $address_id,
-                        street: $street,
-                        city: $city,
-                        state: $state,
-                        zip: $zip,
-                        type: 'Business'
-                    })
-                    CREATE (p)-[:LOCATED_AT]->(a)
-                """,
-                    provider_id=provider_id,
-                    name=name,
-                    license=f"MED-{random.randint(100000, 999999)}",
-                    opened_date=self.generate_date(1500, 365),
-                    address_id=address_id,
-                    street=self.generate_street_address(),
-                    city=city,
-                    state=state,
-                    zip=zip_code
-                )
-                
-                self.background_providers.append(provider_id)
-                self.provider_counter += 1
+        rows = []
+        for i in range(count):
+            provider_id = f"PROV_BG_{self.provider_counter:05d}"
+            name = provider_names[i % len(provider_names)]
+            if i >= len(provider_names):
+                name = f"{name} {i // len(provider_names) + 1}"
+            
+            # Create provider with address
+            city_idx = self.generate_city_index()
+            address_id = f"ADDR_{self.address_counter:05d}"
+            self.address_counter += 1
+            
+            rows.append({
+                "provider_id": provider_id,
+                "name": name,
+                "license": f"MED-{random.randint(100000, 999999)}",
+                "opened_date": self.generate_date(1500, 365),
+                "address_id": address_id,
+                "street": self.generate_street_address(),
+                "city_idx": city_idx,
+            })
+            
+            self.background_providers.append(provider_id)
+            self.provider_counter += 1
+        
+        self.write_rows("""
+            UNWIND $rows AS row
+            WITH row, $cities[row.city_idx] AS place
+            CREATE (p:Provider {
+                id: row.provider_id,
+                name: row.name,
+                license: row.license,
+                opened_date: row.opened_date,
+                status: 'Active'
+            })
+            CREATE (a:Address {
+                id: row.address_id,
+                street: row.street,
+                city: place[0],
+                state: place[1],
+                zip: place[2],
+                type: 'Business'
+            })
+            CREATE (p)-[:LOCATED_AT]->(a)
+        """, rows, cities=CITY_STATES)
         
         print(f"✓ Created {count} background providers")
 
@@ -265,25 +724,26 @@ class ScenarioDataGenerator:
         """Create background attorneys (legitimate volume)."""
         print(f"\nCreating {count} background attorneys...")
         
-        with self.driver.session() as session:
-            for i in range(count):
-                attorney_id = f"ATT_BG_{self.attorney_counter:05d}"
-                attorney_name = f"{self.generate_name()}, Esq."
-                
-                session.run("""
-                    CREATE (a:Attorney {
-                        id: $id,
-                        name: $name,
-                        bar_number: $bar_number
-                    })
-                """,
-                    id=attorney_id,
-                    name=attorney_name,
-                    bar_number=f"BAR-{random.randint(100000, 999999)}"
-                )
-                
-                self.background_attorneys.append(attorney_id)
-                self.attorney_counter += 1
+        rows = []
+        for i in range(count):
+            attorney_id = f"ATT_BG_{self.attorney_counter:05d}"
+            rows.append({
+                "id": attorney_id,
+                "name": f"{self.generate_name()}, Esq.",
+                "bar_number": f"BAR-{random.randint(100000, 999999)}",
+            })
+            
+            self.background_attorneys.append(attorney_id)
+            self.attorney_counter += 1
+        
+        self.write_rows("""
+            UNWIND $rows AS row
+            CREATE (a:Attorney {
+                id: row.id,
+                name: row.name,
+                bar_number: row.bar_number
+            })
+        """, rows)
         
         print(f"✓ Created {count} background attorneys")
 
@@ -297,25 +757,26 @@ class ScenarioDataGenerator:
             "Champion Collision", "Superior Auto Repair"
         ]
         
-        with self.driver.session() as session:
-            for i in range(count):
-                bodyshop_id = f"BS_BG_{self.bodyshop_counter:05d}"
-                name = shop_names[i % len(shop_names)]
-                
-                session.run("""
-                    CREATE (b:BodyShop {
-                        id: $id,
-                        name: $name,
-                        license: $license
-                    })
-                """,
-                    id=bodyshop_id,
-                    name=name,
-                    license=f"BS-{random.randint(10000, 99999)}"
-                )
-                
-                self.background_bodyshops.append(bodyshop_id)
-                self.bodyshop_counter += 1
+        rows = []
+        for i in range(count):
+            bodyshop_id = f"BS_BG_{self.bodyshop_counter:05d}"
+            rows.append({
+                "id": bodyshop_id,
+                "name": shop_names[i % len(shop_names)],
+                "license": f"BS-{random.randint(10000, 99999)}",
+            })
+            
+            self.background_bodyshops.append(bodyshop_id)
+            self.bodyshop_counter += 1
+        
+        self.write_rows("""
+            UNWIND $rows AS row
+            CREATE (b:BodyShop {
+                id: row.id,
+                name: row.name,
+                license: row.license
+            })
+        """, rows)
         
         print(f"✓ Created {count} background body shops")
 
@@ -334,34 +795,37 @@ class ScenarioDataGenerator:
             ("Route {} Junction", "Highway")
         ]
         
-        with self.driver.session() as session:
-            for i in range(count):
-                location_id = f"LOC_{self.location_counter:05d}"
-                template = random.choice(location_templates)
-                
-                if template[0].count("{}") == 2:
-                    name = template[0].format(random.randint(1, 50), random.randint(1, 20))
-                else:
-                    name = template[0].format(random.randint(1, 50))
-                
-                session.run("""
-                    CREATE (l:Location {
-                        id: $id,
-                        name: $name,
-                        type: $type,
-                        lat: $lat,
-                        lng: $lng
-                    })
-                """,
-                    id=location_id,
-                    name=name,
-                    type=template[1],
-                    lat=round(33.5 + random.uniform(-0.5, 0.5), 4),
-                    lng=round(-84.4 + random.uniform(-0.5, 0.5), 4)
-                )
-                
-                self.background_locations.append(location_id)
-                self.location_counter += 1
+        rows = []
+        for i in range(count):
+            location_id = f"LOC_{self.location_counter:05d}"
+            template = random.choice(location_templates)
+            
+            if template[0].count("{}") == 2:
+                name = template[0].format(random.randint(1, 50), random.randint(1, 20))
+            else:
+                name = template[0].format(random.randint(1, 50))
+            
+            rows.append({
+                "id": location_id,
+                "name": name,
+                "type": template[1],
+                "lat": round(33.5 + random.uniform(-0.5, 0.5), 4),
+                "lng": round(-84.4 + random.uniform(-0.5, 0.5), 4),
+            })
+            
+            self.background_locations.append(location_id)
+            self.location_counter += 1
+        
+        self.write_rows("""
+            UNWIND $rows AS row
+            CREATE (l:Location {
+                id: row.id,
+                name: row.name,
+                type: row.type,
+                lat: row.lat,
+                lng: row.lng
+            })
+        """, rows)
         
         print(f"✓ Created {count} accident locations")
 
@@ -382,169 +846,95 @@ class ScenarioDataGenerator:
         """
         print(f"\nCreating {count} legitimate claims...")
         
-        # Track provider/attorney claim counts to stay in bounds
-        provider_claims = {p: 0 for p in self.background_providers}
-        attorney_claims = {a: 0 for a in self.background_attorneys}
+        # Shuffled assignment slots keep each provider/attorney within its
+        # cap (8 claims / 6 clients); once a list runs out, any will do
+        provider_slots = self.background_providers * 8
+        attorney_slots = self.background_attorneys * 6
+        random.shuffle(provider_slots)
+        random.shuffle(attorney_slots)
+        
+        # Rows are collected first and written by a single UNWIND statement;
+        # optional links are null when a claim doesn't have them
+        claims = []
+        couples_created = 0
+        max_couples = int(count * 0.05)  # 5% are couples
+        
+        # Claim, phone and address ids are one per claim, so they are
+        # reserved up front; person ids interleave with witnesses
+        claim_ids = self.reserve_ids("CLM_BG_", "claim_counter", count)
+        phone_ids = self.reserve_ids("PH_", "phone_counter", count)
+        address_ids = self.reserve_ids("ADDR_", "address_counter", count)
         
-        with self.driver.session() as session:
-            couples_created = 0
-            max_couples = int(count * 0.05)  # 5% are couples
+        for claim_id, phone_id, address_id in zip(claim_ids, phone_ids, address_ids):
+            # Create claimant with unique phone and address
+            claimant_id = f"P_{self.person_counter:05d}"
+            claimant_name = self.generate_name()
+            self.person_counter += 1
             
-            for i in range(count):
-                claim_id = f"CLM_BG_{self.claim_counter:05d}"
-                self.claim_counter += 1
-                
-                # Create claimant with unique phone and address
-                claimant_id = f"P_{self.person_counter:05d}"
-                claimant_name = self.generate_name()
+            phone_number = self.generate_phone()
+            city_idx = self.generate_city_index()
+            
+            # Select provider (keep within 3-8 range)
+            if provider_slots:
+                provider_id = provider_slots.pop()
+            else:
+                provider_id = random.choice(self.background_providers)
+            
+            # Select adjuster
+            adjuster_id = random.choice(self.adjuster_pool)
+            
+            # Select location
+            location_id = random.choice(self.background_locations)
+            
+            # Claim details
+            claim_amount = round(random.uniform(2000, 25000), 2)
+            claim_date = self.generate_date(365, 0)
+            incident_types = ["Rear-End Collision", "Side Impact", "Parking Lot Incident", 
+                             "Multi-Vehicle Accident", "Single Vehicle Accident"]
+            incident_type = random.choice(incident_types)
+            
+            row = {
+                "claim_id": claim_id,
+                "claim_name": f"Auto Claim - {incident_type}",
+                "amount": claim_amount,
+                "claim_date": claim_date,
+                "incident_type": incident_type,
+                "claimant_id": claimant_id,
+                "claimant_name": claimant_name,
+                "ssn": self.generate_ssn(),
+                "phone_id": phone_id,
+                "phone_number": phone_number,
+                "address_id": address_id,
+                "street": self.generate_street_address(),
+                "city_idx": city_idx,
+                "provider_id": provider_id,
+                "adjuster_id": adjuster_id,
+                "location_id": location_id,
+                "attorney_id": None,
+                "bodyshop_id": None,
+                "witness_id": None,
+                "witness_name": None,
+            }
+            claims.append(row)
+            
+            # 30% chance of attorney (distributed across attorneys)
+            if random.random() < 0.30:
+                if attorney_slots:
+                    row["attorney_id"] = attorney_slots.pop()
+                else:
+                    row["attorney_id"] = random.choice(self.background_attorneys)
+            
+            # 40% chance of body shop
+            if random.random() < 0.40:
+                row["bodyshop_id"] = random.choice(self.background_bodyshops)
+            
+            # 60% chance of witness
+            if random.random() < 0.60:
+                row["witness_id"] = f"P_{self.person_counter:05d}"
+                row["witness_name"] = self.generate_name()
                 self.person_counter += 1
-                
-                phone_number = self.generate_phone()
-                phone_id = f"PH_{self.phone_counter:05d}"
-                self.phone_counter += 1
-                
-                city, state, zip_code = self.generate_city_state()
-                address_id = f"ADDR_{self.address_counter:05d}"
-                self.address_counter += 1
-                
-                # Select provider (keep within 3-8 range)
-                available_providers = [p for p in self.background_providers if provider_claims[p] < 8]
-                if not available_providers:
-                    available_providers = self.background_providers
-                provider_id = random.choice(available_providers)
-                provider_claims[provider_id] += 1
-                
-                # Select adjuster
-                adjuster_id = random.choice(self.adjuster_pool)
-                
-                # Select location
-                location_id = random.choice(self.background_locations)
-                
-                # Claim details
-                claim_amount = round(random.uniform(2000, 25000), 2)
-                claim_date = self.generate_date(365, 0)
-                incident_types = ["Rear-End Collision", "Side Impact", "Parking Lot Incident", 
-                                 "Multi-Vehicle Accident", "Single Vehicle Accident"]
-                incident_type = random.choice(incident_types)
-                
-                # Create the claim network
-                session.run("""
-                    // Create claim
-                    CREATE (c:Claim {
-                        id: $claim_id,
-                        name: $claim_name,
-                        claim_amount: $amount,
-                        claim_date: $claim_date,
-                        claim_type: 'Auto',
-                        incident_type: $incident_type,
-                        status: 'Closed',
-                        is_fraud: false
-                    })
-                    
-                    // Create claimant
-                    CREATE (p:Person:Claimant {
-                        id: $claimant_id,
-                        name: $claimant_name,
-                        ssn: $ssn,
-                        role: 'Claimant'
-                    })
-                    
-                    // Create phone
-                    CREATE (ph:Phone {
-                        id: $phone_id,
-                        number: $phone_number
-                    })
-                    
-                    // Create address
-                    CREATE (addr:Address {
-                        id: $address_id,
-                        street: $street,
-                        city: $city,
-                        state: $state,
-                        zip: $zip,
-                        type: 'Residential'
-                    })
-                    
-                    // Connect claimant to phone/address
-                    CREATE (p)-[:HAS_PHONE]->(ph)
-                    CREATE (p)-[:LIVES_AT]->(addr)
-                    
-                    // Connect claim
-                    CREATE (c)-[:FILED_BY]->(p)
-                    
-                    // Connect to provider
-                    WITH c
-                    MATCH (prov:Provider {id: $provider_id})
-                    CREATE (c)-[:TREATED_AT]->(prov)
-                    
-                    // Connect to adjuster
-                    WITH c
-                    MATCH (adj:Person:Adjuster {id: $adjuster_id})
-                    CREATE (c)-[:HANDLED_BY]->(adj)
-                    
-                    // Connect to location
-                    WITH c
-                    MATCH (loc:Location {id: $location_id})
-                    CREATE (c)-[:OCCURRED_AT]->(loc)
-                """,
-                    claim_id=claim_id,
-                    claim_name=f"Auto Claim - {incident_type}",
-                    amount=claim_amount,
-                    claim_date=claim_date,
-                    incident_type=incident_type,
-                    claimant_id=claimant_id,
-                    claimant_name=claimant_name,
-                    ssn=self.generate_ssn(),
-                    phone_id=phone_id,
-                    phone_number=phone_number,
-                    address_id=address_id,
-                    street=self.generate_street_address(),
-                    city=city,
-                    state=state,
-                    zip=zip_code,
-                    provider_id=provider_id,
-                    adjuster_id=adjuster_id,
-                    location_id=location_id
-                )
-                
-                # 30% chance of attorney (distributed across attorneys)
-                if random.random() < 0.30:
-                    available_attorneys = [a for a in self.background_attorneys if attorney_claims[a] < 6]
-                    if not available_attorneys:
-                        available_attorneys = self.background_attorneys
-                    attorney_id = random.choice(available_attorneys)
-                    attorney_claims[attorney_id] += 1
-                    
-                    session.run("""
-                        MATCH (c:Claim {id: $claim_id})
-                        MATCH (a:Attorney {id: $attorney_id})
-                        CREATE (c)-[:REPRESENTED_BY]->(a)
-                    """, claim_id=claim_id, attorney_id=attorney_id)
-                
-                # 40% chance of body shop
-                if random.random() < 0.40:
-                    bodyshop_id = random.choice(self.background_bodyshops)
-                    session.run("""
-                        MATCH (c:Claim {id: $claim_id})
-                        MATCH (b:BodyShop {id: $bodyshop_id})
-                        CREATE (c)-[:REPAIRED_AT]->(b)
-                    """, claim_id=claim_id, bodyshop_id=bodyshop_id)
-                
-                # 60% chance of witness
-                if random.random() < 0.60:
-                    witness_id = f"P_{self.person_counter:05d}"
-                    witness_name = self.generate_name()
-                    self.person_counter += 1
-                    
-                    session.run("""
-                        MATCH (c:Claim {id: $claim_id})
-                        CREATE (w:Person:Witness {
-                            id: $witness_id,
-                            name: $witness_name,
-                            role: 'Witness'
-                        })
-                        CREATE (c)-[:WITNESSED_BY]->(w)
-                    """, claim_id=claim_id, witness_id=witness_id, witness_name=witness_name)
+        
+        self.write_rows(LEGITIMATE_CLAIMS_CYPHER, claims, cities=CITY_STATES)
         
         self.stats['background_claims'] = count
         print(f"✓ Created {count} legitimate claims")
@@ -569,146 +959,26 @@ class ScenarioDataGenerator:
         print("SCENARIO 1: The Captive Medical Mill")
         print("="*60)
         
-        with self.driver.session() as session:
-            # === CREATE ATTORNEY: J. Marcus Webb ===
+        with self.session().begin_transaction() as tx:
+            # === CREATE FIXED TOPOLOGY ===
             webb_id = "ATT_S1_WEBB"
-            session.run("""
-                CREATE (a:Attorney {
-                    id: $id,
-                    name: 'J. Marcus Webb',
-                    bar_number: 'BAR-789456',
-                    scenario: 'scenario_1'
-                })
-            """, id=webb_id)
-            print("  ✓ Created Attorney: J. Marcus Webb")
-            
-            # === CREATE LINDA WEBB (Wife/Registered Agent) ===
-            linda_id = "P_S1_LINDA"
-            session.run("""
-                CREATE (p:Person:Employee {
-                    id: $id,
-                    name: 'Linda Webb',
-                    role: 'Registered Agent',
-                    job_title: 'Registered Agent',
-                    scenario: 'scenario_1'
-                })
-            """, id=linda_id)
-            
-            # Marriage relationship
-            session.run("""
-                MATCH (a:Attorney {id: 'ATT_S1_WEBB'})
-                MATCH (p:Person {id: 'P_S1_LINDA'})
-                CREATE (a)-[:MARRIED_TO]->(p)
-            """)
-            print("  ✓ Created Linda Webb (wife, registered agent)")
-            
-            # === CREATE SHARED BUSINESS ADDRESS ===
-            biz_address_id = "ADDR_S1_BIZ"
-            session.run("""
-                CREATE (a:Address {
-                    id: $id,
-                    street: '1847 Commerce Boulevard',
-                    unit: 'Suite 200',
-                    city: 'Atlanta',
-                    state: 'GA',
-                    zip: '30309',
-                    type: 'Business',
-                    scenario: 'scenario_1'
-                })
-            """, id=biz_address_id)
-            
-            # === CREATE TWO CLINICS ===
             wellness_id = "PROV_S1_WELLNESS"
             peak_id = "PROV_S1_PEAK"
-            
-            session.run("""
-                CREATE (p:Provider {
-                    id: $id,
-                    name: 'Wellness Partners Medical',
-                    license: 'MED-S1-001',
-                    opened_date: '2024-01-15',
-                    status: 'Active',
-                    scenario: 'scenario_1'
-                })
-                WITH p
-                MATCH (a:Address {id: 'ADDR_S1_BIZ'})
-                CREATE (p)-[:LOCATED_AT]->(a)
-                WITH p
-                MATCH (linda:Person {id: 'P_S1_LINDA'})
-                CREATE (p)-[:REGISTERED_AGENT]->(linda)
-            """, id=wellness_id)
-            
-            session.run("""
-                CREATE (p:Provider {
-                    id: $id,
-                    name: 'Peak Recovery Clinic',
-                    license: 'MED-S1-002',
-                    opened_date: '2024-04-01',
-                    status: 'Active',
-                    scenario: 'scenario_1'
-                })
-                WITH p
-                MATCH (a:Address {id: 'ADDR_S1_BIZ'})
-                CREATE (p)-[:LOCATED_AT]->(a)
-                WITH p
-                MATCH (linda:Person {id: 'P_S1_LINDA'})
-                CREATE (p)-[:REGISTERED_AGENT]->(linda)
-            """, id=peak_id)
-            print("  ✓ Created 2 clinics at shared address with Linda as registered agent")
-            
-            # === CREATE EMPLOYEES WITH SHARED HOME ADDRESS ===
-            home_address_id = "ADDR_S1_HOME"
-            session.run("""
-                CREATE (a:Address {
-                    id: $id,
-                    street: '445 Maple Street',
-                    unit: 'Apt 12',
-                    city: 'Atlanta',
-                    state: 'GA',
-                    zip: '30312',
-                    type: 'Residential',
-                    scenario: 'scenario_1'
-                })
-            """, id=home_address_id)
-            
-            # James Rivera - Billing Manager at Wellness
-            james_id = "P_S1_JAMES"
-            session.run("""
-                CREATE (p:Person:Employee {
-                    id: $id,
-                    name: 'James Rivera',
-                    role: 'Employee',
-                    job_title: 'Billing Manager',
-                    scenario: 'scenario_1'
-                })
-                WITH p
-                MATCH (addr:Address {id: 'ADDR_S1_HOME'})
-                CREATE (p)-[:LIVES_AT]->(addr)
-                WITH p
-                MATCH (prov:Provider {id: 'PROV_S1_WELLNESS'})
-                CREATE (prov)-[:EMPLOYS]->(p)
-            """, id=james_id)
-            
-            # Maria Santos - Patient Coordinator at Peak + Paralegal at Webb's
             maria_id = "P_S1_MARIA"
-            session.run("""
-                CREATE (p:Person:Employee:Witness {
-                    id: $id,
-                    name: 'Maria Santos',
-                    role: 'Employee',
-                    job_title: 'Patient Coordinator / Paralegal',
-                    scenario: 'scenario_1'
-                })
-                WITH p
-                MATCH (addr:Address {id: 'ADDR_S1_HOME'})
-                CREATE (p)-[:LIVES_AT]->(addr)
-                WITH p
-                MATCH (prov:Provider {id: 'PROV_S1_PEAK'})
-                CREATE (prov)-[:EMPLOYS]->(p)
-                WITH p
-                MATCH (att:Attorney {id: 'ATT_S1_WEBB'})
-                CREATE (att)-[:EMPLOYS]->(p)
-            """, id=maria_id)
+            tx.run(
+                SCENARIO_1_TOPOLOGY_CYPHER,
+                webb_id=webb_id,
+                linda_id="P_S1_LINDA",
+                biz_address_id="ADDR_S1_BIZ",
+                wellness_id=wellness_id,
+                peak_id=peak_id,
+                home_address_id="ADDR_S1_HOME",
+                james_id="P_S1_JAMES",
+                maria_id=maria_id
+            ).consume()
+            print("  ✓ Created Attorney: J. Marcus Webb")
+            print("  ✓ Created Linda Webb (wife, registered agent)")
+            print("  ✓ Created 2 clinics at shared address with Linda as registered agent")
             print("  ✓ Created employees: James (billing) + Maria (coordinator/paralegal) at shared home")
             
             # === CREATE 47 CLAIMANTS WITH CLAIMS ===
@@ -718,22 +988,22 @@ class ScenarioDataGenerator:
             claims_at_peak = 0
             maria_witness_count = 0
             
+            # Rows are collected first and written by a single UNWIND statement
+            claim_ids = self.reserve_ids("CLM_S1_", "claim_counter", 47)
+            claimant_ids = self.reserve_ids("P_S1_CLM_", "person_counter", 47)
+            # Unique phone/address for each claimant
+            phone_ids = self.reserve_ids("PH_S1_", "phone_counter", 47)
+            address_ids = self.reserve_ids("ADDR_S1_CLM_", "address_counter", 47)
+            
+            claims = []
             for i in range(47):
-                claim_id = f"CLM_S1_{self.claim_counter:05d}"
-                self.claim_counter += 1
-                
-                claimant_id = f"P_S1_CLM_{self.person_counter:05d}"
+                claim_id = claim_ids[i]
+                claimant_id = claimant_ids[i]
                 claimant_name = self.generate_name()
-                self.person_counter += 1
-                
-                # Create unique phone/address for each claimant
-                phone_id = f"PH_S1_{self.phone_counter:05d}"
+                phone_id = phone_ids[i]
                 phone_number = self.generate_phone("555")
-                self.phone_counter += 1
-                
-                address_id = f"ADDR_S1_CLM_{self.address_counter:05d}"
-                city, state, zip_code = self.generate_city_state()
-                self.address_counter += 1
+                address_id = address_ids[i]
+                city_idx = self.generate_city_index()
                 
                 # Distribute between clinics (41 go to either clinic)
                 if i < 41:
@@ -747,97 +1017,37 @@ class ScenarioDataGenerator:
                     # 6 go to background providers (slight variety)
                     provider_id = random.choice(self.background_providers)
                 
-                adjuster_id = random.choice(self.adjuster_pool)
-                location_id = random.choice(self.background_locations)
-                
-                # Higher claim amounts (mill behavior)
-                claim_amount = round(random.uniform(15000, 45000), 2)
-                claim_date = self.generate_date(180, 0)
-                
-                session.run("""
-                    // Create claim
-                    CREATE (c:Claim {
-                        id: $claim_id,
-                        name: 'Auto Claim - Soft Tissue Injury',
-                        claim_amount: $amount,
-                        claim_date: $claim_date,
-                        claim_type: 'Auto',
-                        incident_type: 'Rear-End Collision',
-                        status: 'Open',
-                        is_fraud: false,
-                        scenario: 'scenario_1'
-                    })
-                    
-                    // Create claimant
-                    CREATE (p:Person:Claimant {
-                        id: $claimant_id,
-                        name: $claimant_name,
-                        ssn: $ssn,
-                        role: 'Claimant',
-                        scenario: 'scenario_1'
-                    })
-                    
-                    // Create phone and address
-                    CREATE (ph:Phone {id: $phone_id, number: $phone_number})
-                    CREATE (addr:Address {
-                        id: $address_id,
-                        street: $street,
-                        city: $city,
-                        state: $state,
-                        zip: $zip,
-                        type: 'Residential'
-                    })
-                    
-                    CREATE (p)-[:HAS_PHONE]->(ph)
-                    CREATE (p)-[:LIVES_AT]->(addr)
-                    CREATE (c)-[:FILED_BY]->(p)
-                    
-                    // Connect to Webb
-                    WITH c
-                    MATCH (att:Attorney {id: 'ATT_S1_WEBB'})
-                    CREATE (c)-[:REPRESENTED_BY]->(att)
-                    
-                    // Connect to provider
-                    WITH c
-                    MATCH (prov:Provider {id: $provider_id})
-                    CREATE (c)-[:TREATED_AT]->(prov)
-                    
-                    // Connect to adjuster
-                    WITH c
-                    MATCH (adj:Person:Adjuster {id: $adjuster_id})
-                    CREATE (c)-[:HANDLED_BY]->(adj)
-                    
-                    // Connect to location
-                    WITH c
-                    MATCH (loc:Location {id: $location_id})
-                    CREATE (c)-[:OCCURRED_AT]->(loc)
-                """,
-                    claim_id=claim_id,
-                    amount=claim_amount,
-                    claim_date=claim_date,
-                    claimant_id=claimant_id,
-                    claimant_name=claimant_name,
-                    ssn=self.generate_ssn(),
-                    phone_id=phone_id,
-                    phone_number=phone_number,
-                    address_id=address_id,
-                    street=self.generate_street_address(),
-                    city=city,
-                    state=state,
-                    zip=zip_code,
-                    provider_id=provider_id,
-                    adjuster_id=adjuster_id,
-                    location_id=location_id
-                )
-                
                 # First 8 claims at Wellness get Maria as witness (cross-role fraud)
-                if i < 8:
-                    session.run("""
-                        MATCH (c:Claim {id: $claim_id})
-                        MATCH (m:Person {id: 'P_S1_MARIA'})
-                        CREATE (c)-[:WITNESSED_BY]->(m)
-                    """, claim_id=claim_id)
+                maria_witness = i < 8
+                if maria_witness:
                     maria_witness_count += 1
+                
+                claims.append({
+                    "claim_id": claim_id,
+                    # Higher claim amounts (mill behavior)
+                    "amount": round(random.uniform(15000, 45000), 2),
+                    "claim_date": self.generate_date(180, 0),
+                    "claimant_id": claimant_id,
+                    "claimant_name": claimant_name,
+                    "ssn": self.generate_ssn(),
+                    "phone_id": phone_id,
+                    "phone_number": phone_number,
+                    "address_id": address_id,
+                    "street": self.generate_street_address(),
+                    "city_idx": city_idx,
+                    "provider_id": provider_id,
+                    "adjuster_id": random.choice(self.adjuster_pool),
+                    "location_id": random.choice(self.background_locations),
+                    "maria_witness": maria_witness,
+                })
+            
+            tx.run(
+                SCENARIO_1_CLAIMS_CYPHER,
+                rows=claims,
+                cities=CITY_STATES,
+                attorney_id=webb_id,
+                maria_id=maria_id
+            ).consume()
             
             self.stats['scenario_1_claims'] = 47
             print(f"  ✓ Created 47 claims (41 at Webb's clinics, 8 with Maria as witness)")
@@ -865,25 +1075,22 @@ class ScenarioDataGenerator:
         print("SCENARIO 2: The Identity Web")
         print("="*60)
         
-        with self.driver.session() as session:
+        with self.session().begin_transaction() as tx:
             # === CREATE SHARED PHONES ===
             phone1_id = "PH_S2_MAIN"
             phone1_number = "555-847-2931"
             phone2_id = "PH_S2_ALT"
             phone2_number = "555-847-2932"
             
-            session.run("""
+            tx.run("""
                 CREATE (p1:Phone {id: $id1, number: $num1, scenario: 'scenario_2'})
                 CREATE (p2:Phone {id: $id2, number: $num2, scenario: 'scenario_2'})
-            """, id1=phone1_id, num1=phone1_number, id2=phone2_id, num2=phone2_number)
-            
-            self.used_phones.add(phone1_number)
-            self.used_phones.add(phone2_number)
+            """, id1=phone1_id, num1=phone1_number, id2=phone2_id, num2=phone2_number).consume()
             print(f"  ✓ Created shared phones: {phone1_number}, {phone2_number}")
             
             # === CREATE SHARED ADDRESS ===
             shared_address_id = "ADDR_S2_OAK"
-            session.run("""
+            tx.run("""
                 CREATE (a:Address {
                     id: $id,
                     street: '847 Oak Street',
@@ -894,7 +1101,7 @@ class ScenarioDataGenerator:
                     type: 'Residential',
                     scenario: 'scenario_2'
                 })
-            """, id=shared_address_id)
+            """, id=shared_address_id).consume()
             print("  ✓ Created shared address: 847 Oak Street, Apt 4B")
             
             # === CREATE 7 CLAIMANTS ===
@@ -912,126 +1119,49 @@ class ScenarioDataGenerator:
                 {"name": "Tyrell Morgan", "phone": phone2_id, "address": shared_address_id},
             ]
             
-            claimant_ids = []
+            # === CREATE 7 CLAIMS (totaling ~$215K), one per claimant ===
+            claim_amounts = [32000, 28500, 35000, 31000, 29500, 29000, 30000]  # Total: $215,000
             
+            rows = []
             for i, c in enumerate(claimants):
-                claimant_id = f"P_S2_{i:03d}"
-                claimant_ids.append(claimant_id)
+                claim_id = f"CLM_S2_{self.claim_counter:05d}"
+                self.claim_counter += 1
+                
+                row = {
+                    "claim_id": claim_id,
+                    "claim_name": "Auto Claim - Rear-End Collision",
+                    "amount": claim_amounts[i],
+                    # Spread across 45-day window starting 60 days ago
+                    "claim_date": self.generate_date(60, 15),
+                    "incident_type": "Rear-End Collision",
+                    "status": "Open",
+                    "scenario": "scenario_2",
+                    "claimant_id": f"P_S2_{i:03d}",
+                    "claimant_name": c["name"],
+                    "ssn": self.generate_ssn(),
+                    "phone_id": c["phone"],
+                    "phone_number": None,
+                    "address_id": c["address"],
+                    "street": None,
+                    "city_idx": None,
+                    "provider_id": random.choice(self.background_providers),
+                    "adjuster_id": random.choice(self.adjuster_pool),
+                    "location_id": random.choice(self.background_locations),
+                    "attorney_id": None,
+                    "witness_id": None,
+                }
                 
                 # Create separate address if not using shared
                 if c["address"] is None:
-                    addr_id = f"ADDR_S2_{self.address_counter:05d}"
-                    city, state, zip_code = self.generate_city_state()
+                    row["address_id"] = f"ADDR_S2_{self.address_counter:05d}"
+                    row["street"] = self.generate_street_address()
+                    row["city_idx"] = self.generate_city_index()
                     self.address_counter += 1
-                    
-                    session.run("""
-                        CREATE (p:Person:Claimant {
-                            id: $claimant_id,
-                            name: $name,
-                            ssn: $ssn,
-                            role: 'Claimant',
-                            scenario: 'scenario_2'
-                        })
-                        CREATE (addr:Address {
-                            id: $addr_id,
-                            street: $street,
-                            city: $city,
-                            state: $state,
-                            zip: $zip,
-                            type: 'Residential'
-                        })
-                        CREATE (p)-[:LIVES_AT]->(addr)
-                        WITH p
-                        MATCH (ph:Phone {id: $phone_id})
-                        CREATE (p)-[:HAS_PHONE]->(ph)
-                    """,
-                        claimant_id=claimant_id,
-                        name=c["name"],
-                        ssn=self.generate_ssn(),
-                        addr_id=addr_id,
-                        street=self.generate_street_address(),
-                        city=city,
-                        state=state,
-                        zip=zip_code,
-                        phone_id=c["phone"]
-                    )
-                else:
-                    session.run("""
-                        CREATE (p:Person:Claimant {
-                            id: $claimant_id,
-                            name: $name,
-                            ssn: $ssn,
-                            role: 'Claimant',
-                            scenario: 'scenario_2'
-                        })
-                        WITH p
-                        MATCH (addr:Address {id: $addr_id})
-                        CREATE (p)-[:LIVES_AT]->(addr)
-                        WITH p
-                        MATCH (ph:Phone {id: $phone_id})
-                        CREATE (p)-[:HAS_PHONE]->(ph)
-                    """,
-                        claimant_id=claimant_id,
-                        name=c["name"],
-                        ssn=self.generate_ssn(),
-                        addr_id=c["address"],
-                        phone_id=c["phone"]
-                    )
+                rows.append(row)
             
+            tx.run(SCENARIO_CLAIMS_CYPHER, rows=rows, cities=CITY_STATES).consume()
             print(f"  ✓ Created 7 claimants with shared identifiers")
             
-            # === CREATE 7 CLAIMS (totaling ~$215K) ===
-            claim_amounts = [32000, 28500, 35000, 31000, 29500, 29000, 30000]  # Total: $215,000
-            base_date = datetime.now() - timedelta(days=60)
-            
-            for i in range(7):
-                claim_id = f"CLM_S2_{self.claim_counter:05d}"
-                self.claim_counter += 1
-                
-                # Spread across 45-day window
-                claim_date = (base_date + timedelta(days=random.randint(0, 45))).strftime("%Y-%m-%d")
-                
-                # Each claimant gets one claim
-                claimant_id = claimant_ids[i]
-                
-                provider_id = random.choice(self.background_providers)
-                adjuster_id = random.choice(self.adjuster_pool)
-                location_id = random.choice(self.background_locations)
-                
-                session.run("""
-                    CREATE (c:Claim {
-                        id: $claim_id,
-                        name: 'Auto Claim - Rear-End Collision',
-                        claim_amount: $amount,
-                        claim_date: $claim_date,
-                        claim_type: 'Auto',
-                        incident_type: 'Rear-End Collision',
-                        status: 'Open',
-                        is_fraud: false,
-                        scenario: 'scenario_2'
-                    })
-                    WITH c
-                    MATCH (p:Person {id: $claimant_id})
-                    CREATE (c)-[:FILED_BY]->(p)
-                    WITH c
-                    MATCH (prov:Provider {id: $provider_id})
-                    CREATE (c)-[:TREATED_AT]->(prov)
-                    WITH c
-                    MATCH (adj:Person:Adjuster {id: $adjuster_id})
-                    CREATE (c)-[:HANDLED_BY]->(adj)
-                    WITH c
-                    MATCH (loc:Location {id: $location_id})
-                    CREATE (c)-[:OCCURRED_AT]->(loc)
-                """,
-                    claim_id=claim_id,
-                    amount=claim_amounts[i],
-                    claim_date=claim_date,
-                    claimant_id=claimant_id,
-                    provider_id=provider_id,
-                    adjuster_id=adjuster_id,
-                    location_id=location_id
-                )
-            
             self.stats['scenario_2_claims'] = 7
             print(f"  ✓ Created 7 claims totaling ${sum(claim_amounts):,}")
 
@@ -1054,24 +1184,24 @@ class ScenarioDataGenerator:
         print("SCENARIO 3A: The Audit - Sunrise Wellness (FRAUD)")
         print("="*60)
         
-        with self.driver.session() as session:
+        with self.session().begin_transaction() as tx:
             # === CREATE ATTORNEY: Roberto Vega ===
             vega_id = "ATT_S3_VEGA"
-            session.run("""
+            tx.run("""
                 CREATE (a:Attorney {
                     id: $id,
                     name: 'Roberto Vega',
                     bar_number: 'BAR-456123',
                     scenario: 'scenario_3'
                 })
-            """, id=vega_id)
+            """, id=vega_id).consume()
             print("  ✓ Created Attorney: Roberto Vega")
             
             # === CREATE TWO CLINICS ===
             sunrise_id = "PROV_S3_SUNRISE"
             peak_s3_id = "PROV_S3_PEAK"
             
-            session.run("""
+            tx.run("""
                 CREATE (p:Provider {
                     id: $id,
                     name: 'Sunrise Wellness Clinic',
@@ -1081,9 +1211,9 @@ class ScenarioDataGenerator:
                     avg_billing_pct_above_peer: 38,
                     scenario: 'scenario_3'
                 })
-            """, id=sunrise_id)
+            """, id=sunrise_id).consume()
             
-            session.run("""
+            tx.run("""
                 CREATE (p:Provider {
                     id: $id,
                     name: 'Peak Recovery Center',
@@ -1092,275 +1222,105 @@ class ScenarioDataGenerator:
                     status: 'Active',
                     scenario: 'scenario_3'
                 })
-            """, id=peak_s3_id)
+            """, id=peak_s3_id).consume()
             print("  ✓ Created 2 clinics: Sunrise Wellness + Peak Recovery")
             
             # === CREATE SHARED PHONE ===
             shared_phone_id = "PH_S3_SHARED"
             shared_phone_number = "555-991-8847"
-            session.run("""
+            tx.run("""
                 CREATE (p:Phone {id: $id, number: $num, scenario: 'scenario_3'})
-            """, id=shared_phone_id, num=shared_phone_number)
-            self.used_phones.add(shared_phone_number)
+            """, id=shared_phone_id, num=shared_phone_number).consume()
             print(f"  ✓ Created shared phone: {shared_phone_number}")
             
             # === CREATE CARMEN REYES (Cross-clinic witness) ===
             carmen_id = "P_S3_CARMEN"
-            session.run("""
+            tx.run("""
                 CREATE (p:Person:Witness {
                     id: $id,
                     name: 'Carmen Reyes',
                     role: 'Witness',
                     scenario: 'scenario_3'
                 })
-            """, id=carmen_id)
+            """, id=carmen_id).consume()
             print("  ✓ Created Carmen Reyes (professional witness)")
             
             # === CREATE 28 CLAIMS AT SUNRISE ===
             print("  Creating 28 claims at Sunrise Wellness...")
             
-            vega_client_count = 0
-            shared_phone_users = 0
-            carmen_witness_sunrise = 0
-            
-            for i in range(28):
-                claim_id = f"CLM_S3_SUN_{self.claim_counter:05d}"
-                self.claim_counter += 1
-                
-                claimant_id = f"P_S3_SUN_{self.person_counter:05d}"
-                claimant_name = self.generate_name()
-                self.person_counter += 1
-                
-                # First 7 claimants share the phone
-                if shared_phone_users < 4:  # 4 at Sunrise
-                    phone_id = shared_phone_id
-                    shared_phone_users += 1
-                else:
-                    phone_id = f"PH_S3_{self.phone_counter:05d}"
-                    session.run("""
-                        CREATE (p:Phone {id: $id, number: $num})
-                    """, id=phone_id, num=self.generate_phone())
-                    self.phone_counter += 1
-                
-                address_id = f"ADDR_S3_{self.address_counter:05d}"
-                city, state, zip_code = self.generate_city_state()
-                self.address_counter += 1
-                
-                adjuster_id = random.choice(self.adjuster_pool)
-                location_id = random.choice(self.background_locations)
-                
-                # Higher amounts (billing anomaly)
-                claim_amount = round(random.uniform(18000, 42000), 2)
-                claim_date = self.generate_date(180, 0)
-                
-                session.run("""
-                    CREATE (c:Claim {
-                        id: $claim_id,
-                        name: 'Auto Claim - Soft Tissue',
-                        claim_amount: $amount,
-                        claim_date: $claim_date,
-                        claim_type: 'Auto',
-                        incident_type: 'Rear-End Collision',
-                        status: 'Open',
-                        is_fraud: false,
-                        scenario: 'scenario_3'
-                    })
-                    
-                    CREATE (p:Person:Claimant {
-                        id: $claimant_id,
-                        name: $claimant_name,
-                        ssn: $ssn,
-                        role: 'Claimant',
-                        scenario: 'scenario_3'
-                    })
-                    
-                    CREATE (addr:Address {
-                        id: $address_id,
-                        street: $street,
-                        city: $city,
-                        state: $state,
-                        zip: $zip,
-                        type: 'Residential'
-                    })
-                    
-                    CREATE (p)-[:LIVES_AT]->(addr)
-                    CREATE (c)-[:FILED_BY]->(p)
-                    
-                    WITH c, p
-                    MATCH (ph:Phone {id: $phone_id})
-                    CREATE (p)-[:HAS_PHONE]->(ph)
-                    
-                    WITH c
-                    MATCH (prov:Provider {id: $provider_id})
-                    CREATE (c)-[:TREATED_AT]->(prov)
-                    
-                    WITH c
-                    MATCH (adj:Person:Adjuster {id: $adjuster_id})
-                    CREATE (c)-[:HANDLED_BY]->(adj)
-                    
-                    WITH c
-                    MATCH (loc:Location {id: $location_id})
-                    CREATE (c)-[:OCCURRED_AT]->(loc)
-                """,
-                    claim_id=claim_id,
-                    amount=claim_amount,
-                    claim_date=claim_date,
-                    claimant_id=claimant_id,
-                    claimant_name=claimant_name,
-                    ssn=self.generate_ssn(),
-                    address_id=address_id,
-                    street=self.generate_street_address(),
-                    city=city,
-                    state=state,
-                    zip=zip_code,
-                    phone_id=phone_id,
-                    provider_id=sunrise_id,
-                    adjuster_id=adjuster_id,
-                    location_id=location_id
-                )
-                
-                # 23 of 28 (82%) represented by Vega
-                if vega_client_count < 23:
-                    session.run("""
-                        MATCH (c:Claim {id: $claim_id})
-                        MATCH (a:Attorney {id: $vega_id})
-                        CREATE (c)-[:REPRESENTED_BY]->(a)
-                    """, claim_id=claim_id, vega_id=vega_id)
-                    vega_client_count += 1
-                
-                # First 4 get Carmen as witness
-                if carmen_witness_sunrise < 4:
-                    session.run("""
-                        MATCH (c:Claim {id: $claim_id})
-                        MATCH (w:Person {id: $carmen_id})
-                        CREATE (c)-[:WITNESSED_BY]->(w)
-                    """, claim_id=claim_id, carmen_id=carmen_id)
-                    carmen_witness_sunrise += 1
+            links = dict(shared_phone_id=shared_phone_id, vega_id=vega_id, carmen_id=carmen_id)
             
+            # 4 share the phone, 23 of 28 (82%) with Vega, 4 with Carmen as witness
+            # (higher amounts: billing anomaly)
+            rows = self._scenario_3a_claim_rows(
+                "SUN", sunrise_id, 28, (18000, 42000),
+                shared_phones=4, vega_clients=23, carmen_witnessed=4, **links
+            )
             print(f"  ✓ Created 28 claims at Sunrise (23 with Vega, 4 with Carmen witness)")
             
             # === CREATE 15 CLAIMS AT PEAK (some overlap) ===
             print("  Creating 15 claims at Peak Recovery...")
             
-            carmen_witness_peak = 0
-            shared_phone_peak = 0
+            # 3 more share the phone (7 across both clinics), 12 of 15 also
+            # with Vega, 2 with Carmen as witness
+            rows += self._scenario_3a_claim_rows(
+                "PEAK", peak_s3_id, 15, (16000, 38000),
+                shared_phones=3, vega_clients=12, carmen_witnessed=2, **links
+            )
             
-            for i in range(15):
-                claim_id = f"CLM_S3_PEAK_{self.claim_counter:05d}"
-                self.claim_counter += 1
-                
-                claimant_id = f"P_S3_PEAK_{self.person_counter:05d}"
-                claimant_name = self.generate_name()
-                self.person_counter += 1
-                
-                # 3 more claimants share the phone (total 7 across both clinics)
-                if shared_phone_peak < 3:
-                    phone_id = shared_phone_id
-                    shared_phone_peak += 1
-                else:
-                    phone_id = f"PH_S3_{self.phone_counter:05d}"
-                    session.run("""
-                        CREATE (p:Phone {id: $id, number: $num})
-                    """, id=phone_id, num=self.generate_phone())
-                    self.phone_counter += 1
-                
-                address_id = f"ADDR_S3_{self.address_counter:05d}"
-                city, state, zip_code = self.generate_city_state()
-                self.address_counter += 1
-                
-                adjuster_id = random.choice(self.adjuster_pool)
-                location_id = random.choice(self.background_locations)
-                
-                claim_amount = round(random.uniform(16000, 38000), 2)
-                claim_date = self.generate_date(180, 0)
-                
-                session.run("""
-                    CREATE (c:Claim {
-                        id: $claim_id,
-                        name: 'Auto Claim - Soft Tissue',
-                        claim_amount: $amount,
-                        claim_date: $claim_date,
-                        claim_type: 'Auto',
-                        incident_type: 'Rear-End Collision',
-                        status: 'Open',
-                        is_fraud: false,
-                        scenario: 'scenario_3'
-                    })
-                    
-                    CREATE (p:Person:Claimant {
-                        id: $claimant_id,
-                        name: $claimant_name,
-                        ssn: $ssn,
-                        role: 'Claimant',
-                        scenario: 'scenario_3'
-                    })
-                    
-                    CREATE (addr:Address {
-                        id: $address_id,
-                        street: $street,
-                        city: $city,
-                        state: $state,
-                        zip: $zip,
-                        type: 'Residential'
-                    })
-                    
-                    CREATE (p)-[:LIVES_AT]->(addr)
-                    CREATE (c)-[:FILED_BY]->(p)
-                    
-                    WITH c, p
-                    MATCH (ph:Phone {id: $phone_id})
-                    CREATE (p)-[:HAS_PHONE]->(ph)
-                    
-                    WITH c
-                    MATCH (prov:Provider {id: $provider_id})
-                    CREATE (c)-[:TREATED_AT]->(prov)
-                    
-                    WITH c
-                    MATCH (adj:Person:Adjuster {id: $adjuster_id})
-                    CREATE (c)-[:HANDLED_BY]->(adj)
-                    
-                    WITH c
-                    MATCH (loc:Location {id: $location_id})
-                    CREATE (c)-[:OCCURRED_AT]->(loc)
-                """,
-                    claim_id=claim_id,
-                    amount=claim_amount,
-                    claim_date=claim_date,
-                    claimant_id=claimant_id,
-                    claimant_name=claimant_name,
-                    ssn=self.generate_ssn(),
-                    address_id=address_id,
-                    street=self.generate_street_address(),
-                    city=city,
-                    state=state,
-                    zip=zip_code,
-                    phone_id=phone_id,
-                    provider_id=peak_s3_id,
-                    adjuster_id=adjuster_id,
-                    location_id=location_id
-                )
-                
-                # 12 of 15 also with Vega
-                if i < 12:
-                    session.run("""
-                        MATCH (c:Claim {id: $claim_id})
-                        MATCH (a:Attorney {id: $vega_id})
-                        CREATE (c)-[:REPRESENTED_BY]->(a)
-                    """, claim_id=claim_id, vega_id=vega_id)
-                
-                # 2 get Carmen as witness
-                if carmen_witness_peak < 2:
-                    session.run("""
-                        MATCH (c:Claim {id: $claim_id})
-                        MATCH (w:Person {id: $carmen_id})
-                        CREATE (c)-[:WITNESSED_BY]->(w)
-                    """, claim_id=claim_id, carmen_id=carmen_id)
-                    carmen_witness_peak += 1
+            # Both clinics are written by one UNWIND
+            tx.run(SCENARIO_CLAIMS_CYPHER, rows=rows, cities=CITY_STATES).consume()
             
             self.stats['scenario_3a_claims'] = 28 + 15
             print(f"  ✓ Created 15 claims at Peak (12 with Vega, 2 with Carmen witness)")
             print(f"  ✓ Total shared phone users across both clinics: 7")
-            print(f"  ✓ Carmen Reyes witness appearances: {carmen_witness_sunrise + carmen_witness_peak}")
+            print(f"  ✓ Carmen Reyes witness appearances: 6")
+
+    def _scenario_3a_claim_rows(self, clinic, provider_id, count, amount_range,
+                                shared_phones, vega_clients, carmen_witnessed,
+                                shared_phone_id, vega_id, carmen_id):
+        """
+        Build SCENARIO_CLAIMS_CYPHER rows for one Scenario 3a clinic.
+        
+        The first `shared_phones` claimants use the ring's shared phone, the
+        first `vega_clients` claims are represented by Vega and the first
+        `carmen_witnessed` have Carmen as witness.
+        """
+        claim_ids = self.reserve_ids(f"CLM_S3_{clinic}_", "claim_counter", count)
+        claimant_ids = self.reserve_ids(f"P_S3_{clinic}_", "person_counter", count)
+        address_ids = self.reserve_ids("ADDR_S3_", "address_counter", count)
+        
+        rows = []
+        for i in range(count):
+            row = {
+                "claim_id": claim_ids[i],
+                "claim_name": "Auto Claim - Soft Tissue",
+                "amount": round(random.uniform(*amount_range), 2),
+                "claim_date": self.generate_date(180, 0),
+                "incident_type": "Rear-End Collision",
+                "status": "Open",
+                "scenario": "scenario_3",
+                "claimant_id": claimant_ids[i],
+                "claimant_name": self.generate_name(),
+                "ssn": self.generate_ssn(),
+                "phone_id": shared_phone_id,
+                "phone_number": None,
+                "address_id": address_ids[i],
+                "street": self.generate_street_address(),
+                "city_idx": self.generate_city_index(),
+                "provider_id": provider_id,
+                "adjuster_id": random.choice(self.adjuster_pool),
+                "location_id": random.choice(self.background_locations),
+                "attorney_id": vega_id if i < vega_clients else None,
+                "witness_id": carmen_id if i < carmen_witnessed else None,
+            }
+            
+            if i >= shared_phones:
+                row["phone_id"] = f"PH_S3_{self.phone_counter:05d}"
+                row["phone_number"] = self.generate_phone()
+                self.phone_counter += 1
+            rows.append(row)
+        return rows
 
     # =========================================================================
     # SCENARIO 3B: THE AUDIT - CITY GENERAL (LEGITIMATE)
@@ -1381,10 +1341,10 @@ class ScenarioDataGenerator:
         print("SCENARIO 3B: The Audit - City General (LEGITIMATE)")
         print("="*60)
         
-        with self.driver.session() as session:
+        with self.session().begin_transaction() as tx:
             # === CREATE CITY GENERAL ER ===
             cg_id = "PROV_S3_CITYGEN"
-            session.run("""
+            tx.run("""
                 CREATE (p:Provider {
                     id: $id,
                     name: 'City General Emergency Room',
@@ -1395,12 +1355,12 @@ class ScenarioDataGenerator:
                     legitimate_high_volume: true,
                     scenario: 'scenario_3'
                 })
-            """, id=cg_id)
+            """, id=cg_id).consume()
             print("  ✓ Created City General Emergency Room")
             
             # === CREATE HIGH-TRAFFIC LOCATION ===
             location_id = "LOC_S3_I85"
-            session.run("""
+            tx.run("""
                 CREATE (l:Location {
                     id: $id,
                     name: 'I-85 / Highway 20 Junction',
@@ -1410,7 +1370,7 @@ class ScenarioDataGenerator:
                     high_traffic: true,
                     scenario: 'scenario_3'
                 })
-            """, id=location_id)
+            """, id=location_id).consume()
             print("  ✓ Created high-traffic accident location")
             
             # === CREATE 32 CLAIMS (all unique) ===
@@ -1421,204 +1381,96 @@ class ScenarioDataGenerator:
             attorney_claims = {}
             
             # Create 12 attorneys for this provider
+            attorney_rows = []
             for i in range(12):
                 att_id = f"ATT_S3_CG_{i:03d}"
-                att_name = f"{self.generate_name()}, Esq."
-                session.run("""
-                    CREATE (a:Attorney {
-                        id: $id,
-                        name: $name,
-                        bar_number: $bar
-                    })
-                """, id=att_id, name=att_name, bar=f"BAR-CG{random.randint(100000, 999999)}")
+                attorney_rows.append({
+                    "id": att_id,
+                    "name": f"{self.generate_name()}, Esq.",
+                    "bar": f"BAR-CG{random.randint(100000, 999999)}",
+                })
                 cg_attorneys.append(att_id)
                 attorney_claims[att_id] = 0
             
+            tx.run("""
+                UNWIND $rows AS row
+                CREATE (a:Attorney {
+                    id: row.id,
+                    name: row.name,
+                    bar_number: row.bar
+                })
+            """, rows=attorney_rows).consume()
+            
             # 2 married couples (4 people sharing 2 addresses)
-            couple_addresses = []
-            for c in range(2):
-                addr_id = f"ADDR_S3_COUPLE_{c}"
-                city, state, zip_code = self.generate_city_state()
-                session.run("""
-                    CREATE (a:Address {
-                        id: $id,
-                        street: $street,
-                        city: $city,
-                        state: $state,
-                        zip: $zip,
-                        type: 'Residential',
-                        legitimate_shared: true,
-                        relationship: 'Married Couple'
-                    })
-                """, id=addr_id, street=self.generate_street_address(), 
-                   city=city, state=state, zip=zip_code)
-                couple_addresses.append(addr_id)
+            couple_addresses = [f"ADDR_S3_COUPLE_{c}" for c in range(2)]
+            tx.run("""
+                UNWIND $rows AS row
+                WITH row, $cities[row.city_idx] AS place
+                CREATE (a:Address {
+                    id: row.id,
+                    street: row.street,
+                    city: place[0],
+                    state: place[1],
+                    zip: place[2],
+                    type: 'Residential',
+                    legitimate_shared: true,
+                    relationship: 'Married Couple'
+                })
+            """, rows=[
+                {"id": addr_id, "street": self.generate_street_address(), "city_idx": self.generate_city_index()}
+                for addr_id in couple_addresses
+            ], cities=CITY_STATES).consume()
             
+            claim_ids = self.reserve_ids("CLM_S3_CG_", "claim_counter", 32)
+            claimant_ids = self.reserve_ids("P_S3_CG_", "person_counter", 32)
+            # Unique phone for everyone
+            phone_ids = self.reserve_ids("PH_S3_CG_", "phone_counter", 32)
+            
+            rows = []
             for i in range(32):
-                claim_id = f"CLM_S3_CG_{self.claim_counter:05d}"
-                self.claim_counter += 1
-                
-                claimant_id = f"P_S3_CG_{self.person_counter:05d}"
-                claimant_name = self.generate_name()
-                self.person_counter += 1
-                
-                # Unique phone for everyone
-                phone_id = f"PH_S3_CG_{self.phone_counter:05d}"
-                phone_number = self.generate_phone()
-                self.phone_counter += 1
+                row = {
+                    "claim_id": claim_ids[i],
+                    "claim_name": "Auto Claim - ER Visit",
+                    # Normal claim amounts
+                    "amount": round(random.uniform(3000, 18000), 2),
+                    "claim_date": self.generate_date(365, 0),
+                    "incident_type": random.choice(["Rear-End Collision", "Side Impact", "Multi-Vehicle"]),
+                    "status": "Closed",
+                    "scenario": "scenario_3",
+                    "claimant_id": claimant_ids[i],
+                    "claimant_name": self.generate_name(),
+                    "ssn": self.generate_ssn(),
+                    "phone_id": phone_ids[i],
+                    "phone_number": self.generate_phone(),
+                    "address_id": None,
+                    "street": None,
+                    "city_idx": None,
+                    "provider_id": cg_id,
+                    "adjuster_id": random.choice(self.adjuster_pool),
+                    "location_id": location_id,
+                    "attorney_id": None,
+                    "witness_id": None,
+                }
                 
                 # First 4 claimants are 2 married couples
                 if i < 4:
-                    address_id = couple_addresses[i // 2]
-                    create_address = False
+                    row["address_id"] = couple_addresses[i // 2]
                 else:
-                    address_id = f"ADDR_S3_CG_{self.address_counter:05d}"
-                    create_address = True
+                    row["address_id"] = f"ADDR_S3_CG_{self.address_counter:05d}"
+                    row["street"] = self.generate_street_address()
+                    row["city_idx"] = self.generate_city_index()
                     self.address_counter += 1
                 
-                adjuster_id = random.choice(self.adjuster_pool)
-                
-                # Normal claim amounts
-                claim_amount = round(random.uniform(3000, 18000), 2)
-                claim_date = self.generate_date(365, 0)
-                
-                if create_address:
-                    city, state, zip_code = self.generate_city_state()
-                    session.run("""
-                        CREATE (c:Claim {
-                            id: $claim_id,
-                            name: 'Auto Claim - ER Visit',
-                            claim_amount: $amount,
-                            claim_date: $claim_date,
-                            claim_type: 'Auto',
-                            incident_type: $incident_type,
-                            status: 'Closed',
-                            is_fraud: false,
-                            scenario: 'scenario_3'
-                        })
-                        
-                        CREATE (p:Person:Claimant {
-                            id: $claimant_id,
-                            name: $claimant_name,
-                            ssn: $ssn,
-                            role: 'Claimant',
-                            scenario: 'scenario_3'
-                        })
-                        
-                        CREATE (ph:Phone {id: $phone_id, number: $phone_number})
-                        
-                        CREATE (addr:Address {
-                            id: $address_id,
-                            street: $street,
-                            city: $city,
-                            state: $state,
-                            zip: $zip,
-                            type: 'Residential'
-                        })
-                        
-                        CREATE (p)-[:HAS_PHONE]->(ph)
-                        CREATE (p)-[:LIVES_AT]->(addr)
-                        CREATE (c)-[:FILED_BY]->(p)
-                        
-                        WITH c
-                        MATCH (prov:Provider {id: $provider_id})
-                        CREATE (c)-[:TREATED_AT]->(prov)
-                        
-                        WITH c
-                        MATCH (adj:Person:Adjuster {id: $adjuster_id})
-                        CREATE (c)-[:HANDLED_BY]->(adj)
-                        
-                        WITH c
-                        MATCH (loc:Location {id: $location_id})
-                        CREATE (c)-[:OCCURRED_AT]->(loc)
-                    """,
-                        claim_id=claim_id,
-                        amount=claim_amount,
-                        claim_date=claim_date,
-                        incident_type=random.choice(["Rear-End Collision", "Side Impact", "Multi-Vehicle"]),
-                        claimant_id=claimant_id,
-                        claimant_name=claimant_name,
-                        ssn=self.generate_ssn(),
-                        phone_id=phone_id,
-                        phone_number=phone_number,
-                        address_id=address_id,
-                        street=self.generate_street_address(),
-                        city=city,
-                        state=state,
-                        zip=zip_code,
-                        provider_id=cg_id,
-                        adjuster_id=adjuster_id,
-                        location_id=location_id
-                    )
-                else:
-                    # Use existing couple address
-                    session.run("""
-                        CREATE (c:Claim {
-                            id: $claim_id,
-                            name: 'Auto Claim - ER Visit',
-                            claim_amount: $amount,
-                            claim_date: $claim_date,
-                            claim_type: 'Auto',
-                            incident_type: $incident_type,
-                            status: 'Closed',
-                            is_fraud: false,
-                            scenario: 'scenario_3'
-                        })
-                        
-                        CREATE (p:Person:Claimant {
-                            id: $claimant_id,
-                            name: $claimant_name,
-                            ssn: $ssn,
-                            role: 'Claimant',
-                            scenario: 'scenario_3'
-                        })
-                        
-                        CREATE (ph:Phone {id: $phone_id, number: $phone_number})
-                        CREATE (p)-[:HAS_PHONE]->(ph)
-                        
-                        WITH c, p
-                        MATCH (addr:Address {id: $address_id})
-                        CREATE (p)-[:LIVES_AT]->(addr)
-                        CREATE (c)-[:FILED_BY]->(p)
-                        
-                        WITH c
-                        MATCH (prov:Provider {id: $provider_id})
-                        CREATE (c)-[:TREATED_AT]->(prov)
-                        
-                        WITH c
-                        MATCH (adj:Person:Adjuster {id: $adjuster_id})
-                        CREATE (c)-[:HANDLED_BY]->(adj)
-                        
-                        WITH c
-                        MATCH (loc:Location {id: $location_id})
-                        CREATE (c)-[:OCCURRED_AT]->(loc)
-                    """,
-                        claim_id=claim_id,
-                        amount=claim_amount,
-                        claim_date=claim_date,
-                        incident_type=random.choice(["Rear-End Collision", "Side Impact", "Multi-Vehicle"]),
-                        claimant_id=claimant_id,
-                        claimant_name=claimant_name,
-                        ssn=self.generate_ssn(),
-                        phone_id=phone_id,
-                        phone_number=phone_number,
-                        address_id=address_id,
-                        provider_id=cg_id,
-                        adjuster_id=adjuster_id,
-                        location_id=location_id
-                    )
-                
                 # Distribute attorneys (40% have attorney, distributed across 12)
                 if random.random() < 0.40:
                     available = [a for a in cg_attorneys if attorney_claims[a] < 4]
                     if available:
                         att_id = random.choice(available)
                         attorney_claims[att_id] += 1
-                        session.run("""
-                            MATCH (c:Claim {id: $claim_id})
-                            MATCH (a:Attorney {id: $att_id})
-                            CREATE (c)-[:REPRESENTED_BY]->(a)
-                        """, claim_id=claim_id, att_id=att_id)
+                        row["attorney_id"] = att_id
+                rows.append(row)
+            
+            tx.run(SCENARIO_CLAIMS_CYPHER, rows=rows, cities=CITY_STATES).consume()
             
             self.stats['scenario_3b_claims'] = 32
             print(f"  ✓ Created 32 legitimate claims at City General")
@@ -1648,10 +1500,10 @@ class ScenarioDataGenerator:
         print("SCENARIO 4: Network Migration")
         print("="*60)
         
-        with self.driver.session() as session:
+        with self.session().begin_transaction() as tx:
             # === CREATE DR. BERNARD'S (CONFIRMED FRAUD) ===
             bernard_id = "PROV_S4_BERNARD"
-            session.run("""
+            tx.run("""
                 CREATE (p:Provider {
                     id: $id,
                     name: "Dr. Bernard's Auto Injury Center",
@@ -1663,19 +1515,19 @@ class ScenarioDataGenerator:
                     fraud_type: 'Medical Mill - Confirmed',
                     scenario: 'scenario_4'
                 })
-            """, id=bernard_id)
+            """, id=bernard_id).consume()
             print("  ✓ Created Dr. Bernard's (CONFIRMED FRAUD - License Revoked)")
             
             # === CREATE ATTORNEY MICHAEL CHEN ===
             chen_id = "ATT_S4_CHEN"
-            session.run("""
+            tx.run("""
                 CREATE (a:Attorney {
                     id: $id,
                     name: 'Michael Chen',
                     bar_number: 'BAR-321654',
                     scenario: 'scenario_4'
                 })
-            """, id=chen_id)
+            """, id=chen_id).consume()
             print("  ✓ Created Attorney: Michael Chen")
             
             # === CREATE 15 CLAIMS AT BERNARD'S (all confirmed fraud) ===
@@ -1684,119 +1536,56 @@ class ScenarioDataGenerator:
             bernard_claimants = []
             chen_at_bernard = 0
             
+            claim_ids = self.reserve_ids("CLM_S4_BER_", "claim_counter", 15)
+            claimant_ids = self.reserve_ids("P_S4_BER_", "person_counter", 15)
+            phone_ids = self.reserve_ids("PH_S4_", "phone_counter", 15)
+            address_ids = self.reserve_ids("ADDR_S4_", "address_counter", 15)
+            
+            rows = []
             for i in range(15):
-                claim_id = f"CLM_S4_BER_{self.claim_counter:05d}"
-                self.claim_counter += 1
-                
-                claimant_id = f"P_S4_BER_{self.person_counter:05d}"
-                claimant_name = self.generate_name()
-                self.person_counter += 1
-                bernard_claimants.append(claimant_id)
-                
-                phone_id = f"PH_S4_{self.phone_counter:05d}"
-                phone_number = self.generate_phone()
-                self.phone_counter += 1
-                
-                address_id = f"ADDR_S4_{self.address_counter:05d}"
-                city, state, zip_code = self.generate_city_state()
-                self.address_counter += 1
-                
-                adjuster_id = random.choice(self.adjuster_pool)
-                location_id = random.choice(self.background_locations)
-                
-                # Claims from 8-14 months ago (before shutdown)
-                claim_date = self.generate_date(420, 180)
-                claim_amount = round(random.uniform(18000, 40000), 2)
-                
-                session.run("""
-                    CREATE (c:Claim {
-                        id: $claim_id,
-                        name: 'Auto Claim - FRAUD CONFIRMED',
-                        claim_amount: $amount,
-                        claim_date: $claim_date,
-                        claim_type: 'Auto',
-                        incident_type: 'Staged Accident',
-                        status: 'Denied',
-                        is_fraud: true,
-                        fraud_type: 'Medical Mill',
-                        scenario: 'scenario_4'
-                    })
-                    
-                    CREATE (p:Person:Claimant {
-                        id: $claimant_id,
-                        name: $claimant_name,
-                        ssn: $ssn,
-                        role: 'Claimant',
-                        is_fraud: true,
-                        scenario: 'scenario_4'
-                    })
-                    
-                    CREATE (ph:Phone {id: $phone_id, number: $phone_number})
-                    CREATE (addr:Address {
-                        id: $address_id,
-                        street: $street,
-                        city: $city,
-                        state: $state,
-                        zip: $zip,
-                        type: 'Residential'
-                    })
-                    
-                    CREATE (p)-[:HAS_PHONE]->(ph)
-                    CREATE (p)-[:LIVES_AT]->(addr)
-                    CREATE (c)-[:FILED_BY]->(p)
-                    
-                    WITH c
-                    MATCH (prov:Provider {id: $provider_id})
-                    CREATE (c)-[:TREATED_AT]->(prov)
-                    
-                    WITH c
-                    MATCH (adj:Person:Adjuster {id: $adjuster_id})
-                    CREATE (c)-[:HANDLED_BY]->(adj)
-                    
-                    WITH c
-                    MATCH (loc:Location {id: $location_id})
-                    CREATE (c)-[:OCCURRED_AT]->(loc)
-                """,
-                    claim_id=claim_id,
-                    amount=claim_amount,
-                    claim_date=claim_date,
-                    claimant_id=claimant_id,
-                    claimant_name=claimant_name,
-                    ssn=self.generate_ssn(),
-                    phone_id=phone_id,
-                    phone_number=phone_number,
-                    address_id=address_id,
-                    street=self.generate_street_address(),
-                    city=city,
-                    state=state,
-                    zip=zip_code,
-                    provider_id=bernard_id,
-                    adjuster_id=adjuster_id,
-                    location_id=location_id
-                )
+                bernard_claimants.append(claimant_ids[i])
+                row = {
+                    "claim_id": claim_ids[i],
+                    "claim_name": "Auto Claim - FRAUD CONFIRMED",
+                    "amount": round(random.uniform(18000, 40000), 2),
+                    # Claims from 8-14 months ago (before shutdown)
+                    "claim_date": self.generate_date(420, 180),
+                    "incident_type": "Staged Accident",
+                    "status": "Denied",
+                    "is_fraud": True,
+                    "fraud_type": "Medical Mill",
+                    "scenario": "scenario_4",
+                    "claimant_id": claimant_ids[i],
+                    "claimant_name": self.generate_name(),
+                    "claimant_is_fraud": True,
+                    "ssn": self.generate_ssn(),
+                    "phone_id": phone_ids[i],
+                    "phone_number": self.generate_phone(),
+                    "address_id": address_ids[i],
+                    "street": self.generate_street_address(),
+                    "city_idx": self.generate_city_index(),
+                    "provider_id": bernard_id,
+                    "adjuster_id": random.choice(self.adjuster_pool),
+                    "location_id": random.choice(self.background_locations),
+                    "attorney_id": chen_id,
+                    "witness_id": None,
+                }
                 
                 # 12 of 15 represented by Chen, remaining 3 have different attorneys
                 if chen_at_bernard < 12:
-                    session.run("""
-                        MATCH (c:Claim {id: $claim_id})
-                        MATCH (a:Attorney {id: $chen_id})
-                        CREATE (c)-[:REPRESENTED_BY]->(a)
-                    """, claim_id=claim_id, chen_id=chen_id)
                     chen_at_bernard += 1
                 else:
                     # Remaining 3 claims use background attorneys
-                    other_attorney = random.choice(self.background_attorneys)
-                    session.run("""
-                        MATCH (c:Claim {id: $claim_id})
-                        MATCH (a:Attorney {id: $att_id})
-                        CREATE (c)-[:REPRESENTED_BY]->(a)
-                    """, claim_id=claim_id, att_id=other_attorney)
+                    row["attorney_id"] = random.choice(self.background_attorneys)
+                rows.append(row)
+            
+            tx.run(SCENARIO_CLAIMS_CYPHER, rows=rows, cities=CITY_STATES).consume()
             
             print(f"  ✓ Created 15 confirmed fraud claims at Bernard's (12 with Chen, 3 with other attorneys)")
             
             # === CREATE DR. PATRICIA SIMMONS (Former Bernard's employee, now owns Rapid Recovery) ===
             simmons_id = "P_S4_SIMMONS"
-            session.run("""
+            tx.run("""
                 CREATE (p:Person:Employee {
                     id: $id,
                     name: 'Dr. Patricia Simmons',
@@ -1805,14 +1594,14 @@ class ScenarioDataGenerator:
                     scenario: 'scenario_4'
                 })
                 WITH p
-                MATCH (bernard:Provider {id: 'PROV_S4_BERNARD'})
+                MATCH (bernard:Provider {id: $bernard_id})
                 CREATE (p)-[:FORMER_EMPLOYEE_OF]->(bernard)
-            """, id=simmons_id)
+            """, id=simmons_id, bernard_id=bernard_id).consume()
             print("  ✓ Created Dr. Patricia Simmons (former Bernard's employee)")
             
             # === CREATE RAPID RECOVERY MED (New fraud outlet) ===
             rapid_id = "PROV_S4_RAPID"
-            session.run("""
+            tx.run("""
                 CREATE (p:Provider {
                     id: $id,
                     name: 'Rapid Recovery Med',
@@ -1822,10 +1611,10 @@ class ScenarioDataGenerator:
                     scenario: 'scenario_4'
                 })
                 WITH p
-                MATCH (simmons:Person {id: 'P_S4_SIMMONS'})
+                MATCH (simmons:Person {id: $simmons_id})
                 CREATE (p)-[:OWNED_BY]->(simmons)
                 CREATE (p)-[:EMPLOYS]->(simmons)
-            """, id=rapid_id)
+            """, id=rapid_id, simmons_id=simmons_id).consume()
             print("  ✓ Created Rapid Recovery Med (opened 2 months after Bernard's shutdown)")
             
             # === CREATE 34 NEW CLAIMS WITH CHEN ===
@@ -1834,106 +1623,46 @@ class ScenarioDataGenerator:
             chen_at_rapid = 0
             chen_other = 0
             
+            claim_ids = self.reserve_ids("CLM_S4_NEW_", "claim_counter", 34)
+            claimant_ids = self.reserve_ids("P_S4_NEW_", "person_counter", 34)
+            phone_ids = self.reserve_ids("PH_S4_", "phone_counter", 34)
+            address_ids = self.reserve_ids("ADDR_S4_", "address_counter", 34)
+            
+            rows = []
             for i in range(34):
-                claim_id = f"CLM_S4_NEW_{self.claim_counter:05d}"
-                self.claim_counter += 1
-                
-                claimant_id = f"P_S4_NEW_{self.person_counter:05d}"
-                claimant_name = self.generate_name()
-                self.person_counter += 1
-                
-                phone_id = f"PH_S4_{self.phone_counter:05d}"
-                phone_number = self.generate_phone()
-                self.phone_counter += 1
-                
-                address_id = f"ADDR_S4_{self.address_counter:05d}"
-                city, state, zip_code = self.generate_city_state()
-                self.address_counter += 1
-                
-                adjuster_id = random.choice(self.adjuster_pool)
-                location_id = random.choice(self.background_locations)
+                row = {
+                    "claim_id": claim_ids[i],
+                    "claim_name": "Auto Claim - Soft Tissue",
+                    "amount": round(random.uniform(15000, 38000), 2),
+                    # Recent claims (last 4 months)
+                    "claim_date": self.generate_date(120, 0),
+                    "incident_type": "Rear-End Collision",
+                    "status": "Open",
+                    "scenario": "scenario_4",
+                    "claimant_id": claimant_ids[i],
+                    "claimant_name": self.generate_name(),
+                    "ssn": self.generate_ssn(),
+                    "phone_id": phone_ids[i],
+                    "phone_number": self.generate_phone(),
+                    "address_id": address_ids[i],
+                    "street": self.generate_street_address(),
+                    "city_idx": self.generate_city_index(),
+                    "provider_id": rapid_id,
+                    "adjuster_id": random.choice(self.adjuster_pool),
+                    "location_id": random.choice(self.background_locations),
+                    "attorney_id": chen_id,
+                    "witness_id": None,
+                }
                 
                 # 28 go to Rapid Recovery, 6 to background providers
                 if chen_at_rapid < 28:
-                    provider_id = rapid_id
                     chen_at_rapid += 1
                 else:
-                    provider_id = random.choice(self.background_providers)
+                    row["provider_id"] = random.choice(self.background_providers)
                     chen_other += 1
-                
-                # Recent claims (last 4 months)
-                claim_date = self.generate_date(120, 0)
-                claim_amount = round(random.uniform(15000, 38000), 2)
-                
-                session.run("""
-                    CREATE (c:Claim {
-                        id: $claim_id,
-                        name: 'Auto Claim - Soft Tissue',
-                        claim_amount: $amount,
-                        claim_date: $claim_date,
-                        claim_type: 'Auto',
-                        incident_type: 'Rear-End Collision',
-                        status: 'Open',
-                        is_fraud: false,
-                        scenario: 'scenario_4'
-                    })
-                    
-                    CREATE (p:Person:Claimant {
-                        id: $claimant_id,
-                        name: $claimant_name,
-                        ssn: $ssn,
-                        role: 'Claimant',
-                        scenario: 'scenario_4'
-                    })
-                    
-                    CREATE (ph:Phone {id: $phone_id, number: $phone_number})
-                    CREATE (addr:Address {
-                        id: $address_id,
-                        street: $street,
-                        city: $city,
-                        state: $state,
-                        zip: $zip,
-                        type: 'Residential'
-                    })
-                    
-                    CREATE (p)-[:HAS_PHONE]->(ph)
-                    CREATE (p)-[:LIVES_AT]->(addr)
-                    CREATE (c)-[:FILED_BY]->(p)
-                    
-                    WITH c
-                    MATCH (prov:Provider {id: $provider_id})
-                    CREATE (c)-[:TREATED_AT]->(prov)
-                    
-                    WITH c
-                    MATCH (att:Attorney {id: $chen_id})
-                    CREATE (c)-[:REPRESENTED_BY]->(att)
-                    
-                    WITH c
-                    MATCH (adj:Person:Adjuster {id: $adjuster_id})
-                    CREATE (c)-[:HANDLED_BY]->(adj)
-                    
-                    WITH c
-                    MATCH (loc:Location {id: $location_id})
-                    CREATE (c)-[:OCCURRED_AT]->(loc)
-                """,
-                    claim_id=claim_id,
-                    amount=claim_amount,
-                    claim_date=claim_date,
-                    claimant_id=claimant_id,
-                    claimant_name=claimant_name,
-                    ssn=self.generate_ssn(),
-                    phone_id=phone_id,
-                    phone_number=phone_number,
-                    address_id=address_id,
-                    street=self.generate_street_address(),
-                    city=city,
-                    state=state,
-                    zip=zip_code,
-                    provider_id=provider_id,
-                    chen_id=chen_id,
-                    adjuster_id=adjuster_id,
-                    location_id=location_id
-                )
+                rows.append(row)
+            
+            tx.run(SCENARIO_CLAIMS_CYPHER, rows=rows, cities=CITY_STATES).consume()
             
             self.stats['scenario_4_claims'] = 15 + 34
             print(f"  ✓ Created 34 new claims for Chen (28 at Rapid Recovery, 6 at other providers)")
@@ -1942,42 +1671,56 @@ class ScenarioDataGenerator:
     # MASTER GENERATION
     # =========================================================================
     
-    def generate_all_demo_data(self):
+    def generate_all_demo_data(self, progress=None):
         """
         One-click generation of complete demo dataset.
         
         Order:
         1. Clear database
-        2. Create indexes
+        2. Create indexes (standalone runs; the app ensures them at startup)
         3. Create shared pools
         4. Create background data
         5. Create each scenario
         6. Print summary
+        
+        Args:
+            progress: Optional callable taking (fraction_done, step_name),
+                called before each step. It may be called from a worker
+                thread, so it should only hand the update off.
         """
         print("\n" + "="*70)
         print("  FRAUD RING DETECTION DEMO - DATA GENERATION")
         print("="*70)
         
-        # Setup
-        self.clear_database()
-        self.create_indexes()
+        # A borrowed driver comes from the app, which ensured the indexes
+        # once at startup; clearing the data leaves them in place
+        steps = [("Clearing database", self.clear_database)]
+        if self._owns_driver:
+            steps.append(("Creating indexes", self.create_indexes))
         
-        # Pools
-        self.create_adjuster_pool(count=15)
-        self.create_background_providers(count=15)
-        self.create_background_attorneys(count=12)
-        self.create_background_bodyshops(count=8)
-        self.create_background_locations(count=20)
-        
-        # Background
-        self.create_legitimate_claims(count=150)
+        steps += [
+            # Pools
+            ("Creating adjusters", lambda: self.create_adjuster_pool(count=15)),
+            ("Creating providers", lambda: self.create_background_providers(count=15)),
+            ("Creating attorneys", lambda: self.create_background_attorneys(count=12)),
+            ("Creating body shops", lambda: self.create_background_bodyshops(count=8)),
+            ("Creating locations", lambda: self.create_background_locations(count=20)),
+            
+            # Background
+            ("Creating background claims", lambda: self.create_legitimate_claims(count=150)),
+            
+            # Scenarios
+            ("Scenario 1: Captive Medical Mill", self.create_scenario_1_two_hour_attorney),
+            ("Scenario 2: Identity Web", self.create_scenario_2_identity_web),
+            ("Scenario 3: Sunrise Wellness", self.create_scenario_3a_sunrise_fraud),
+            ("Scenario 3: City General", self.create_scenario_3b_city_general_legitimate),
+            ("Scenario 4: Closed Case", self.create_scenario_4_closed_case),
+        ]
         
-        # Scenarios
-        self.create_scenario_1_two_hour_attorney()
-        self.create_scenario_2_identity_web()
-        self.create_scenario_3a_sunrise_fraud()
-        self.create_scenario_3b_city_general_legitimate()
-        self.create_scenario_4_closed_case()
+        for i, (name, step) in enumerate(steps):
+            if progress:
+                progress(i / len(steps), name)
+            step()
         
         # Summary
         self._print_summary()
@@ -2017,73 +1760,49 @@ class ScenarioDataGenerator:
         
         issues = []
         
-        with self.driver.session() as session:
-            # Scenario 1: Webb should have 47 clients
-            result = session.run("""
-                MATCH (a:Attorney {name: 'J. Marcus Webb'})<-[:REPRESENTED_BY]-(c:Claim)
-                RETURN count(c) as count
-            """).single()
-            webb_count = result['count'] if result else 0
-            if webb_count != 47:
-                issues.append(f"Scenario 1: Webb has {webb_count} clients (expected 47)")
-            else:
-                print(f"  ✓ Scenario 1: Webb has {webb_count} clients")
-            
-            # Scenario 2: Phone should connect to 5 people
-            result = session.run("""
-                MATCH (ph:Phone {number: '555-847-2931'})<-[:HAS_PHONE]-(p:Person)
-                RETURN count(p) as count
-            """).single()
-            phone_count = result['count'] if result else 0
-            if phone_count != 5:
-                issues.append(f"Scenario 2: Phone has {phone_count} users (expected 5)")
-            else:
-                print(f"  ✓ Scenario 2: Phone 555-847-2931 has {phone_count} users")
-            
-            # Scenario 3a: Sunrise should have 28 claims
-            result = session.run("""
-                MATCH (p:Provider {name: 'Sunrise Wellness Clinic'})<-[:TREATED_AT]-(c:Claim)
-                RETURN count(c) as count
-            """).single()
-            sunrise_count = result['count'] if result else 0
-            if sunrise_count != 28:
-                issues.append(f"Scenario 3a: Sunrise has {sunrise_count} claims (expected 28)")
-            else:
-                print(f"  ✓ Scenario 3a: Sunrise has {sunrise_count} claims")
-            
-            # Scenario 3b: City General should have 32 claims
-            result = session.run("""
-                MATCH (p:Provider {name: 'City General Emergency Room'})<-[:TREATED_AT]-(c:Claim)
-                RETURN count(c) as count
-            """).single()
-            cg_count = result['count'] if result else 0
-            if cg_count != 32:
-                issues.append(f"Scenario 3b: City General has {cg_count} claims (expected 32)")
-            else:
-                print(f"  ✓ Scenario 3b: City General has {cg_count} claims")
-            
-            # Scenario 4: Bernard's should be confirmed fraud
-            result = session.run("""
-                MATCH (p:Provider {name: "Dr. Bernard's Auto Injury Center"})
-                RETURN p.is_fraud as is_fraud
-            """).single()
-            is_fraud = result['is_fraud'] if result else False
-            if not is_fraud:
-                issues.append("Scenario 4: Bernard's is not marked as fraud")
-            else:
-                print(f"  ✓ Scenario 4: Bernard's is marked CONFIRMED FRAUD")
-            
-            # Scenario 4: Chen should have 34 active (non-fraud) clients
-            result = session.run("""
-                MATCH (a:Attorney {name: 'Michael Chen'})<-[:REPRESENTED_BY]-(c:Claim)
-                WHERE c.is_fraud = false
-                RETURN count(c) as count
-            """).single()
-            chen_active = result['count'] if result else 0
-            if chen_active != 34:
-                issues.append(f"Scenario 4: Chen has {chen_active} active clients (expected 34)")
-            else:
-                print(f"  ✓ Scenario 4: Chen has {chen_active} active clients")
+        with self.driver.session(database=self.database, default_access_mode=READ_ACCESS) as session:
+            record = session.execute_read(lambda tx: tx.run(INTEGRITY_CHECK_CYPHER).single())
+        
+        # Scenario 1: Webb should have 47 clients
+        webb_count = record['webb_count']
+        if webb_count != 47:
+            issues.append(f"Scenario 1: Webb has {webb_count} clients (expected 47)")
+        else:
+            print(f"  ✓ Scenario 1: Webb has {webb_count} clients")
+        
+        # Scenario 2: Phone should connect to 5 people
+        phone_count = record['phone_count']
+        if phone_count != 5:
+            issues.append(f"Scenario 2: Phone has {phone_count} users (expected 5)")
+        else:
+            print(f"  ✓ Scenario 2: Phone 555-847-2931 has {phone_count} users")
+        
+        # Scenario 3a: Sunrise should have 28 claims
+        sunrise_count = record['sunrise_count']
+        if sunrise_count != 28:
+            issues.append(f"Scenario 3a: Sunrise has {sunrise_count} claims (expected 28)")
+        else:
+            print(f"  ✓ Scenario 3a: Sunrise has {sunrise_count} claims")
+        
+        # Scenario 3b: City General should have 32 claims
+        cg_count = record['cg_count']
+        if cg_count != 32:
+            issues.append(f"Scenario 3b: City General has {cg_count} claims (expected 32)")
+        else:
+            print(f"  ✓ Scenario 3b: City General has {cg_count} claims")
+        
+        # Scenario 4: Bernard's should be confirmed fraud
+        if not record['bernard_is_fraud']:
+            issues.append("Scenario 4: Bernard's is not marked as fraud")
+        else:
+            print(f"  ✓ Scenario 4: Bernard's is marked CONFIRMED FRAUD")
+        
+        # Scenario 4: Chen should have 34 active (non-fraud) clients
+        chen_active = record['chen_active']
+        if chen_active != 34:
+            issues.append(f"Scenario 4: Chen has {chen_active} active clients (expected 34)")
+        else:
+            print(f"  ✓ Scenario 4: Chen has {chen_active} active clients")
         
         if issues:
             print(f"\n⚠️ Issues found:")
@@ -0,0 +1,539 @@
+"""
+Authored Scenario Definitions (build-time source)
+
+The walkthrough scenarios are written here as plain Python literals so the
+markdown and Cypher stay readable and diffable. The app does not import this
+module: build_scenarios.py serializes it to scenarios.jsonl, which
+scenarios.py memory-maps at runtime.
+
+After editing a scenario, regenerate the data file:
+    python build_scenarios.py
+"""
+
+# Anchor entity ids, defined once and formatted into the hop queries
+ADDR_S1_BIZ = "ADDR_S1_BIZ"
+ATT_S1_WEBB = "ATT_S1_WEBB"
+P_S1_MARIA = "P_S1_MARIA"
+ADDR_S2_OAK = "ADDR_S2_OAK"
+PH_S2_MAIN = "PH_S2_MAIN"
+ATT_S3_VEGA = "ATT_S3_VEGA"
+PH_S3_SHARED = "PH_S3_SHARED"
+PROV_S3_CITYGEN = "PROV_S3_CITYGEN"
+PROV_S3_SUNRISE = "PROV_S3_SUNRISE"
+P_S3_CARMEN = "P_S3_CARMEN"
+ATT_S4_CHEN = "ATT_S4_CHEN"
+PROV_S4_BERNARD = "PROV_S4_BERNARD"
+PROV_S4_RAPID = "PROV_S4_RAPID"
+
+
+def _build_scenario_1():
+    """Scenario 1: Captive Medical Mill."""
+    return {
+        "title": "Captive Medical Mill",
+        "subtitle": "Uncovering a Captive Medical Mill Operation",
+        "icon": "⚖️",
+        "starting_entity": ("Attorney", ATT_S1_WEBB, "J. Marcus Webb"),
+        "trigger": """
+**Initial Flag:**
+
+An adjuster notes an unusual detail: *"Claimant secured legal representation within 2 hours of the reported accident."*
+
+While not unprecedented, this rapid attorney engagement warrants a closer look at the broader pattern.
+
+**Investigation Question:** Is this attorney operating a solicitation network, or simply employing aggressive marketing?
+        """,
+        # Shared query prefixes, run once and cached; hops that name an anchor
+        # get its claim element ids as $anchor_ids and fetch only the rest
+        "anchors": {
+            "webb_claims": f"""
+                MATCH (a:Attorney {{id: '{ATT_S1_WEBB}'}})
+                OPTIONAL MATCH (a)<-[:REPRESENTED_BY]-(c:Claim)
+                RETURN a, c
+            """,
+        },
+        "hops": [
+            {
+                "depth": 0,
+                "title": "Starting Point: Attorney Profile",
+                "narrative": "Beginning investigation with **Attorney J. Marcus Webb**, flagged for unusually rapid client acquisition patterns.",
+                "traditional": "Requesting attorney claim history from IT systems typically requires 2-3 business days.",
+                "discovery": None,
+                "query": f"""
+                    MATCH (a:Attorney {{id: '{ATT_S1_WEBB}'}})
+                    RETURN a
+                """
+            },
+            {
+                "depth": 1,
+                "title": "Client Portfolio Analysis",
+                "narrative": "Expanding to examine all claimants represented by this attorney...",
+                "traditional": "Manual file review: approximately 2-3 hours per claimant. For a large portfolio, this represents **140+ hours of investigation time**.",
+                "discovery": "**47 claimants retained within 6 months** — representing 8x the typical attorney volume in this market.",
+                "anchor": "webb_claims",
+                "query": """
+                    MATCH (c:Claim) WHERE elementId(c) IN $anchor_ids
+                    MATCH (c)-[:FILED_BY]->(p:Person)
+                    RETURN c, p
+                """
+            },
+            {
+                "depth": 2,
+                "title": "Medical Provider Concentration",
+                "narrative": "Analyzing treatment facility distribution across the client base...",
+                "traditional": "Cross-referencing treatment records across 47 separate claim files would require an additional **20+ hours** of manual work.",
+                "discovery": "**41 of 47 claimants (87%)** received treatment at only **two facilities**: Wellness Partners Medical and Peak Recovery Clinic.",
+                "anchor": "webb_claims",
+                "query": """
+                    MATCH (c:Claim) WHERE elementId(c) IN $anchor_ids
+                    OPTIONAL MATCH (c)-[:FILED_BY]->(claimant:Person)
+                    OPTIONAL MATCH (c)-[:TREATED_AT]->(prov:Provider)
+                    RETURN c, claimant, prov
+                """
+            },
+            {
+                "depth": 3,
+                "title": "Business Location Analysis",
+                "narrative": "Examining the physical business addresses of these concentrated providers...",
+                "traditional": "Secretary of State corporate lookups for each facility — and would an investigator even think to check this?",
+                "discovery": "**Both clinics operate from the same address**: 1847 Commerce Boulevard, Suite 200.",
+                "anchor": "webb_claims",
+                "query": """
+                    MATCH (c:Claim) WHERE elementId(c) IN $anchor_ids
+                    OPTIONAL MATCH (c)-[:TREATED_AT]->(prov:Provider)
+                    OPTIONAL MATCH (prov)-[:LOCATED_AT]->(addr:Address)
+                    RETURN c, prov, addr
+                """
+            },
+            {
+                "depth": 4,
+                "title": "Employee Network Mapping",
+                "narrative": "Cross-referencing personnel records from **state licensing databases** and **corporate filings** with residential address data...",
+                "traditional": "Employee data exists in external public records (licensing boards, corporate filings). Cross-referencing these with residential addresses requires accessing **multiple disconnected systems** — a step rarely taken without prior suspicion.",
+                "discovery": "The billing manager at Wellness Partners **shares a residential address** with the patient coordinator at Peak Recovery — indicating a personal relationship between key staff at both clinics.",
+                "query": f"""
+                    MATCH (prov:Provider)-[:LOCATED_AT]->(bizAddr:Address {{id: '{ADDR_S1_BIZ}'}})
+                    OPTIONAL MATCH (prov)-[:EMPLOYS]->(emp:Person)
+                    OPTIONAL MATCH (emp)-[:LIVES_AT]->(homeAddr:Address)
+                    RETURN prov, bizAddr, emp, homeAddr
+                """
+            },
+            {
+                "depth": 5,
+                "title": "Cross-Role Identity Detection",
+                "narrative": "Checking whether any employees appear in other capacities within these claims...",
+                "traditional": "Systematically checking if clinic staff appear as witnesses? **Virtually impossible without graph technology.**",
+                "discovery": "**Maria Santos** (Peak Recovery employee) is listed as **witness on 8 claims** treated at Wellness Partners — a clear cross-role fraud indicator.",
+                "query": f"""
+                    MATCH (maria:Person {{id: '{P_S1_MARIA}'}})
+                    OPTIONAL MATCH (maria)<-[:WITNESSED_BY]-(c:Claim)
+                    OPTIONAL MATCH (prov:Provider)-[:EMPLOYS]->(maria)
+                    OPTIONAL MATCH (c)-[:TREATED_AT]->(treatProv:Provider)
+                    RETURN maria, c, prov, treatProv
+                """
+            },
+            {
+                "depth": 6,
+                "title": "Ownership Structure Revealed",
+                "narrative": "Cross-referencing **Secretary of State corporate filings** (registered agent records) with **public marriage records** and attorney bar registration...",
+                "traditional": "Corporate registry data is public but rarely cross-referenced with claims. Connecting a provider's registered agent to an attorney's spouse requires querying **three separate public record systems** — a path no investigator would pursue without graph-enabled discovery.",
+                "discovery": "**Linda Webb** (the attorney's spouse per marriage records) serves as **registered agent for both clinics** per corporate filings. This confirms a fully captive medical mill operation with hidden family ownership.",
+                "query": f"""
+                    MATCH (a:Attorney {{id: '{ATT_S1_WEBB}'}})
+                    OPTIONAL MATCH (a)-[:MARRIED_TO]->(spouse:Person)
+                    OPTIONAL MATCH (prov:Provider)-[:REGISTERED_AGENT]->(spouse)
+                    OPTIONAL MATCH (prov)-[:LOCATED_AT]->(addr:Address)
+                    RETURN a, spouse, prov, addr
+                """
+            }
+        ],
+        "conclusion": {
+            "exposure": "$1.2M across 47 claims",
+            "traditional_time": "2-3 weeks minimum",
+            "graph_time": "Under 5 minutes",
+            "key_finding": "Hidden spousal ownership of medical providers — a connection that exists entirely outside claims data systems.",
+            "action_items": [
+                "Refer complete network to NICB for criminal investigation",
+                "Place administrative hold on all 47 pending claims", 
+                "Issue subpoenas for clinic ownership and financial records",
+                "Expand search for similar patterns among associated attorneys"
+            ]
+        }
+    }
+
+
+def _build_scenario_2():
+    """Scenario 2: Identity Web."""
+    return {
+        "title": "Identity Web",
+        "subtitle": "Detecting an Identity Network Through Shared Contact Information",
+        "icon": "📱",
+        "starting_entity": ("Phone", PH_S2_MAIN, "555-847-2931"),
+        "trigger": """
+**Initial Flag:**
+
+ISO database returns a match: a phone number on a recent claim appears on an unrelated claim from 4 months prior. Different claimant names.
+
+The adjuster's initial assessment: *"Likely a data entry error or shared family contact."*
+
+**Investigation Question:** Is this a clerical anomaly, or evidence of something more significant?
+        """,
+        "hops": [
+            {
+                "depth": 0,
+                "title": "Starting Point: Phone Number Alert",
+                "narrative": "ISO system flagged phone number **555-847-2931** appearing on claims with different claimant names.",
+                "traditional": "ISO provides a match on 2 claims. Investigation typically ends here unless obvious fraud indicators are present.",
+                "discovery": None,
+                "query": """
+                    MATCH (ph:Phone {number: '555-847-2931'})
+                    RETURN ph
+                """
+            },
+            {
+                "depth": 1,
+                "title": "Phone Number Usage Analysis",
+                "narrative": "Examining all individuals associated with this phone number across our data...",
+                "traditional": "Finding additional phone matches would require separate database queries with no guarantee of name consistency.",
+                "discovery": "**5 distinct individuals** have used this phone number — ISO only surfaced 2 of them.",
+                "query": """
+                    MATCH (ph:Phone {number: '555-847-2931'})
+                    OPTIONAL MATCH (ph)<-[:HAS_PHONE]-(p:Person)
+                    RETURN ph, p
+                """
+            },
+            {
+                "depth": 2,
+                "title": "Residential Address Mapping",
+                "narrative": "Analyzing residential addresses for all five individuals connected to this phone...",
+                "traditional": "Running separate address queries for each person across different systems. Each query represents a different access request.",
+                "discovery": "**3 of 5 individuals** share the same residential address: 847 Oak Street, Apartment 4B. The remaining 2 (Marcus and Tanya Williams) live at separate addresses.",
+                "query": """
+                    MATCH (ph:Phone {number: '555-847-2931'})<-[:HAS_PHONE]-(p:Person)
+                    OPTIONAL MATCH (p)-[:LIVES_AT]->(addr:Address)
+                    RETURN ph, p, addr
+                """
+            },
+            {
+                "depth": 3,
+                "title": "Address-Based Network Expansion",
+                "narrative": "Expanding the search to identify **all individuals** at the shared address, including those using different contact information...",
+                "traditional": "Cross-referencing address databases with claimant records across multiple systems would require **hours of manual work** and would miss connections through alternate phone numbers.",
+                "discovery": "**2 additional individuals** (Lisa and Tyrell Morgan) reside at 847 Oak Street using a **different phone number** (555-847-2932). **Total network: 7 people across 2 phone numbers.**",
+                # Two flat branches, each anchored on an index seek (Address.id,
+                # Phone.number) and expanding outward. Don't fold them back into
+                # a collect()/UNWIND join: equivalent-looking rewrites of this
+                # kind let the planner build a cross product of both groups and
+                # have measured orders of magnitude slower on Neo4j.
+                "query": f"""
+                    MATCH (addr:Address {{id: '{ADDR_S2_OAK}'}})<-[:LIVES_AT]-(p:Person)
+                    OPTIONAL MATCH (p)-[:HAS_PHONE]->(ph:Phone)
+                    RETURN p, ph, addr
+                    UNION
+                    MATCH (:Phone {{number: '555-847-2931'}})<-[:HAS_PHONE]-(p:Person)
+                    WHERE NOT (p)-[:LIVES_AT]->(:Address {{id: '{ADDR_S2_OAK}'}})
+                    OPTIONAL MATCH (p)-[:LIVES_AT]->(addr:Address)
+                    OPTIONAL MATCH (p)-[:HAS_PHONE]->(ph:Phone)
+                    RETURN p, ph, addr
+                """
+            },
+            {
+                "depth": 4,
+                "title": "Complete Claims Analysis",
+                "narrative": "Mapping all claims filed by individuals in this identity network...",
+                "traditional": "Manually cross-referencing 7 individuals across all claims databases. **This level of comprehensive investigation would never occur** based on a single ISO phone match.",
+                "discovery": "**7 claims totaling $215,000** — all filed within a **45-day window**. Every individual in the network has filed a claim. This is coordinated fraud activity.",
+                "query": f"""
+                    MATCH (ph:Phone)<-[:HAS_PHONE]-(p:Person)-[:LIVES_AT]->(addr:Address)
+                    WHERE ph.number IN ['555-847-2931', '555-847-2932']
+                    OPTIONAL MATCH (c:Claim)-[:FILED_BY]->(p)
+                    RETURN ph, p, addr, c
+                    UNION
+                    MATCH (ph:Phone {{number: '555-847-2931'}})<-[:HAS_PHONE]-(p:Person)
+                    WHERE NOT (p)-[:LIVES_AT]->(:Address {{id: '{ADDR_S2_OAK}'}})
+                    OPTIONAL MATCH (p)-[:LIVES_AT]->(addr:Address)
+                    OPTIONAL MATCH (c:Claim)-[:FILED_BY]->(p)
+                    RETURN ph, p, addr, c
+                """
+            }
+        ],
+        "conclusion": {
+            "exposure": "$215,000 across 7 claims",
+            "traditional_time": "ISO shows 2 claims; remaining 5 would be missed entirely",
+            "graph_time": "90 seconds to full network mapping",
+            "key_finding": "Network expansion from 2 ISO hits to 7 connected individuals filing 7 claims. Graph reveals connections through **both shared phones and shared addresses** — patterns impossible to discover through linear queries.",
+            "action_items": [
+                "Deny all 7 claims pending fraud investigation",
+                "Refer to NICB for identity fraud prosecution",
+                "Flag both phone numbers (555-847-2931, 555-847-2932) for future claim monitoring",
+                "Investigate property records for 847 Oak Street, Apt 4B"
+            ]
+        }
+    }
+
+
+def _build_scenario_3():
+    """Scenario 3: Provider Distinction."""
+    return {
+        "title": "Provider Distinction",
+        "subtitle": "Distinguishing Fraud Networks from High-Volume Legitimate Providers",
+        "icon": "📊",
+        "starting_entity": ("Provider", PROV_S3_SUNRISE, "Sunrise Wellness Clinic"),
+        "trigger": """
+**Initial Flag:**
+
+Quarterly provider audit identifies two facilities with elevated billing patterns:
+
+| Provider | Claims | Billing vs. Peer Average |
+|----------|--------|--------------------------|
+| Sunrise Wellness Clinic | 28 | +38% |
+| City General ER | 32 | +42% |
+
+Both flagged. Limited SIU resources available for investigation.
+
+**Investigation Question:** Which provider warrants full investigation, and which may be a false positive?
+        """,
+        "anchors": {
+            "sunrise_claims": f"""
+                MATCH (prov:Provider {{id: '{PROV_S3_SUNRISE}'}})
+                OPTIONAL MATCH (c:Claim)-[:TREATED_AT]->(prov)
+                RETURN prov, c
+            """,
+        },
+        "hops": [
+            {
+                "depth": 0,
+                "title": "Starting Point: Provider Audit Flag",
+                "narrative": "Beginning with **Sunrise Wellness Clinic**, flagged for billing 38% above peer average.",
+                "traditional": "Billing analysis provides a single metric without network context. Prioritization is often arbitrary.",
+                "discovery": None,
+                "query": f"""
+                    MATCH (p:Provider {{id: '{PROV_S3_SUNRISE}'}})
+                    RETURN p
+                """
+            },
+            {
+                "depth": 1,
+                "title": "Patient Network Analysis",
+                "narrative": "Examining the patient population treated at Sunrise Wellness...",
+                "traditional": "Pulling 28 individual claim files for manual review: approximately **14 hours** of investigation time.",
+                "discovery": "28 claimants treated at this facility over a 6-month period.",
+                "anchor": "sunrise_claims",
+                "query": """
+                    MATCH (c:Claim) WHERE elementId(c) IN $anchor_ids
+                    OPTIONAL MATCH (c)-[:FILED_BY]->(p:Person)
+                    RETURN c, p
+                """
+            },
+            {
+                "depth": 2,
+                "title": "Legal Representation Analysis",
+                "narrative": "Analyzing attorney distribution across Sunrise patients...",
+                "traditional": "Manually tallying attorney representation from individual claim files.",
+                "discovery": "**23 of 28 patients (82%)** are represented by a single attorney: Roberto Vega. This concentration is highly anomalous.",
+                "anchor": "sunrise_claims",
+                "query": """
+                    MATCH (c:Claim) WHERE elementId(c) IN $anchor_ids
+                    OPTIONAL MATCH (c)-[:REPRESENTED_BY]->(a:Attorney)
+                    OPTIONAL MATCH (c)-[:FILED_BY]->(p:Person)
+                    RETURN c, a, p
+                """
+            },
+            {
+                "depth": 3,
+                "title": "Attorney Referral Pattern",
+                "narrative": "Examining where Attorney Vega refers his other clients for treatment...",
+                "traditional": "Querying all of Vega's cases and cross-referencing provider selections would require **another full day** of work.",
+                "discovery": "Vega refers clients to **only 2 providers**: Sunrise Wellness and Peak Recovery Center. This is an **exclusive referral pipeline**.",
+                "query": f"""
+                    MATCH (a:Attorney {{id: '{ATT_S3_VEGA}'}})<-[:REPRESENTED_BY]-(c:Claim)
+                    OPTIONAL MATCH (c)-[:TREATED_AT]->(prov:Provider)
+                    OPTIONAL MATCH (c)-[:FILED_BY]->(p:Person)
+                    RETURN a, c, prov, p
+                """
+            },
+            {
+                "depth": 4,
+                "title": "Cross-Provider Connection Detection",
+                "narrative": "Searching for **shared identifiers** and **common participants** between patients at both clinics...",
+                "traditional": "Comparing patient contact information and witness lists between providers? **No investigator would systematically perform this cross-provider analysis.**",
+                "discovery": "**7 claimants share a phone number** (555-991-8847) across both clinics. Additionally, **Carmen Reyes** appears as witness on claims at **both facilities** — a strong indicator of a professional witness.",
+                "query": f"""
+                    MATCH (ph:Phone {{id: '{PH_S3_SHARED}'}})<-[:HAS_PHONE]-(p:Person)
+                    OPTIONAL MATCH (c:Claim)-[:FILED_BY]->(p)
+                    OPTIONAL MATCH (c)-[:TREATED_AT]->(prov:Provider)
+                    WITH ph, p, c, prov
+                    OPTIONAL MATCH (c)-[:WITNESSED_BY]->(w:Person)
+                    RETURN ph, p, c, prov, w
+                    UNION
+                    MATCH (carmen:Person {{id: '{P_S3_CARMEN}'}})<-[:WITNESSED_BY]-(c:Claim)
+                    OPTIONAL MATCH (c)-[:TREATED_AT]->(prov:Provider)
+                    OPTIONAL MATCH (c)-[:FILED_BY]->(claimant:Person)
+                    RETURN carmen as w, claimant as p, c, prov, null as ph
+                """
+            },
+            {
+                "depth": 5,
+                "title": "Comparison: City General ER",
+                "narrative": "Now analyzing the second flagged provider to determine if it warrants investigation or represents a **false positive**...",
+                "traditional": "Same manual review process repeated for the second provider. Most audits would stop after investigating the first facility due to resource constraints.",
+                "discovery": "City General ER: **32 claims, 12 different attorneys, zero shared phones or addresses**. The facility's location at the **I-85/Highway 20 junction** (a major accident corridor) explains the elevated volume. **This is a legitimate high-volume provider — no investigation warranted.**",
+                "query": f"""
+                    MATCH (prov:Provider {{id: '{PROV_S3_CITYGEN}'}})<-[:TREATED_AT]-(c:Claim)
+                    OPTIONAL MATCH (c)-[:REPRESENTED_BY]->(a:Attorney)
+                    OPTIONAL MATCH (c)-[:FILED_BY]->(p:Person)
+                    OPTIONAL MATCH (p)-[:HAS_PHONE]->(ph:Phone)
+                    OPTIONAL MATCH (c)-[:OCCURRED_AT]->(loc:Location)
+                    RETURN prov, c, a, p, ph, loc
+                """
+            }
+        ],
+        "conclusion": {
+            "exposure": "$400K+ exposure at Sunrise; City General cleared",
+            "traditional_time": "Both providers flagged with no clear prioritization criteria",
+            "graph_time": "Sunrise confirmed: 2 minutes. City General cleared: 30 seconds.",
+            "key_finding": "Graph analysis not only identifies fraud networks — it **rapidly clears legitimate entities**, preventing wasted investigation resources.",
+            "action_items": [
+                "Initiate full investigation of Sunrise Wellness and Peak Recovery",
+                "Close audit flag on City General ER — no further action required",
+                "Investigate Attorney Roberto Vega's complete client portfolio",
+                "Monitor flagged phone number for future claim activity"
+            ]
+        }
+    }
+
+
+def _build_scenario_4():
+    """Scenario 4: Network Migration."""
+    return {
+        "title": "Network Migration",
+        "subtitle": "Detecting Network Migration After Successful Prosecution",
+        "icon": "🔄",
+        "starting_entity": ("Provider", PROV_S4_BERNARD, "Dr. Bernard's Auto Injury Center"),
+        "trigger": """
+**Background:**
+
+Six months ago, SIU successfully prosecuted a staged accident ring involving **Dr. Bernard's Auto Injury Center**:
+
+| Outcome | Result |
+|---------|--------|
+| Claims Denied | $62,000 |
+| Provider Status | License Revoked |
+| Case Status | **Closed** ✓ |
+
+**Investigation Question:** Did we dismantle the entire operation, or merely one component?
+        """,
+        "anchors": {
+            "bernard_claims": f"""
+                MATCH (prov:Provider {{id: '{PROV_S4_BERNARD}'}})
+                OPTIONAL MATCH (c:Claim)-[:TREATED_AT]->(prov)
+                RETURN prov, c
+            """,
+            "chen_open_claims": f"""
+                MATCH (a:Attorney {{id: '{ATT_S4_CHEN}'}})
+                OPTIONAL MATCH (a)<-[:REPRESENTED_BY]-(c:Claim)
+                WHERE c.is_fraud = false
+                RETURN a, c
+            """,
+        },
+        "hops": [
+            {
+                "depth": 0,
+                "title": "Starting Point: Confirmed Fraud Case",
+                "narrative": "Reviewing **Dr. Bernard's Auto Injury Center** — confirmed fraud, license revoked, case closed.",
+                "traditional": "Case closed. File archived. Investigation resources redirected to new matters.",
+                "discovery": None,
+                "query": f"""
+                    MATCH (p:Provider {{id: '{PROV_S4_BERNARD}'}})
+                    RETURN p
+                """
+            },
+            {
+                "depth": 1,
+                "title": "Original Case Review",
+                "narrative": "The 15 claims from the prosecuted case...",
+                "traditional": "These claims are documented in the closed case file. Known fraudulent activity.",
+                "discovery": "15 confirmed fraudulent claims. All denied. Case successfully prosecuted. ✓",
+                "anchor": "bernard_claims",
+                "query": """
+                    MATCH (c:Claim) WHERE elementId(c) IN $anchor_ids
+                    OPTIONAL MATCH (c)-[:FILED_BY]->(p:Person)
+                    RETURN c, p
+                """
+            },
+            {
+                "depth": 2,
+                "title": "Legal Representation Analysis",
+                "narrative": "Examining the complete legal representation picture for all claimants in the Bernard's case...",
+                "traditional": "Case file notation: 'Multiple claimants used same attorney.' No systematic analysis of attorney distribution or follow-up investigation conducted.",
+                "discovery": "**12 of 15 claimants (80%)** were represented by **Attorney Michael Chen**. The remaining 3 used different attorneys. Chen was **never sanctioned** despite his clients' confirmed fraud and **remains actively practicing**.",
+                "anchor": "bernard_claims",
+                "query": """
+                    MATCH (c:Claim) WHERE elementId(c) IN $anchor_ids
+                    OPTIONAL MATCH (c)-[:REPRESENTED_BY]->(a:Attorney)
+                    OPTIONAL MATCH (c)-[:FILED_BY]->(p:Person)
+                    RETURN c, a, p
+                """
+            },
+            {
+                "depth": 3,
+                "title": "Attorney's Current Activity",
+                "narrative": "Investigating Attorney Chen's activities since the case closure...",
+                "traditional": "Checking whether the attorney faced sanctions. He did not. **Case remains closed.**",
+                "discovery": "Chen has acquired **34 new clients** since Dr. Bernard's was shut down. His practice continues unimpeded.",
+                "anchor": "chen_open_claims",
+                "query": """
+                    MATCH (c:Claim) WHERE elementId(c) IN $anchor_ids
+                    OPTIONAL MATCH (c)-[:FILED_BY]->(p:Person)
+                    RETURN c, p
+                """
+            },
+            {
+                "depth": 4,
+                "title": "New Treatment Facility Pattern",
+                "narrative": "Analyzing where Chen's new clients are receiving treatment...",
+                "traditional": "Pulling 34 individual claim files to check treatment providers. **Resource-prohibitive for a 'closed' case.**",
+                "discovery": "**28 of 34 clients (82%)** are treated at **Rapid Recovery Med** — a facility that opened 2 months after Dr. Bernard's license was revoked.",
+                "anchor": "chen_open_claims",
+                "query": """
+                    MATCH (c:Claim) WHERE elementId(c) IN $anchor_ids
+                    OPTIONAL MATCH (c)-[:TREATED_AT]->(prov:Provider)
+                    OPTIONAL MATCH (c)-[:FILED_BY]->(p:Person)
+                    RETURN c, prov, p
+                """
+            },
+            {
+                "depth": 5,
+                "title": "Ownership Investigation",
+                "narrative": "Examining corporate records for Rapid Recovery Med...",
+                "traditional": "Corporate registry research on a new provider connected to a closed case? **This investigation would never be initiated.**",
+                "discovery": "Rapid Recovery is owned by **Dr. Patricia Simmons** — a **former employee of Dr. Bernard's**. The fraud network migrated, not ended.",
+                "query": f"""
+                    MATCH (rapid:Provider {{id: '{PROV_S4_RAPID}'}})
+                    OPTIONAL MATCH (rapid)-[:OWNED_BY]->(owner:Person)
+                    OPTIONAL MATCH (owner)-[:FORMER_EMPLOYEE_OF]->(bernard:Provider)
+                    RETURN rapid, owner, bernard
+                """
+            }
+        ],
+        "conclusion": {
+            "exposure": "Original case: $62K saved. Active network exposure: $280K+",
+            "traditional_time": "Case closed. Network continues operations undetected.",
+            "graph_time": "Network migration detected in under 2 minutes",
+            "key_finding": "Fraud networks adapt and migrate. Graph technology reveals **persistent connection points** (Chen) that link old and new operations.",
+            "action_items": [
+                "Open immediate investigation on Rapid Recovery Med",
+                "Issue subpoenas for Attorney Michael Chen's complete case files",
+                "Flag all 34 active claimants for expedited review",
+                "Conduct background investigation on Dr. Patricia Simmons",
+                "Update case status to 'Network Active — Ongoing Investigation'"
+            ]
+        }
+    }
+
+
+BUILDERS = {
+    1: _build_scenario_1,
+    2: _build_scenario_2,
+    3: _build_scenario_3,
+    4: _build_scenario_4,
+}
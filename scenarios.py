@@ -0,0 +1,168 @@
+"""
+Scenario Definitions for the Fraud Ring Investigation Walkthrough
+
+Scenarios (trigger, hop-by-hop narrative and Cypher, conclusion) are shipped
+as scenarios.jsonl, one JSON document per line, generated from
+scenario_definitions.py by build_scenarios.py. The file is memory-mapped at
+import and only its line offsets are indexed; each scenario is decoded the
+first time it is looked up, so unused scenarios are never materialized and
+multiple app processes share the same page-cache copy of the data.
+
+Usage:
+    from scenarios import SCENARIOS, hop_at
+    scenario = SCENARIOS[2]     # decodes and memoizes scenario 2 only
+    title = scenario["hop_titles"][0]
+    hop = hop_at(scenario, 0)   # Hop(depth, title, narrative, ...)
+"""
+
+import json
+import mmap
+import re
+import sys
+from collections import namedtuple
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+
+DATA_PATH = Path(__file__).with_name("scenarios.jsonl")
+
+_CACHE = {}
+
+# Variable-length relationship patterns with no upper bound: [*], [*2..], [:R*..]
+_UNBOUNDED_VAR_LENGTH = re.compile(r"\*\s*(?:\d*\s*\.\.\s*)?\]")
+
+
+def _map_data():
+    """
+    Memory-map the scenario file and index each line by scenario id.
+    
+    Lines have the form `<id>\t<json>`, so the index is built from the
+    prefixes alone without decoding any JSON.
+    """
+    with open(DATA_PATH, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    offsets = {}
+    start = 0
+    while start < len(data):
+        end = data.find(b"\n", start)
+        if end == -1:
+            end = len(data)
+        tab = data.find(b"\t", start, end)
+        offsets[int(data[start:tab])] = (tab + 1, end)
+        start = end + 1
+    return data, offsets
+
+
+_DATA, _OFFSETS = _map_data()
+
+
+# Hops are stored column-wise (structure of arrays): one tuple per field
+HOP_COLUMNS = {
+    "depth": "hop_depths",
+    "title": "hop_titles",
+    "narrative": "hop_narratives",
+    "traditional": "hop_traditional",
+    "discovery": "hop_discoveries",
+    "query": "hop_queries",
+    "query_hash": "hop_query_hashes",
+    "anchor": "hop_anchors",
+}
+
+Hop = namedtuple("Hop", list(HOP_COLUMNS))
+
+
+def hop_at(scenario, index):
+    """Assemble a row view of one hop from the scenario's hop columns."""
+    return Hop(*(scenario[column][index] for column in HOP_COLUMNS.values()))
+
+
+def _top_level_branches(query):
+    """
+    Split a query into its UNION branches, keeping only top-level lines.
+    
+    Lines inside CALL { } subqueries are dropped (braces are counted per
+    line), so neither a UNION nor a LIMIT inside a subquery is mistaken for
+    one of the outer query.
+    """
+    branches = [[]]
+    depth = 0
+    for line in query.splitlines():
+        keyword = line.strip()
+        if depth == 0:
+            if keyword in ("UNION", "UNION ALL"):
+                branches.append([])
+            else:
+                branches[-1].append(keyword)
+        depth += line.count("{") - line.count("}")
+    return branches
+
+
+def is_bounded(query):
+    """
+    True if every UNION branch ends in its own top-level LIMIT and the query
+    has no unbounded variable-length pattern.
+    """
+    return not _UNBOUNDED_VAR_LENGTH.search(query) and all(
+        any(keyword.startswith("LIMIT ") for keyword in branch)
+        for branch in _top_level_branches(query)
+    )
+
+
+def _finalize(scenario):
+    """
+    Intern hop queries, flip the decoded hop list into columns and freeze.
+    
+    Queries arrive already dedented and hashed by build_scenarios.py; they
+    are interned so repeated lookups share one string object, as are the
+    starting entity's label, id and name. The list of hop dicts is then
+    replaced by one tuple per field, and the scenario and its conclusion
+    are wrapped in read-only proxies so the single per-process copy can be
+    shared by every session without defensive copies.
+    """
+    hops = scenario.pop("hops")
+    for hop in hops:
+        hop["query"] = sys.intern(hop["query"])
+    scenario["starting_entity"] = tuple(map(sys.intern, scenario["starting_entity"]))
+    scenario["batch_query"] = sys.intern(scenario["batch_query"])
+    if scenario["delta_batch_query"] is not None:
+        scenario["delta_batch_query"] = sys.intern(scenario["delta_batch_query"])
+    scenario["anchors"] = MappingProxyType(
+        {name: sys.intern(query) for name, query in scenario["anchors"].items()}
+    )
+    
+    for field, column in HOP_COLUMNS.items():
+        scenario[column] = tuple(hop[field] for hop in hops)
+    scenario["hop_depths"] = bytes(scenario["hop_depths"])
+    
+    conclusion = scenario["conclusion"]
+    conclusion["action_items"] = tuple(conclusion["action_items"])
+    scenario["conclusion"] = MappingProxyType(conclusion)
+    return MappingProxyType(scenario)
+
+
+class _LazyScenarios(Mapping):
+    """Read-only scenario mapping that decodes and freezes each entry on first access."""
+    
+    def __getitem__(self, scenario_id):
+        scenario = _CACHE.get(scenario_id)
+        if scenario is None:
+            start, end = _OFFSETS[scenario_id]
+            scenario = _CACHE.setdefault(scenario_id, _finalize(json.loads(_DATA[start:end])))
+        return scenario
+    
+    def __iter__(self):
+        return iter(_OFFSETS)
+    
+    def __len__(self):
+        return len(_OFFSETS)
+
+
+_SCENARIOS = _LazyScenarios()
+
+
+def __getattr__(name):
+    """Expose SCENARIOS lazily (PEP 562)."""
+    if name == "SCENARIOS":
+        return _SCENARIOS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
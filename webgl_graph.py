@@ -0,0 +1,47 @@
+"""
+WebGL Graph Renderer for Large Investigation Networks
+
+vis.js (streamlit-agraph) draws every node and edge on a 2D canvas and runs
+its physics simulation on the main thread, which stalls past a few hundred
+entities. This module ships the graph to a self-contained WebGL page
+(webgl_graph.html) instead: node positions, colors and sizes are uploaded as
+single vertex buffers, so pan and zoom only touch a couple of uniforms.
+
+Node positions come from app.compute_layout; the page only falls back to
+its own force layout when a graph arrives without them. It has no external
+script dependencies: layout and renderer are plain JavaScript + WebGL.
+"""
+
+import json
+from pathlib import Path
+
+import streamlit.components.v1 as components
+
+# Graphs larger than this are drawn with WebGL instead of vis.js
+WEBGL_NODE_THRESHOLD = 300
+
+_TEMPLATE_PATH = Path(__file__).with_name("webgl_graph.html")
+_template = None
+
+
+def _get_template():
+    """Load the HTML template once per process."""
+    global _template
+    if _template is None:
+        _template = _TEMPLATE_PATH.read_text(encoding="utf-8")
+    return _template
+
+
+def render_webgl_graph(graph, height=500):
+    """
+    Render a packed graph in an embedded WebGL canvas.
+
+    `graph` is the structure-of-arrays dict produced by app.pack_graph: node
+    attributes as parallel lists, colors as indices into a shipped palette,
+    and edges as index pairs into the node arrays.
+    """
+    payload = json.dumps(graph, separators=(",", ":"))
+    # Keep a literal "</script>" inside a tooltip from closing the script tag
+    payload = payload.replace("</", "<\\/")
+    html = _get_template().replace("__GRAPH_DATA__", payload)
+    components.html(html, height=height)